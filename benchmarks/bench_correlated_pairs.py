@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark identify_highly_correlated_features against the original pairwise .iloc scan.
+
+Usage:
+    python -m benchmarks.bench_correlated_pairs --sizes 500 2000 10000
+"""
+
+import argparse
+import time
+from typing import List, Tuple
+import numpy as np
+import pandas as pd
+from src.analysis.correlation import identify_highly_correlated_features
+
+def make_correlation_matrix(n_features: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Build a symmetric synthetic correlation matrix with a NaN diagonal.
+    
+    Args:
+        n_features (int): Number of features (rows and columns)
+        seed (int): Random seed
+        
+    Returns:
+        pd.DataFrame: Correlation-like matrix with values in [-1, 1]
+    """
+    rng = np.random.default_rng(seed)
+    values = rng.uniform(-1, 1, size=(n_features, n_features))
+    values = np.triu(values, k=1)
+    values = values + values.T
+    np.fill_diagonal(values, np.nan)
+    columns = [f'feature_{i}' for i in range(n_features)]
+    return pd.DataFrame(values, index=columns, columns=columns)
+
+def identify_pairs_loop(correlation_matrix: pd.DataFrame, threshold: float) -> List[Tuple[str, str]]:
+    """Reference implementation: the original pure-Python double loop over .iloc."""
+    corr_pairs = []
+    for i in range(len(correlation_matrix.columns)):
+        for j in range(i + 1, len(correlation_matrix.columns)):
+            col1, col2 = correlation_matrix.columns[i], correlation_matrix.columns[j]
+            corr = abs(correlation_matrix.iloc[i, j])
+            if corr >= threshold:
+                corr_pairs.append((col1, col2))
+    return corr_pairs
+
+def _time(func, *args, **kwargs) -> Tuple[float, object]:
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark correlated pair detection.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 2000, 10000],
+                        help='Number of columns of the correlation matrices to benchmark')
+    parser.add_argument('--threshold', type=float, default=0.99,
+                        help='Correlation threshold')
+    parser.add_argument('--loop-limit', type=int, default=2000,
+                        help='Skip the loop implementation above this many columns (it takes most of an hour at 10,000)')
+    args = parser.parse_args()
+    
+    print(f"{'columns':>8} {'pairs':>10} {'loop (s)':>10} {'vectorized (s)':>15} {'indices (s)':>12} {'speedup':>9}")
+    for n_features in args.sizes:
+        correlation_matrix = make_correlation_matrix(n_features)
+        vectorized_time, pairs = _time(identify_highly_correlated_features, correlation_matrix, args.threshold)
+        indices_time, _ = _time(identify_highly_correlated_features, correlation_matrix, args.threshold, as_indices=True)
+        
+        if n_features <= args.loop_limit:
+            loop_time, loop_pairs = _time(identify_pairs_loop, correlation_matrix, args.threshold)
+            if loop_pairs != pairs:
+                raise AssertionError(f"Implementations disagree at {n_features} columns")
+            loop_column, speedup = f"{loop_time:10.3f}", f"{loop_time / vectorized_time:8.0f}x"
+        else:
+            loop_column, speedup = f"{'skipped':>10}", f"{'-':>9}"
+        
+        print(f"{n_features:>8} {len(pairs):>10} {loop_column} {vectorized_time:15.4f} {indices_time:12.4f} {speedup}")
+
+if __name__ == '__main__':
+    main()
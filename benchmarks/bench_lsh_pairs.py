@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Measure recall and speed of LSH correlated pair detection against the exact correlation matrix.
+
+Usage:
+    python -m benchmarks.bench_lsh_pairs --columns 1000 5000 --recall 0.8 0.95 0.99
+"""
+
+import argparse
+import time
+from typing import Any, Dict, Optional
+import numpy as np
+from src.analysis.blocked import blocked_correlation
+from src.analysis.lsh import DEFAULT_RECALL, default_bits_per_table, find_correlated_pairs, tables_for_recall
+
+def make_correlated_columns(n_rows: int, n_features: int, group_size: int = 4, noise: float = 0.3,
+                            seed: int = 0) -> np.ndarray:
+    """
+    Build columns that are noisy copies of shared latent factors, some of them negated.
+    
+    Columns of the same group have a correlation of about 1 / (1 + noise^2) in absolute
+    value; columns of different groups are nearly uncorrelated.
+    
+    Args:
+        n_rows (int): Number of rows
+        n_features (int): Number of columns
+        group_size (int): Number of columns sharing a factor
+        noise (float): Standard deviation of the noise added to the factor
+        seed (int): Random seed
+    
+    Returns:
+        np.ndarray: Array of shape (n_rows, n_features)
+    """
+    rng = np.random.default_rng(seed)
+    factors = rng.standard_normal((n_rows, -(-n_features // group_size)))
+    signs = rng.choice([-1.0, 1.0], size=n_features)
+    values = factors[:, np.arange(n_features) // group_size] * signs
+    return values + noise * rng.standard_normal((n_rows, n_features))
+
+def measure_recall(values: np.ndarray, threshold: float, recall: float = DEFAULT_RECALL,
+                   seed: Optional[int] = 0) -> Dict[str, Any]:
+    """
+    Compare find_correlated_pairs with the pairs of the exact correlation matrix.
+    
+    Args:
+        values (np.ndarray): Array of shape (n_rows, n_columns)
+        threshold (float): Correlation threshold
+        recall (float): Target recall passed to find_correlated_pairs
+        seed (Optional[int]): Random seed of the hyperplanes
+    
+    Returns:
+        Dict[str, Any]: Table layout, exact and found pair counts, measured recall and precision,
+                        and timings in seconds
+    """
+    start = time.perf_counter()
+    correlations = np.abs(blocked_correlation(values))
+    exact_rows, exact_cols = np.nonzero(np.triu(correlations >= threshold, k=1))
+    exact_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    rows, cols = find_correlated_pairs(values, threshold, recall, seed=seed)
+    lsh_seconds = time.perf_counter() - start
+    
+    n_columns = values.shape[1]
+    bits_per_table = default_bits_per_table(n_columns)
+    exact = set((exact_rows * n_columns + exact_cols).tolist())
+    found = set((rows * n_columns + cols).tolist())
+    return {
+        'n_tables': tables_for_recall(threshold, recall, bits_per_table),
+        'bits_per_table': bits_per_table,
+        'exact_pairs': len(exact),
+        'found_pairs': len(found),
+        'recall': len(exact & found) / len(exact) if exact else 1.0,
+        'precision': len(exact & found) / len(found) if found else 1.0,
+        'exact_seconds': exact_seconds,
+        'lsh_seconds': lsh_seconds
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark LSH correlated pair detection.')
+    parser.add_argument('--rows', type=int, default=2000,
+                        help='Number of rows of the synthetic data')
+    parser.add_argument('--columns', type=int, nargs='+', default=[1000, 5000],
+                        help='Numbers of columns to benchmark')
+    parser.add_argument('--threshold', type=float, default=0.9,
+                        help='Correlation threshold')
+    parser.add_argument('--noise', type=float, default=0.2,
+                        help='Noise of the correlated groups (correlation is about 1 / (1 + noise^2))')
+    parser.add_argument('--recall', type=float, nargs='+', default=[DEFAULT_RECALL],
+                        help='Target recalls to try')
+    args = parser.parse_args()
+    
+    print(f"{'columns':>8} {'target':>7} {'tables':>7} {'bits':>5} {'pairs':>8} {'recall':>7} {'precision':>10} "
+          f"{'exact (s)':>10} {'lsh (s)':>8}")
+    for n_features in args.columns:
+        values = make_correlated_columns(args.rows, n_features, noise=args.noise)
+        for recall in args.recall:
+            result = measure_recall(values, args.threshold, recall)
+            print(f"{n_features:>8} {recall:7.2f} {result['n_tables']:>7} {result['bits_per_table']:>5} "
+                  f"{result['exact_pairs']:>8} {result['recall']:7.3f} {result['precision']:10.3f} "
+                  f"{result['exact_seconds']:10.3f} {result['lsh_seconds']:8.3f}")
+
+if __name__ == '__main__':
+    main()
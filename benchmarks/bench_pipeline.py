@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Benchmark every stage of the preprocessing and correlation pipeline on synthetic data.
+
+Each stage is timed (best of --repeat runs) and its peak traced memory is recorded in a
+separate run under tracemalloc. The report is JSON so that runs of two versions can be
+diffed with --compare.
+
+Usage:
+    python -m benchmarks.bench_pipeline --rows 100000 --numeric 200 --categorical 20 --output new.json
+    python -m benchmarks.bench_pipeline --rows 100000 --numeric 200 --categorical 20 --compare old.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+import numpy as np
+import pandas as pd
+from src.preprocessing.missing_values import handle_missing_values
+from src.preprocessing.feature_types import detect_feature_types
+from src.preprocessing.encoding import apply_one_hot_encoding
+from src.preprocessing.normalization import normalize_features
+from src.analysis.correlation import (
+    compute_correlation_scores,
+    calculate_correlation_matrix,
+    group_correlated_features
+)
+from .datasets import make_synthetic_dataset
+
+TARGET_COLUMN = 'target'
+
+def _measure(func: Callable[[], Any], repeat: int) -> Tuple[Any, float, int]:
+    """Run func, returning (result, best wall time in seconds, peak traced bytes)."""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    
+    # Memory is traced in its own run: tracemalloc slows allocations down
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    return result, min(timings), peak
+
+def _shape(value: Any) -> List[int]:
+    """Shape of a stage output, for the report."""
+    if isinstance(value, tuple):
+        value = value[0]
+    if isinstance(value, (pd.DataFrame, np.ndarray)):
+        return list(value.shape)
+    if isinstance(value, list):
+        return [len(value)]
+    return []
+
+def run_pipeline_benchmark(df: pd.DataFrame, repeat: int = 3, max_categories: int = 10,
+                           missing_threshold: float = 0.5, correlation_threshold: float = 0.8) -> List[Dict[str, Any]]:
+    """
+    Time each pipeline stage, feeding every stage the output of the previous one.
+    
+    Args:
+        df (pd.DataFrame): Input dataset containing TARGET_COLUMN
+        repeat (int): Number of timed runs per stage (the best one is reported)
+        max_categories (int): max_categories for apply_one_hot_encoding
+        missing_threshold (float): threshold for handle_missing_values
+        correlation_threshold (float): threshold for group_correlated_features
+        
+    Returns:
+        List[Dict[str, Any]]: One record per stage with wall time, peak memory and output shape
+    """
+    stages = []
+    
+    def record(name: str, func: Callable[[], Any]) -> Any:
+        result, seconds, peak = _measure(func, repeat)
+        stages.append({
+            'stage': name,
+            'seconds': seconds,
+            'peak_memory_bytes': peak,
+            'output_shape': _shape(result)
+        })
+        return result
+    
+    df_cleaned, _ = record('handle_missing_values', lambda: handle_missing_values(df, missing_threshold))
+    record('detect_feature_types', lambda: detect_feature_types(df_cleaned))
+    df_encoded, _ = record('apply_one_hot_encoding', lambda: apply_one_hot_encoding(df_cleaned, max_categories))
+    df_normalized = record('normalize_features', lambda: normalize_features(df_encoded))
+    record('compute_correlation_scores', lambda: compute_correlation_scores(df_normalized, TARGET_COLUMN))
+    correlation_matrix = record(
+        'calculate_correlation_matrix',
+        lambda: calculate_correlation_matrix(df_normalized, exclude_columns=[TARGET_COLUMN])
+    )
+    record('group_correlated_features', lambda: group_correlated_features(correlation_matrix, correlation_threshold))
+    
+    return stages
+
+def build_report(params: Dict[str, Any], stages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Assemble the machine-readable report."""
+    return {
+        'params': params,
+        'environment': {
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__
+        },
+        'stages': stages,
+        'total_seconds': sum(stage['seconds'] for stage in stages)
+    }
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float,
+                    min_seconds: float = 0.005) -> Tuple[List[str], bool]:
+    """
+    Compare two reports stage by stage.
+    
+    Args:
+        baseline (Dict[str, Any]): Report of the reference version
+        current (Dict[str, Any]): Report of the version under test
+        tolerance (float): Allowed relative slowdown or memory growth (0.2 = 20%)
+        min_seconds (float): Stages faster than this in both reports are too noisy to flag on time
+        
+    Returns:
+        Tuple[List[str], bool]: (formatted comparison lines, True if any stage regressed)
+    """
+    baseline_stages = {stage['stage']: stage for stage in baseline['stages']}
+    lines = [f"{'stage':<32} {'time ratio':>10} {'memory ratio':>13}"]
+    regressed = False
+    for stage in current['stages']:
+        reference = baseline_stages.get(stage['stage'])
+        if reference is None:
+            lines.append(f"{stage['stage']:<32} {'new':>10} {'new':>13}")
+            continue
+        time_ratio = stage['seconds'] / max(reference['seconds'], 1e-9)
+        memory_ratio = stage['peak_memory_bytes'] / max(reference['peak_memory_bytes'], 1)
+        flag = ''
+        slower = time_ratio > 1 + tolerance and stage['seconds'] >= min_seconds
+        if slower or memory_ratio > 1 + tolerance:
+            flag = '  REGRESSION'
+            regressed = True
+        lines.append(f"{stage['stage']:<32} {time_ratio:>10.2f} {memory_ratio:>13.2f}{flag}")
+    return lines, regressed
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the preprocessing and correlation pipeline.')
+    parser.add_argument('--rows', type=int, default=100000, help='Number of rows')
+    parser.add_argument('--numeric', type=int, default=100, help='Number of numerical columns')
+    parser.add_argument('--categorical', type=int, default=10, help='Number of categorical columns')
+    parser.add_argument('--cardinality', type=int, default=20, help='Distinct values per categorical column')
+    parser.add_argument('--missing-rate', type=float, default=0.05, help='Fraction of missing feature cells')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per stage')
+    parser.add_argument('--output', help='Write the JSON report to this path')
+    parser.add_argument('--compare', help='Baseline JSON report to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Relative slowdown or memory growth reported as a regression')
+    parser.add_argument('--min-seconds', type=float, default=0.005,
+                        help='Ignore slowdowns of stages faster than this (timer noise)')
+    args = parser.parse_args()
+    
+    params = {
+        'rows': args.rows,
+        'numeric': args.numeric,
+        'categorical': args.categorical,
+        'cardinality': args.cardinality,
+        'missing_rate': args.missing_rate,
+        'seed': args.seed,
+        'repeat': args.repeat
+    }
+    df = make_synthetic_dataset(
+        args.rows, args.numeric, args.categorical, cardinality=args.cardinality,
+        missing_rate=args.missing_rate, seed=args.seed, target_column=TARGET_COLUMN
+    )
+    report = build_report(params, run_pipeline_benchmark(df, repeat=args.repeat))
+    
+    print(f"{'stage':<32} {'seconds':>10} {'peak MB':>10}  output")
+    for stage in report['stages']:
+        print(f"{stage['stage']:<32} {stage['seconds']:>10.4f} "
+              f"{stage['peak_memory_bytes'] / 1024 ** 2:>10.1f}  {stage['output_shape']}")
+    print(f"{'total':<32} {report['total_seconds']:>10.4f}")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        lines, regressed = compare_reports(baseline, report, args.tolerance, args.min_seconds)
+        print()
+        print("\n".join(lines))
+        if regressed:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark CLI startup: wall time of short invocations and the modules they import.
+
+Usage:
+    python -m benchmarks.bench_startup --repeat 10
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+# Modules the CLI must not import before it knows it has real work to do
+HEAVY_MODULES = ('pandas', 'numpy', 'scipy', 'sklearn')
+
+def import_times(args: List[str]) -> Dict[str, int]:
+    """
+    Run a Python invocation under -X importtime and collect what it imported.
+    
+    Args:
+        args (List[str]): Arguments after the interpreter, e.g. ['-m', 'src.cli', '--help']
+    
+    Returns:
+        Dict[str, int]: Mapping of imported module name to cumulative import time in microseconds
+    """
+    completed = subprocess.run([sys.executable, '-X', 'importtime', *args], capture_output=True, text=True)
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        times[module.strip()] = int(cumulative)
+    return times
+
+def heavy_imports(args: List[str]) -> List[str]:
+    """Top-level packages from HEAVY_MODULES imported by a Python invocation."""
+    return sorted({module.split('.')[0] for module in import_times(args)} & set(HEAVY_MODULES))
+
+def wall_time(args: List[str], repeat: int) -> float:
+    """Median wall-clock seconds of a Python invocation over repeat runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], capture_output=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CLI startup time.')
+    parser.add_argument('--repeat', type=int, default=10,
+                        help='Number of runs per invocation; the median is reported')
+    args = parser.parse_args()
+    
+    invocations = {
+        'interpreter only': ['-c', 'pass'],
+        'cli --help': ['-m', 'src.cli', '--help'],
+        'cli missing file': ['-m', 'src.cli', 'missing.csv', 'target'],
+        'batch --help': ['-m', 'src.batch', '--help'],
+        'import src.main': ['-c', 'import src.main']
+    }
+    
+    print(f"{'invocation':<20} {'median (s)':>11}  heavy imports")
+    for name, invocation in invocations.items():
+        heavy = ', '.join(heavy_imports(invocation)) or '-'
+        print(f"{name:<20} {wall_time(invocation, args.repeat):11.3f}  {heavy}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Synthetic dataset generators for benchmarks.
+"""
+
+import numpy as np
+import pandas as pd
+
+def make_synthetic_dataset(n_rows: int, n_numeric: int, n_categorical: int, cardinality: int = 20,
+                           missing_rate: float = 0.0, seed: int = 0, target_column: str = 'target') -> pd.DataFrame:
+    """
+    Generate a mixed-type dataset with a numerical target.
+    
+    Numerical features are noisy linear combinations of a few latent factors, so some are
+    correlated with each other and with the target. Categorical features draw from
+    `cardinality` levels with a skewed (Zipf-like) frequency distribution.
+    
+    Args:
+        n_rows (int): Number of rows
+        n_numeric (int): Number of numerical feature columns
+        n_categorical (int): Number of categorical feature columns
+        cardinality (int): Number of distinct values per categorical column
+        missing_rate (float): Fraction of feature cells set to missing (0-1)
+        seed (int): Random seed
+        target_column (str): Name of the target column
+        
+    Returns:
+        pd.DataFrame: Synthetic dataset with features followed by the target column
+    """
+    rng = np.random.default_rng(seed)
+    n_factors = max(1, min(10, n_numeric // 5))
+    factors = rng.normal(size=(n_rows, n_factors))
+    
+    columns = {}
+    if n_numeric:
+        loadings = rng.normal(size=(n_factors, n_numeric))
+        numeric = factors @ loadings + rng.normal(size=(n_rows, n_numeric))
+        if missing_rate:
+            numeric[rng.random(numeric.shape) < missing_rate] = np.nan
+        columns.update({f'num_{i}': numeric[:, i] for i in range(n_numeric)})
+    
+    levels = np.array([f'level_{i}' for i in range(cardinality)], dtype=object)
+    weights = 1.0 / np.arange(1, cardinality + 1)
+    weights /= weights.sum()
+    for i in range(n_categorical):
+        values = levels[rng.choice(cardinality, size=n_rows, p=weights)]
+        if missing_rate:
+            values[rng.random(n_rows) < missing_rate] = None
+        columns[f'cat_{i}'] = values
+    
+    columns[target_column] = factors @ rng.normal(size=n_factors) + rng.normal(size=n_rows)
+    
+    return pd.DataFrame(columns)
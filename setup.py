@@ -8,6 +8,7 @@ setup(
         "pandas>=2.2.3",
         "numpy>=2.2.3",
         "scikit-learn>=1.6.1",
+        "scipy>=1.10",
         "pyyaml>=6.0.2",
     ],
     author="Caylent",
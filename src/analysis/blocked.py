@@ -0,0 +1,154 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+import numpy as np
+from .streaming import pairwise_moments
+
+DEFAULT_BLOCK_SIZE = 512
+
+# Elements of each float64 temporary while columns are standardized
+_STANDARDIZE_BLOCK_ELEMENTS = 2 ** 20
+
+def _column_blocks(n_columns: int, block_size: int) -> List[slice]:
+    """Split column positions into contiguous blocks of at most block_size columns."""
+    return [slice(start, min(start + block_size, n_columns)) for start in range(0, n_columns, block_size)]
+
+def standardize_columns(values: np.ndarray, dtype: np.dtype = np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Center each column and scale it to unit norm so that Z.T @ Z is the correlation matrix.
+    
+    Missing values are replaced by the column mean (0 after centering), so they do not
+    contribute to any product. Columns are standardized a few at a time straight into the
+    result, so float64 temporaries stay small and float32 halves peak memory.
+    
+    Args:
+        values (np.ndarray): Array of shape (n_rows, n_columns)
+        dtype (np.dtype): Floating point type of the standardized matrix
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (column-major standardized matrix, boolean mask of constant columns)
+    """
+    n_rows, n_columns = values.shape
+    standardized = np.empty((n_rows, n_columns), dtype=dtype, order='F')
+    constant = np.empty(n_columns, dtype=bool)
+    
+    block_size = max(1, _STANDARDIZE_BLOCK_ELEMENTS // max(n_rows, 1))
+    for columns in _column_blocks(n_columns, block_size):
+        block = np.asarray(values[:, columns], dtype=np.float64)
+        mask = ~np.isnan(block)
+        present = mask.sum(axis=0)
+        means = np.divide(np.where(mask, block, 0.0).sum(axis=0), present,
+                          out=np.zeros(block.shape[1]), where=present > 0)
+        centered = np.where(mask, block - means, 0.0)
+        norms = np.sqrt((centered * centered).sum(axis=0))
+        constant[columns] = norms == 0
+        standardized[:, columns] = np.divide(centered, norms, out=np.zeros_like(centered), where=norms > 0)
+    
+    return standardized, constant
+
+def blocked_correlation(values: np.ndarray, block_size: int = DEFAULT_BLOCK_SIZE, n_jobs: int = 1,
+                        dtype: np.dtype = np.float64, pairwise: Optional[bool] = None) -> np.ndarray:
+    """
+    Compute the Pearson correlation matrix of the columns of an array tile by tile.
+    
+    Columns are standardized once and each tile of the upper triangle is a single matrix
+    product, computed on a thread pool (NumPy releases the GIL during matmul).
+    
+    Args:
+        values (np.ndarray): Array of shape (n_rows, n_columns), NaN marking missing values
+        block_size (int): Number of columns per tile
+        n_jobs (int): Number of worker threads
+        dtype (np.dtype): np.float64, or np.float32 to halve the memory of the standardized matrix
+        pairwise (Optional[bool]): How missing values are handled. True uses only rows where both
+                                   columns are present (DataFrame.corr() semantics, slower); False
+                                   treats missing values as the column mean (fast, approximate);
+                                   None picks True only if the data has missing values
+    
+    Returns:
+        np.ndarray: Correlation matrix of shape (n_columns, n_columns)
+    """
+    if block_size <= 0:
+        raise ValueError("block_size must be a positive integer")
+    if n_jobs <= 0:
+        raise ValueError("n_jobs must be a positive integer")
+    
+    values = np.asarray(values, dtype=np.float64)
+    n_columns = values.shape[1]
+    blocks = _column_blocks(n_columns, block_size)
+    if pairwise is None:
+        # Checked block by block to avoid a mask of the whole array
+        pairwise = any(np.isnan(values[:, columns]).any() for columns in blocks)
+    
+    result = np.full((n_columns, n_columns), np.nan)
+    tiles = [(left, right) for i, left in enumerate(blocks) for right in blocks[i:]]
+    
+    if pairwise:
+        # Column-major copy so that column blocks are contiguous
+        source = np.asfortranarray(values)
+        
+        def compute_tile(left: slice, right: slice) -> np.ndarray:
+            return pairwise_block_correlation(source[:, left], source[:, right])
+    else:
+        standardized, constant = standardize_columns(values, dtype)
+        
+        def compute_tile(left: slice, right: slice) -> np.ndarray:
+            return standardized[:, left].T @ standardized[:, right]
+    
+    def fill_tile(tile: Tuple[slice, slice]) -> None:
+        left, right = tile
+        block = compute_tile(left, right)
+        result[left, right] = block
+        result[right, left] = block.T
+    
+    if n_jobs == 1 or len(tiles) == 1:
+        for tile in tiles:
+            fill_tile(tile)
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            list(executor.map(fill_tile, tiles))
+    
+    if not pairwise:
+        result[constant, :] = np.nan
+        result[:, constant] = np.nan
+    
+    return np.clip(result, -1.0, 1.0)
+
+def pairwise_block_correlation(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """
+    Compute the Pearson correlations between two column blocks using pairwise-complete rows.
+    
+    Args:
+        left (np.ndarray): Array of shape (n_rows, n_left), may contain NaN
+        right (np.ndarray): Array of shape (n_rows, n_right), may contain NaN
+    
+    Returns:
+        np.ndarray: Array of shape (n_left, n_right); NaN where a pair has no common rows or a constant column
+    """
+    count, _, _, m2_left, m2_right, comoment = pairwise_moments(left, right)
+    denominator = np.sqrt(m2_left * m2_right)
+    valid = (count > 0) & (denominator > 0)
+    return np.divide(comoment, denominator, out=np.full(denominator.shape, np.nan), where=valid)
+
+def target_correlation(values: np.ndarray, target: np.ndarray, block_size: int = DEFAULT_BLOCK_SIZE) -> np.ndarray:
+    """
+    Compute the Pearson correlation of every column of an array with a single target vector.
+    
+    Only the n_columns correlations are computed, never the full matrix. Missing values are
+    handled pairwise, like DataFrame.corr(). Columns are processed in blocks to bound the
+    memory used by temporaries.
+    
+    Args:
+        values (np.ndarray): Array of shape (n_rows, n_columns), NaN marking missing values
+        target (np.ndarray): Array of shape (n_rows,)
+        block_size (int): Number of columns processed at a time
+    
+    Returns:
+        np.ndarray: Correlations of shape (n_columns,)
+    """
+    if block_size <= 0:
+        raise ValueError("block_size must be a positive integer")
+    
+    target = np.asarray(target, dtype=np.float64).reshape(-1, 1)
+    correlations = np.empty(values.shape[1])
+    for block in _column_blocks(values.shape[1], block_size):
+        correlations[block] = pairwise_block_correlation(np.asarray(values[:, block], dtype=np.float64), target)[:, 0]
+    return np.clip(correlations, -1.0, 1.0)
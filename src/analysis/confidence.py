@@ -0,0 +1,105 @@
+from statistics import NormalDist
+from typing import Optional, Tuple
+import numpy as np
+import pandas as pd
+from .blocked import target_correlation
+from .ranking import rank_features_by_correlation
+
+DEFAULT_CONFIDENCE = 0.95
+
+def fisher_confidence_interval(correlations: np.ndarray, n_rows: np.ndarray,
+                               confidence: float = DEFAULT_CONFIDENCE) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Confidence intervals of Pearson correlations estimated from samples, via the Fisher z-transform.
+    
+    atanh(r) is approximately normal with standard error 1 / sqrt(n - 3), so the interval
+    is built in z space and mapped back with tanh. Correlations from 3 rows or fewer get
+    the uninformative interval [-1, 1].
+    
+    Args:
+        correlations (np.ndarray): Sample correlations
+        n_rows (np.ndarray): Number of rows each correlation was computed from
+        confidence (float): Confidence level, e.g. 0.95
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (lower bounds, upper bounds)
+    """
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    
+    correlations = np.asarray(correlations, dtype=np.float64)
+    n_rows = np.asarray(n_rows, dtype=np.float64)
+    critical = NormalDist().inv_cdf((1 + confidence) / 2)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = np.arctanh(np.clip(correlations, -1.0, 1.0))
+        margin = np.where(n_rows > 3, critical / np.sqrt(np.maximum(n_rows - 3, 1)), np.inf)
+        low = np.tanh(z - margin)
+        high = np.tanh(z + margin)
+    return low, high
+
+def correlation_scores_with_intervals(df: pd.DataFrame, target_column: str, confidence: float = DEFAULT_CONFIDENCE,
+                                      top_k: Optional[int] = None, min_score: Optional[float] = None) -> pd.DataFrame:
+    """
+    Rank features by absolute correlation with the target, with confidence intervals for sampled data.
+    
+    Besides the interval of each score, every feature gets the best and worst rank that is
+    consistent with the intervals: rank_low counts the features whose lower bound is above
+    this feature's upper bound, rank_high the features whose upper bound reaches this
+    feature's lower bound. A narrow rank range means the rank can be trusted.
+    
+    Args:
+        df (pd.DataFrame): Sampled rows with features and target
+        target_column (str): Name of the target column
+        confidence (float): Confidence level of the intervals
+        top_k (Optional[int]): If set, keep only the top_k features with the highest score
+        min_score (Optional[float]): If set, drop features scoring below this value
+        
+    Returns:
+        pd.DataFrame: DataFrame with columns ['feature', 'importance_score', 'ci_low', 'ci_high',
+                     'n_rows', 'rank', 'rank_low', 'rank_high'], sorted by rank
+    """
+    columns = ['feature', 'importance_score', 'ci_low', 'ci_high', 'n_rows', 'rank', 'rank_low', 'rank_high']
+    if top_k is not None and top_k < 0:
+        raise ValueError("top_k must be a non-negative integer")
+    
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+    
+    numeric_df = df.select_dtypes(include=['number'])
+    if target_column not in numeric_df.columns:
+        raise ValueError(f"Target column '{target_column}' must be numeric")
+    
+    features_df = numeric_df.drop(columns=[target_column])
+    values = features_df.to_numpy(dtype=np.float64, na_value=np.nan)
+    target = numeric_df[target_column].to_numpy(dtype=np.float64, na_value=np.nan)
+    correlations = target_correlation(values, target)
+    n_rows = (~np.isnan(values) & ~np.isnan(target)[:, None]).sum(axis=0)
+    low, high = fisher_confidence_interval(correlations, n_rows, confidence)
+    
+    # Interval of |r|: reflect intervals below zero, and start at 0 when the interval contains it
+    abs_low = np.where(low > 0, low, np.where(high < 0, -high, 0.0))
+    abs_high = np.maximum(np.abs(low), np.abs(high))
+    
+    result_df = rank_features_by_correlation(pd.DataFrame({
+        'feature': features_df.columns,
+        'importance_score': np.abs(correlations),
+        'ci_low': abs_low,
+        'ci_high': abs_high,
+        'n_rows': n_rows
+    }))
+    
+    # Rank bounds from sorted interval ends, O(n log n) in the number of features
+    sorted_low = np.sort(result_df['ci_low'].to_numpy())
+    sorted_high = np.sort(result_df['ci_high'].to_numpy())
+    ci_low = result_df['ci_low'].to_numpy()
+    ci_high = result_df['ci_high'].to_numpy()
+    result_df['rank_low'] = 1 + len(sorted_low) - np.searchsorted(sorted_low, ci_high, side='right')
+    result_df['rank_high'] = len(sorted_high) - np.searchsorted(sorted_high, ci_low, side='left')
+    
+    if min_score is not None:
+        result_df = result_df[result_df['importance_score'] >= min_score]
+    if top_k is not None:
+        result_df = result_df.head(top_k)
+    
+    return result_df[columns]
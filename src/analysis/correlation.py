@@ -1,19 +1,41 @@
 import pandas as pd
 import numpy as np
-from typing import List, Tuple, Set
+from typing import List, Optional, Tuple, Union
+from .blocked import DEFAULT_BLOCK_SIZE, blocked_correlation, target_correlation
+from .rank_correlation import (
+    check_correlation_method,
+    spearman_correlation,
+    spearman_target_correlation,
+    kendall_correlation,
+    kendall_target_correlation
+)
+from .feature_groups import find_feature_groups
+from .streaming import CorrelationState, correlation_matrix_from_state, select_state_columns
 
-def compute_correlation_scores(df: pd.DataFrame, target_column: str) -> pd.DataFrame:
+# Rows of the correlation matrix scanned at a time when looking for correlated pairs
+_PAIR_SCAN_BLOCK_ROWS = 1024
+
+def compute_correlation_scores(df: pd.DataFrame, target_column: str, top_k: Optional[int] = None,
+                               min_score: Optional[float] = None, method: str = 'pearson') -> pd.DataFrame:
     """
     Calculate correlation scores between features and target variable.
     
+    Only the feature-vs-target correlations are computed, in a single vectorized pass,
+    instead of the full feature correlation matrix.
+    
     Args:
         df (pd.DataFrame): Input DataFrame with features and target
         target_column (str): Name of the target column
-        
+        top_k (Optional[int]): If set, keep only the top_k features with the highest score
+        min_score (Optional[float]): If set, drop features scoring below this value
+        method (str): 'pearson', 'spearman' (rank correlation) or 'kendall' (tau-b)
+    
     Returns:
         pd.DataFrame: DataFrame with columns ['feature', 'importance_score']
                      where importance_score is absolute correlation with target
     """
+    check_correlation_method(method)
+    
     # Handle empty DataFrame
     if df.empty:
         return pd.DataFrame(columns=['feature', 'importance_score'])
@@ -25,7 +47,96 @@ def compute_correlation_scores(df: pd.DataFrame, target_column: str) -> pd.DataF
         raise ValueError(f"Target column '{target_column}' must be numeric")
     
     # Calculate correlations with target
-    correlations = numeric_df.corr()[target_column]
+    features_df = numeric_df.drop(columns=[target_column])
+    values = features_df.to_numpy(dtype=np.float64, na_value=np.nan)
+    target = numeric_df[target_column].to_numpy(dtype=np.float64, na_value=np.nan)
+    if method == 'spearman':
+        correlations = spearman_target_correlation(values, target)
+    elif method == 'kendall':
+        correlations = kendall_target_correlation(values, target)
+    else:
+        correlations = target_correlation(values, target)
+    correlations = pd.Series(correlations, index=features_df.columns, name=target_column)
+    
+    return scores_from_correlations(correlations, target_column, top_k, min_score)
+
+def compute_streaming_correlation_scores(state: CorrelationState, target_column: str, top_k: Optional[int] = None,
+                                         min_score: Optional[float] = None) -> pd.DataFrame:
+    """
+    Calculate correlation scores between features and target variable from streamed statistics.
+    
+    Streaming counterpart of compute_correlation_scores for data read in chunks.
+    
+    Args:
+        state (CorrelationState): Statistics accumulated with accumulate_correlation_state
+        target_column (str): Name of the target column
+        top_k (Optional[int]): If set, keep only the top_k features with the highest score
+        min_score (Optional[float]): If set, drop features scoring below this value
+    
+    Returns:
+        pd.DataFrame: DataFrame with columns ['feature', 'importance_score']
+                     where importance_score is absolute correlation with target
+    """
+    if state.n_rows == 0:
+        return pd.DataFrame(columns=['feature', 'importance_score'])
+    
+    if target_column not in state.columns:
+        raise ValueError(f"Target column '{target_column}' must be numeric")
+    
+    correlations = correlation_matrix_from_state(state)[target_column]
+    
+    return scores_from_correlations(correlations, target_column, top_k, min_score)
+
+def correlation_scores_from_matrix(correlation_matrix: pd.DataFrame, target_column: str, top_k: Optional[int] = None,
+                                   min_score: Optional[float] = None) -> pd.DataFrame:
+    """
+    Read the correlation scores of every feature with the target from a precomputed matrix.
+    
+    Args:
+        correlation_matrix (pd.DataFrame): Correlation matrix of the numerical columns, including the target
+        target_column (str): Name of the target column
+        top_k (Optional[int]): If set, keep only the top_k features with the highest score
+        min_score (Optional[float]): If set, drop features scoring below this value
+    
+    Returns:
+        pd.DataFrame: DataFrame with columns ['feature', 'importance_score']
+                     where importance_score is absolute correlation with target
+    """
+    if target_column not in correlation_matrix.columns:
+        raise ValueError(f"Target column '{target_column}' must be numeric")
+    
+    return scores_from_correlations(correlation_matrix[target_column], target_column, top_k, min_score)
+
+def scores_from_correlations(correlations: pd.Series, target_column: str, top_k: Optional[int] = None,
+                             min_score: Optional[float] = None) -> pd.DataFrame:
+    """
+    Build the sorted ['feature', 'importance_score'] frame from scores against the target.
+    
+    Shared by every scoring method: the target itself is dropped, features are ranked by
+    absolute score, and min_score and top_k are applied before the result frame is built.
+    
+    Args:
+        correlations (pd.Series): Score of each feature against the target, indexed by feature name
+        target_column (str): Name of the target column, excluded from the result
+        top_k (Optional[int]): If set, keep only the top_k highest scoring features
+        min_score (Optional[float]): If set, keep only features whose absolute score is at least min_score
+    
+    Returns:
+        pd.DataFrame: Features sorted by importance_score, highest first
+    """
+    if top_k is not None and top_k < 0:
+        raise ValueError("top_k must be a non-negative integer")
+    
+    correlations = correlations[correlations.index != target_column]
+    scores = correlations.abs().to_numpy()
+    
+    # Prune before building and sorting the result frame
+    keep = np.arange(len(scores))
+    if min_score is not None:
+        keep = keep[scores[keep] >= min_score]
+    if top_k is not None and len(keep) > top_k:
+        keep = np.sort(keep[np.argsort(-scores[keep], kind='stable')[:top_k]])
+    correlations = correlations.iloc[keep]
     
     # Convert to DataFrame with absolute values
     result_df = pd.DataFrame({
@@ -33,23 +144,37 @@ def compute_correlation_scores(df: pd.DataFrame, target_column: str) -> pd.DataF
         'importance_score': correlations.abs()
     })
     
-    # Remove target column from results and sort by importance
-    result_df = result_df[result_df['feature'] != target_column]
+    # Sort by importance
     result_df = result_df.sort_values('importance_score', ascending=False)
     
     return result_df
 
-def calculate_correlation_matrix(df: pd.DataFrame, exclude_columns: List[str] = None) -> pd.DataFrame:
+def calculate_correlation_matrix(df: pd.DataFrame, exclude_columns: List[str] = None, n_jobs: int = 1,
+                                 block_size: int = DEFAULT_BLOCK_SIZE, dtype: np.dtype = np.float64,
+                                 pairwise: Optional[bool] = None, method: str = 'pearson') -> pd.DataFrame:
     """
     Calculate correlation matrix between numerical features.
     
+    The matrix is computed in column tiles from standardized columns, optionally across
+    several threads. Results match DataFrame.corr() within floating point tolerance.
+    Spearman reuses the same tiles on column ranks computed once; Kendall runs an
+    O(n log n) tau-b per column pair.
+    
     Args:
         df (pd.DataFrame): Input DataFrame
         exclude_columns (List[str], optional): Columns to exclude from correlation calculation
-        
+        n_jobs (int): Number of worker threads used for the tiles (default: 1)
+        block_size (int): Number of columns per tile
+        dtype (np.dtype): np.float64, or np.float32 to halve memory at reduced precision
+        pairwise (Optional[bool]): True for DataFrame.corr() pairwise-NaN semantics (slower), False to
+                                   treat missing values as the column mean, None to decide from the data
+        method (str): 'pearson', 'spearman' (rank correlation) or 'kendall' (tau-b)
+    
     Returns:
         pd.DataFrame: Correlation matrix for numerical features
     """
+    check_correlation_method(method)
+    
     # Get numerical columns only
     numeric_df = df.select_dtypes(include=['number'])
     
@@ -60,36 +185,89 @@ def calculate_correlation_matrix(df: pd.DataFrame, exclude_columns: List[str] =
         raise ValueError("No numerical features found in DataFrame")
     
     # Calculate correlation matrix
-    correlation_matrix = numeric_df.corr()
+    values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+    if method == 'spearman':
+        correlations = spearman_correlation(values, block_size=block_size, n_jobs=n_jobs, dtype=dtype, pairwise=pairwise)
+    elif method == 'kendall':
+        correlations = kendall_correlation(values, n_jobs=n_jobs)
+    else:
+        correlations = blocked_correlation(values, block_size=block_size, n_jobs=n_jobs, dtype=dtype, pairwise=pairwise)
+    correlation_matrix = pd.DataFrame(correlations, index=numeric_df.columns, columns=numeric_df.columns)
+    
+    # Set diagonal to NaN to exclude self-correlations
+    np.fill_diagonal(correlation_matrix.values, np.nan)
+    
+    return correlation_matrix
+
+def calculate_streaming_correlation_matrix(state: CorrelationState, exclude_columns: List[str] = None) -> pd.DataFrame:
+    """
+    Calculate correlation matrix between numerical features from streamed statistics.
+    
+    Streaming counterpart of calculate_correlation_matrix for data read in chunks.
+    
+    Args:
+        state (CorrelationState): Statistics accumulated with accumulate_correlation_state
+        exclude_columns (List[str], optional): Columns to exclude from correlation calculation
+    
+    Returns:
+        pd.DataFrame: Correlation matrix for numerical features
+    """
+    if exclude_columns:
+        state = select_state_columns(state, [col for col in state.columns if col not in exclude_columns])
+    
+    if not state.columns:
+        raise ValueError("No numerical features found in DataFrame")
+    
+    correlation_matrix = correlation_matrix_from_state(state)
     
     # Set diagonal to NaN to exclude self-correlations
     np.fill_diagonal(correlation_matrix.values, np.nan)
     
     return correlation_matrix
 
-def identify_highly_correlated_features(correlation_matrix: pd.DataFrame, threshold: float) -> List[Tuple[str, str]]:
+def identify_highly_correlated_features(correlation_matrix: pd.DataFrame, threshold: float,
+                                        as_indices: bool = False) -> Union[List[Tuple[str, str]], Tuple[np.ndarray, np.ndarray]]:
     """
     Find pairs of features that have correlation above the threshold.
     
+    Only the upper triangle of the matrix is scanned, in row-major order, so pairs are
+    returned as (earlier column, later column) ordered by row then column.
+    
     Args:
         correlation_matrix (pd.DataFrame): Correlation matrix from calculate_correlation_matrix
         threshold (float): Correlation threshold to consider features as correlated
-        
+        as_indices (bool): If True, return (row_positions, column_positions) integer arrays
+                           instead of a list of name tuples, which is much lighter for wide matrices
+    
     Returns:
-        List[Tuple[str, str]]: List of feature pairs that are highly correlated
+        Union[List[Tuple[str, str]], Tuple[np.ndarray, np.ndarray]]: Feature pairs that are highly correlated
     """
     if threshold < 0 or threshold > 1:
         raise ValueError("Threshold must be between 0 and 1")
     
-    corr_pairs = []
-    for i in range(len(correlation_matrix.columns)):
-        for j in range(i + 1, len(correlation_matrix.columns)):
-            col1, col2 = correlation_matrix.columns[i], correlation_matrix.columns[j]
-            corr = abs(correlation_matrix.iloc[i, j])
-            if corr >= threshold:
-                corr_pairs.append((col1, col2))
+    values = correlation_matrix.to_numpy(dtype=np.float64, na_value=np.nan)
+    n_features = values.shape[1]
+    column_positions = np.arange(n_features)
+    
+    # Scan the upper triangle in row blocks to avoid n x n temporaries on wide matrices
+    row_blocks, col_blocks = [], []
+    for start in range(0, values.shape[0], _PAIR_SCAN_BLOCK_ROWS):
+        block = np.abs(values[start:start + _PAIR_SCAN_BLOCK_ROWS])
+        row_positions = np.arange(start, start + len(block))
+        with np.errstate(invalid='ignore'):
+            mask = (block >= threshold) & (column_positions[None, :] > row_positions[:, None])
+        rows, cols = np.nonzero(mask)
+        row_blocks.append(rows + start)
+        col_blocks.append(cols)
     
-    return corr_pairs
+    rows = np.concatenate(row_blocks) if row_blocks else np.empty(0, dtype=np.intp)
+    cols = np.concatenate(col_blocks) if col_blocks else np.empty(0, dtype=np.intp)
+    
+    if as_indices:
+        return rows, cols
+    
+    columns = correlation_matrix.columns
+    return list(zip(columns[rows].tolist(), columns[cols].tolist()))
 
 def group_correlated_features(correlation_matrix: pd.DataFrame, threshold: float = 0.8) -> List[List[str]]:
     """
@@ -98,43 +276,11 @@ def group_correlated_features(correlation_matrix: pd.DataFrame, threshold: float
     Args:
         correlation_matrix (pd.DataFrame): Correlation matrix from calculate_correlation_matrix
         threshold (float): Correlation threshold to consider features as correlated (default: 0.8)
-        
+    
     Returns:
         List[List[str]]: List of feature groups where features within each group are highly correlated
     """
-    # Get highly correlated pairs
-    corr_pairs = identify_highly_correlated_features(correlation_matrix, threshold)
-    
-    if not corr_pairs:
-        return []
-    
-    # Group correlated features using sets
-    feature_groups: List[Set[str]] = []
-    for feat1, feat2 in corr_pairs:
-        # Try to add to existing group
-        added = False
-        for group in feature_groups:
-            if feat1 in group or feat2 in group:
-                group.add(feat1)
-                group.add(feat2)
-                added = True
-                break
-        
-        # Create new group if not added to existing
-        if not added:
-            feature_groups.append({feat1, feat2})
-    
-    # Merge groups with common features
-    i = 0
-    while i < len(feature_groups):
-        j = i + 1
-        while j < len(feature_groups):
-            if feature_groups[i] & feature_groups[j]:  # If groups have common features
-                feature_groups[i] = feature_groups[i] | feature_groups[j]  # Merge groups
-                feature_groups.pop(j)
-            else:
-                j += 1
-        i += 1
-    
-    # Convert sets to sorted lists
-    return [sorted(group) for group in feature_groups]
+    # Get highly correlated pairs as positions in the matrix
+    rows, cols = identify_highly_correlated_features(correlation_matrix, threshold, as_indices=True)
+    
+    return find_feature_groups(correlation_matrix.columns.tolist(), rows, cols)
@@ -0,0 +1,74 @@
+from typing import Dict, List, Sequence
+import numpy as np
+import pandas as pd
+
+def _find_root(parents: List[int], node: int) -> int:
+    """Find the root of a node, compressing the path along the way."""
+    root = node
+    while parents[root] != root:
+        root = parents[root]
+    while parents[node] != root:
+        parents[node], node = root, parents[node]
+    return root
+
+def find_feature_groups(features: Sequence[str], rows: np.ndarray, cols: np.ndarray) -> List[List[str]]:
+    """
+    Group features connected by correlated pairs using a disjoint-set (union-find).
+    
+    Runs in near-linear time in the number of pairs. Groups are ordered by the position
+    of their first feature in `features`, and members are sorted by name.
+    
+    Args:
+        features (Sequence[str]): Feature names, indexed by the positions in rows and cols
+        rows (np.ndarray): Positions of the first feature of each correlated pair
+        cols (np.ndarray): Positions of the second feature of each correlated pair
+        
+    Returns:
+        List[List[str]]: List of feature groups (connected components with at least two features)
+    """
+    parents = list(range(len(features)))
+    sizes = [1] * len(features)
+    
+    for row, col in zip(np.asarray(rows).tolist(), np.asarray(cols).tolist()):
+        root_row, root_col = _find_root(parents, row), _find_root(parents, col)
+        if root_row == root_col:
+            continue
+        # Union by size keeps the trees shallow
+        if sizes[root_row] < sizes[root_col]:
+            root_row, root_col = root_col, root_row
+        parents[root_col] = root_row
+        sizes[root_row] += sizes[root_col]
+    
+    members: Dict[int, List[str]] = {}
+    for position, feature in enumerate(features):
+        root = _find_root(parents, position)
+        if sizes[root] > 1:
+            members.setdefault(root, []).append(feature)
+    
+    return [sorted(group) for group in members.values()]
+
+def select_group_representatives(feature_groups: List[List[str]], correlation_df: pd.DataFrame) -> List[str]:
+    """
+    Choose one representative per group: the feature most correlated with the target.
+    
+    Ties are broken by the order of features within the group; features without a score
+    are only chosen if no other member of the group has one.
+    
+    Args:
+        feature_groups (List[List[str]]): Groups from group_correlated_features
+        correlation_df (pd.DataFrame): DataFrame with columns ['feature', 'importance_score']
+        
+    Returns:
+        List[str]: Representative feature of each group, in group order
+    """
+    if not all(col in correlation_df.columns for col in ['feature', 'importance_score']):
+        raise ValueError("Input DataFrame must have 'feature' and 'importance_score' columns")
+    
+    scores = correlation_df.set_index('feature')['importance_score']
+    
+    representatives = []
+    for group in feature_groups:
+        group_scores = scores.reindex(group).fillna(-np.inf).to_numpy(dtype=np.float64)
+        representatives.append(group[int(np.argmax(group_scores))])
+    
+    return representatives
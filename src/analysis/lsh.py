@@ -0,0 +1,306 @@
+from typing import List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+
+# Probability of finding a pair correlated exactly at the threshold when n_tables is not given
+DEFAULT_RECALL = 0.95
+
+# Rows and columns of the data projected at a time while sketching
+_SKETCH_BLOCK_ROWS = 4096
+_SKETCH_BLOCK_COLUMNS = 4096
+
+# Candidates whose signatures disagree on more bits than expected at the threshold plus this many
+# standard deviations are dropped before verification; a pair at the threshold survives with
+# probability above 0.9999
+_SIGNATURE_FILTER_SIGMAS = 4.0
+
+# Elements of each (n_rows, n_pairs) temporary while candidate pairs are verified
+_VERIFY_BLOCK_ELEMENTS = 2 ** 22
+
+# Number of set bits of every byte value
+_POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint16)
+
+def collision_probability(correlation: Union[float, np.ndarray], n_tables: int,
+                          bits_per_table: int) -> Union[float, np.ndarray]:
+    """
+    Probability that a pair of columns with the given correlation shares a bucket of some table.
+    
+    A random hyperplane separates two columns at angle arccos(|correlation|) with probability
+    angle / pi, so each signature bit agrees with probability 1 - angle / pi. A pair shares a
+    bucket if all bits of at least one table agree. More bits per table make buckets smaller
+    (fewer candidates to verify, faster); more tables raise recall and sketching cost.
+    
+    Args:
+        correlation (Union[float, np.ndarray]): Correlation of the pair
+        n_tables (int): Number of hash tables
+        bits_per_table (int): Signature bits per table
+    
+    Returns:
+        Union[float, np.ndarray]: Probability, before the signature filter, that the pair is found
+    """
+    agreement = 1 - np.arccos(np.clip(np.abs(correlation), 0.0, 1.0)) / np.pi
+    return 1 - (1 - agreement ** bits_per_table) ** n_tables
+
+def tables_for_recall(threshold: float, recall: float, bits_per_table: int) -> int:
+    """
+    Smallest number of hash tables that finds pairs correlated at threshold with the given recall.
+    
+    Args:
+        threshold (float): Absolute correlation of the weakest pairs that should be found
+        recall (float): Target probability of finding such a pair, between 0 and 1 (exclusive)
+        bits_per_table (int): Signature bits per table
+    
+    Returns:
+        int: Number of tables
+    """
+    if not 0 < recall < 1:
+        raise ValueError("recall must be between 0 and 1 (exclusive)")
+    hit = (1 - np.arccos(min(abs(threshold), 1.0)) / np.pi) ** bits_per_table
+    if hit >= 1:
+        return 1
+    return max(1, int(np.ceil(np.log(1 - recall) / np.log(1 - hit))))
+
+def default_bits_per_table(n_columns: int) -> int:
+    """
+    Bits per table that spread n_columns columns over about as many buckets.
+    
+    The first bit of every band is spent on folding negated signatures together (see
+    candidate_pairs), hence one bit more than log2(n_columns).
+    
+    Args:
+        n_columns (int): Number of hashed columns
+    
+    Returns:
+        int: Bits per table, at least 8
+    """
+    return max(8, int(np.ceil(np.log2(max(n_columns, 2)))) + 1)
+
+def simhash_signatures(values: np.ndarray, n_bits: int, seed: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sign-of-random-projection (SimHash) signatures of the centered columns of an array.
+    
+    Each bit is the side of a random hyperplane through the origin on which a centered
+    column lies, so columns at a small angle (high correlation) share most bits. Missing
+    values count as the column mean. The data is projected in row and column blocks and
+    never standardized as a whole; the cost is O(n_rows * n_columns * n_bits).
+    
+    Args:
+        values (np.ndarray): Array of shape (n_rows, n_columns), NaN marking missing values
+        n_bits (int): Number of signature bits
+        seed (Optional[int]): Random seed of the hyperplanes
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (boolean signatures of shape (n_columns, n_bits), boolean mask of
+                                       constant or empty columns, which have no meaningful signature)
+    """
+    if n_bits <= 0:
+        raise ValueError("n_bits must be a positive integer")
+    
+    n_rows, n_columns = values.shape
+    column_blocks = [slice(start, min(start + _SKETCH_BLOCK_COLUMNS, n_columns))
+                     for start in range(0, n_columns, _SKETCH_BLOCK_COLUMNS)]
+    row_blocks = [slice(start, min(start + _SKETCH_BLOCK_ROWS, n_rows)) for start in range(0, n_rows, _SKETCH_BLOCK_ROWS)]
+    
+    # First pass: column means, then spread of the centered columns
+    sums, counts = np.zeros(n_columns), np.zeros(n_columns)
+    for rows in row_blocks:
+        for columns in column_blocks:
+            block = np.asarray(values[rows, columns], dtype=np.float64)
+            present = ~np.isnan(block)
+            sums[columns] += np.where(present, block, 0.0).sum(axis=0)
+            counts[columns] += present.sum(axis=0)
+    means = np.divide(sums, counts, out=np.zeros(n_columns), where=counts > 0)
+    
+    # Second pass: project the centered columns onto the same hyperplanes row block by row block
+    rng = np.random.default_rng(seed)
+    projections = np.zeros((n_columns, n_bits))
+    spread = np.zeros(n_columns)
+    for rows in row_blocks:
+        hyperplanes = rng.standard_normal((rows.stop - rows.start, n_bits))
+        for columns in column_blocks:
+            block = np.asarray(values[rows, columns], dtype=np.float64)
+            centered = np.where(np.isnan(block), 0.0, block - means[columns])
+            projections[columns] += centered.T @ hyperplanes
+            spread[columns] += np.abs(centered).sum(axis=0)
+    
+    return projections > 0, spread == 0
+
+def candidate_pairs(signatures: np.ndarray, n_tables: int, bits_per_table: int,
+                    exclude: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairs of columns whose signatures agree, or are exactly complementary, on all bits of some table.
+    
+    Complementary bands catch negatively correlated pairs: each band is flipped so that its
+    first bit is 0 before hashing, which puts a band and its complement in the same bucket.
+    Pairs are emitted one bucket offset at a time, so the cost grows with the number of
+    candidates and the size of the largest bucket rather than the number of buckets.
+    
+    Args:
+        signatures (np.ndarray): Boolean signatures of shape (n_columns, n_tables * bits_per_table)
+        n_tables (int): Number of hash tables
+        bits_per_table (int): Signature bits per table, at most 62
+        exclude (Optional[np.ndarray]): Boolean mask of columns that must not take part in any pair
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (first positions, second positions) of the unique candidate pairs,
+                                       first < second, sorted by first then second position
+    """
+    if n_tables <= 0 or bits_per_table <= 0:
+        raise ValueError("n_tables and bits_per_table must be positive integers")
+    if bits_per_table > 62:
+        raise ValueError("bits_per_table must be at most 62")
+    if signatures.shape[1] < n_tables * bits_per_table:
+        raise ValueError("signatures have fewer than n_tables * bits_per_table bits")
+    
+    n_columns = signatures.shape[0]
+    hashed = np.arange(n_columns) if exclude is None else np.flatnonzero(~np.asarray(exclude, dtype=bool))
+    weights = 1 << np.arange(bits_per_table, dtype=np.int64)
+    
+    pair_ids: List[np.ndarray] = []
+    for table in range(n_tables):
+        bands = signatures[hashed, table * bits_per_table:(table + 1) * bits_per_table]
+        keys = (bands ^ bands[:, :1]).astype(np.int64) @ weights
+        
+        order = np.argsort(keys, kind='stable')
+        members, sorted_keys = hashed[order], keys[order]
+        # Within a bucket the members are in ascending order, so offset d pairs each
+        # member with the one d places after it in the same bucket
+        for offset in range(1, len(sorted_keys)):
+            same = np.flatnonzero(sorted_keys[offset:] == sorted_keys[:-offset])
+            if len(same) == 0:
+                break
+            pair_ids.append(members[same] * n_columns + members[same + offset])
+    
+    if not pair_ids:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    unique_ids = np.unique(np.concatenate(pair_ids))
+    return (unique_ids // n_columns).astype(np.intp), (unique_ids % n_columns).astype(np.intp)
+
+def signature_distances(signatures: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """
+    Fraction of signature bits on which each pair disagrees, folded so that complements count as equal.
+    
+    cos(pi * distance) estimates the absolute correlation of the pair.
+    
+    Args:
+        signatures (np.ndarray): Boolean signatures of shape (n_columns, n_bits)
+        rows (np.ndarray): Positions of the first column of each pair
+        cols (np.ndarray): Positions of the second column of each pair
+    
+    Returns:
+        np.ndarray: Distances between 0 and 0.5
+    """
+    n_bits = signatures.shape[1]
+    packed = np.packbits(signatures, axis=1)
+    distances = np.empty(len(rows))
+    batch_size = max(1, _VERIFY_BLOCK_ELEMENTS // max(packed.shape[1], 1))
+    for start in range(0, len(rows), batch_size):
+        batch = slice(start, start + batch_size)
+        differing = _POPCOUNT[packed[rows[batch]] ^ packed[cols[batch]]].sum(axis=1)
+        distances[batch] = differing / n_bits
+    return np.minimum(distances, 1 - distances)
+
+def pair_correlations(values: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """
+    Exact Pearson correlations of selected column pairs, using pairwise-complete rows.
+    
+    Matches the corresponding entries of DataFrame.corr() without computing the matrix.
+    
+    Args:
+        values (np.ndarray): Array of shape (n_rows, n_columns), NaN marking missing values
+        rows (np.ndarray): Positions of the first column of each pair
+        cols (np.ndarray): Positions of the second column of each pair
+    
+    Returns:
+        np.ndarray: Correlation of each pair, NaN if undefined
+    """
+    correlations = np.full(len(rows), np.nan)
+    batch_size = max(1, _VERIFY_BLOCK_ELEMENTS // max(values.shape[0], 1))
+    for start in range(0, len(rows), batch_size):
+        batch = slice(start, start + batch_size)
+        x = np.asarray(values[:, rows[batch]], dtype=np.float64)
+        y = np.asarray(values[:, cols[batch]], dtype=np.float64)
+        present = ~(np.isnan(x) | np.isnan(y))
+        count = present.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            dx = np.where(present, x - np.where(present, x, 0.0).sum(axis=0) / count, 0.0)
+            dy = np.where(present, y - np.where(present, y, 0.0).sum(axis=0) / count, 0.0)
+            denominator = np.sqrt((dx * dx).sum(axis=0) * (dy * dy).sum(axis=0))
+            correlations[batch] = np.where(denominator > 0, (dx * dy).sum(axis=0) / denominator, np.nan)
+    return np.clip(correlations, -1.0, 1.0)
+
+def find_correlated_pairs(values: np.ndarray, threshold: float, recall: float = DEFAULT_RECALL,
+                          n_tables: Optional[int] = None, bits_per_table: Optional[int] = None,
+                          seed: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find column pairs whose absolute correlation is at least threshold without the full matrix.
+    
+    Columns are sketched with SimHash signatures and hashed band by band into buckets;
+    pairs sharing a bucket whose full signatures are close enough are verified exactly.
+    Every returned pair is correct, while a pair may be missed: a pair correlated exactly at
+    the threshold is found with probability about recall, stronger pairs more often. Time
+    grows with n_rows * n_columns * n_tables * bits_per_table for the sketch plus n_rows per
+    verified candidate, instead of n_rows * n_columns^2 for the full matrix.
+    
+    Args:
+        values (np.ndarray): Array of shape (n_rows, n_columns), NaN marking missing values
+        threshold (float): Correlation threshold between 0 and 1 (exclusive)
+        recall (float): Target recall at the threshold, used to choose n_tables; higher is slower
+        n_tables (Optional[int]): Number of hash tables; overrides recall
+        bits_per_table (Optional[int]): Signature bits per table (default: default_bits_per_table);
+                                        more bits mean fewer, more similar candidates
+        seed (Optional[int]): Random seed of the hyperplanes
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (row_positions, column_positions) of the pairs, row < column,
+                                       in the order of identify_highly_correlated_features(as_indices=True)
+    """
+    if threshold <= 0 or threshold >= 1:
+        raise ValueError("Threshold must be between 0 and 1 (exclusive)")
+    
+    if bits_per_table is None:
+        bits_per_table = default_bits_per_table(values.shape[1])
+    if n_tables is None:
+        n_tables = tables_for_recall(threshold, recall, bits_per_table)
+    n_bits = n_tables * bits_per_table
+    
+    signatures, constant = simhash_signatures(values, n_bits, seed)
+    rows, cols = candidate_pairs(signatures, n_tables, bits_per_table, exclude=constant)
+    
+    # Disagreement expected for a pair at the threshold, plus a few standard deviations
+    expected = np.arccos(threshold) / np.pi
+    max_distance = expected + _SIGNATURE_FILTER_SIGMAS * np.sqrt(expected * (1 - expected) / n_bits)
+    close = signature_distances(signatures, rows, cols) <= max_distance
+    rows, cols = rows[close], cols[close]
+    
+    with np.errstate(invalid='ignore'):
+        keep = np.abs(pair_correlations(values, rows, cols)) >= threshold
+    return rows[keep], cols[keep]
+
+def approximate_correlated_features(df: pd.DataFrame, threshold: float, recall: float = DEFAULT_RECALL,
+                                    seed: Optional[int] = None, as_indices: bool = False) -> Union[List[Tuple[str, str]], Tuple[np.ndarray, np.ndarray]]:
+    """
+    Find pairs of numerical features with correlation above the threshold, for very wide data.
+    
+    Approximate counterpart of identify_highly_correlated_features that reads the data
+    instead of a correlation matrix, which would not fit in memory for 100k+ columns.
+    
+    Args:
+        df (pd.DataFrame): Input DataFrame; only numerical columns are compared
+        threshold (float): Correlation threshold to consider features as correlated
+        recall (float): Target recall for pairs correlated at the threshold; higher is slower
+        seed (Optional[int]): Random seed
+        as_indices (bool): If True, return positions among the numerical columns instead of name tuples
+    
+    Returns:
+        Union[List[Tuple[str, str]], Tuple[np.ndarray, np.ndarray]]: Feature pairs that are highly correlated
+    """
+    numeric_df = df.select_dtypes(include=['number'])
+    values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+    rows, cols = find_correlated_pairs(values, threshold, recall, seed=seed)
+    
+    if as_indices:
+        return rows, cols
+    
+    columns = numeric_df.columns
+    return list(zip(columns[rows].tolist(), columns[cols].tolist()))
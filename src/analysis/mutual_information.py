@@ -0,0 +1,168 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+import numpy as np
+import pandas as pd
+from .correlation import scores_from_correlations
+
+# Quantile bins per numerical column; enough to capture non-linear shapes without
+# starving the joint histogram on moderately sized files
+DEFAULT_N_BINS = 32
+
+# Rows per cell of the joint histogram below which fewer bins are used; sparser
+# histograms make every column look informative
+MIN_ROWS_PER_CELL = 5
+
+# Shuffles of the target whose mean mutual information with a feature estimates the part of
+# its score that is only due to the number of bins and the number of rows
+DEFAULT_N_PERMUTATIONS = 8
+
+def discretize_column(column: pd.Series, n_bins: int = DEFAULT_N_BINS) -> Tuple[np.ndarray, int]:
+    """
+    Map a column to integer codes suitable for histogram-based mutual information.
+    
+    Numerical columns are cut at their quantiles, so every bin holds about the same number
+    of rows; columns with few distinct values keep one code per value. Categorical columns
+    keep one code for each of their n_bins most frequent categories and collapse the others
+    into a shared 'other' code, like apply_one_hot_encoding. Missing values get a code of
+    their own.
+    
+    Args:
+        column (pd.Series): Numerical or categorical column
+        n_bins (int): Maximum number of bins for numerical columns and of categories kept for categorical columns
+    
+    Returns:
+        Tuple[np.ndarray, int]: (codes in [0, n_codes), n_codes)
+    """
+    if n_bins <= 0:
+        raise ValueError("n_bins must be a positive integer")
+    
+    if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+        values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+        missing = np.isnan(values)
+        present = values[~missing]
+        if len(present) == 0:
+            return np.zeros(len(values), dtype=np.intp), 1
+        edges = np.unique(np.quantile(present, np.linspace(0, 1, n_bins + 1)[1:-1]))
+        codes = np.searchsorted(edges, values, side='right')
+        n_codes = len(edges) + 1
+    else:
+        codes, categories = pd.factorize(column)
+        missing = codes < 0
+        n_codes = len(categories)
+        if n_codes > n_bins:
+            # Without a cap, an ID-like column gets a code per row and looks perfectly informative
+            counts = np.bincount(codes[~missing], minlength=n_codes)
+            remap = np.full(n_codes, n_bins)
+            remap[np.argsort(-counts, kind='stable')[:n_bins]] = np.arange(n_bins)
+            codes = remap[codes]
+            n_codes = n_bins + 1
+    
+    if missing.any():
+        codes = np.where(missing, n_codes, codes)
+        n_codes += 1
+    return codes.astype(np.intp), n_codes
+
+def mutual_information(x_codes: np.ndarray, x_levels: int, y_codes: np.ndarray, y_levels: int) -> Tuple[float, float, float]:
+    """
+    Mutual information between two discretized columns from their joint histogram.
+    
+    Args:
+        x_codes (np.ndarray): Codes of the first column
+        x_levels (int): Number of codes of the first column
+        y_codes (np.ndarray): Codes of the second column, same length
+        y_levels (int): Number of codes of the second column
+    
+    Returns:
+        Tuple[float, float, float]: (mutual information, entropy of x, entropy of y), in nats
+    """
+    joint = np.bincount(x_codes * y_levels + y_codes, minlength=x_levels * y_levels).reshape(x_levels, y_levels)
+    n_rows = joint.sum()
+    if n_rows == 0:
+        return 0.0, 0.0, 0.0
+    
+    p_joint = joint / n_rows
+    p_x = p_joint.sum(axis=1)
+    p_y = p_joint.sum(axis=0)
+    
+    nonzero = p_joint > 0
+    outer = np.outer(p_x, p_y)
+    mi = float(np.sum(p_joint[nonzero] * np.log(p_joint[nonzero] / outer[nonzero])))
+    h_x = float(-np.sum(p_x[p_x > 0] * np.log(p_x[p_x > 0])))
+    h_y = float(-np.sum(p_y[p_y > 0] * np.log(p_y[p_y > 0])))
+    return max(mi, 0.0), h_x, h_y
+
+def compute_mutual_information_scores(df: pd.DataFrame, target_column: str, n_bins: int = DEFAULT_N_BINS,
+                                      n_jobs: int = 1, top_k: Optional[int] = None,
+                                      min_score: Optional[float] = None,
+                                      n_permutations: int = DEFAULT_N_PERMUTATIONS) -> pd.DataFrame:
+    """
+    Calculate mutual-information scores between every feature and the target variable.
+    
+    Numerical and categorical features are both scored, so non-linear and categorical
+    relationships that correlation misses are ranked too. Columns are discretized with
+    quantile bins (fewer than n_bins on small files, so that joint histograms keep about
+    MIN_ROWS_PER_CELL rows per cell) and the mutual information is read from joint
+    histograms, which costs O(n_rows) per feature.
+    
+    The plug-in estimate grows with the number of codes even for independent columns, so the
+    mean mutual information with shuffled copies of the target is subtracted, as in adjusted
+    mutual information. Scores are normalized by the geometric mean of both entropies, giving
+    values in [0, 1] that can be passed to rank_features_by_correlation; features no better
+    than chance score 0.
+    
+    Args:
+        df (pd.DataFrame): Input DataFrame with features and target
+        target_column (str): Name of the target column, numerical or categorical
+        n_bins (int): Maximum number of quantile bins for numerical columns
+        n_jobs (int): Number of worker threads scoring features in parallel
+        top_k (Optional[int]): If set, keep only the top_k features with the highest score
+        min_score (Optional[float]): If set, drop features scoring below this value
+        n_permutations (int): Number of shuffles of the target estimating the chance level of each score;
+                              0 disables the correction
+    
+    Returns:
+        pd.DataFrame: DataFrame with columns ['feature', 'importance_score']
+                     where importance_score is the normalized mutual information with the target
+    """
+    if n_jobs <= 0:
+        raise ValueError("n_jobs must be a positive integer")
+    if n_permutations < 0:
+        raise ValueError("n_permutations must be a non-negative integer")
+    
+    if df.empty:
+        return pd.DataFrame(columns=['feature', 'importance_score'])
+    
+    if target_column not in df.columns:
+        raise ValueError(f"Target column '{target_column}' not found in DataFrame")
+    
+    # Rows without a target value carry no information about it
+    df = df[df[target_column].notna()]
+    n_bins = min(n_bins, max(2, int(np.sqrt(len(df) / MIN_ROWS_PER_CELL))))
+    target_codes, target_levels = discretize_column(df[target_column], n_bins)
+    features = [col for col in df.columns if col != target_column]
+    # Fixed seed, so that scores are reproducible and equal in serial and parallel runs
+    rng = np.random.default_rng(0)
+    shuffled_targets = [rng.permutation(target_codes) for _ in range(n_permutations)]
+    
+    def score(feature: str) -> float:
+        codes, levels = discretize_column(df[feature], n_bins)
+        mi, h_feature, h_target = mutual_information(codes, levels, target_codes, target_levels)
+        if h_feature == 0 or h_target == 0:
+            return 0.0
+        chance = np.mean([mutual_information(codes, levels, shuffled, target_levels)[0]
+                          for shuffled in shuffled_targets]) if shuffled_targets else 0.0
+        upper = np.sqrt(h_feature * h_target)
+        if mi >= upper:
+            return 1.0
+        if upper <= chance:
+            return 0.0
+        return float(np.clip((mi - chance) / (upper - chance), 0.0, 1.0))
+    
+    if n_jobs == 1 or len(features) < 2:
+        scores = [score(feature) for feature in features]
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            scores = list(executor.map(score, features))
+    
+    scores = pd.Series(scores, index=pd.Index(features), name=target_column, dtype=np.float64)
+    return scores_from_correlations(scores, target_column, top_k, min_score)
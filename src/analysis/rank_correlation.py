@@ -0,0 +1,152 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import numpy as np
+from .blocked import DEFAULT_BLOCK_SIZE, blocked_correlation, target_correlation
+
+CORRELATION_METHODS = ('pearson', 'spearman', 'kendall')
+
+def check_correlation_method(method: str) -> None:
+    """Raise ValueError for an unsupported correlation method."""
+    if method not in CORRELATION_METHODS:
+        raise ValueError(f"Unknown correlation method '{method}', expected one of: {', '.join(CORRELATION_METHODS)}")
+
+def rank_columns(values: np.ndarray) -> np.ndarray:
+    """
+    Replace the values of each column by their ranks, ties receiving the average rank.
+    
+    Missing values stay NaN and are ignored when ranking the present values.
+    
+    Args:
+        values (np.ndarray): Array of shape (n_rows, n_columns), NaN marking missing values
+    
+    Returns:
+        np.ndarray: Ranks of shape (n_rows, n_columns), starting at 1 in every column
+    """
+    # Columns are ranked as contiguous rows of the transpose; a stable sort is not needed
+    # because tied values all receive the same average rank
+    columns = np.ascontiguousarray(np.asarray(values, dtype=np.float64).T)
+    n_rows = columns.shape[1]
+    order = np.argsort(columns, axis=1)
+    sorted_values = np.take_along_axis(columns, order, axis=1)
+    
+    # Positions of the first and last element of each run of tied values
+    positions = np.arange(n_rows)
+    starts_run = np.ones(columns.shape, dtype=bool)
+    starts_run[:, 1:] = sorted_values[:, 1:] != sorted_values[:, :-1]
+    ends_run = np.ones(columns.shape, dtype=bool)
+    ends_run[:, :-1] = starts_run[:, 1:]
+    first = np.maximum.accumulate(np.where(starts_run, positions, 0), axis=1)
+    last = np.minimum.accumulate(np.where(ends_run, positions, n_rows)[:, ::-1], axis=1)[:, ::-1]
+    
+    average = (first + last) / 2 + 1
+    average[np.isnan(sorted_values)] = np.nan
+    ranks = np.empty_like(columns)
+    np.put_along_axis(ranks, order, average, axis=1)
+    return ranks.T
+
+def spearman_correlation(values: np.ndarray, block_size: int = DEFAULT_BLOCK_SIZE, n_jobs: int = 1,
+                         dtype: np.dtype = np.float64, pairwise: Optional[bool] = None) -> np.ndarray:
+    """
+    Compute the Spearman rank correlation matrix of the columns of an array.
+    
+    Every column is ranked once and the ranks go through the blocked Pearson computation,
+    instead of ranking both columns again for every pair. Without missing values the result
+    equals DataFrame.corr(method='spearman'); with missing values, each column is ranked over
+    all of its present values rather than over the rows shared with the other column.
+    
+    Args:
+        values (np.ndarray): Array of shape (n_rows, n_columns), NaN marking missing values
+        block_size (int): Number of columns per tile
+        n_jobs (int): Number of worker threads
+        dtype (np.dtype): Floating point type of the standardized ranks
+        pairwise (Optional[bool]): Missing value handling, see blocked_correlation
+    
+    Returns:
+        np.ndarray: Correlation matrix of shape (n_columns, n_columns)
+    """
+    return blocked_correlation(rank_columns(values), block_size=block_size, n_jobs=n_jobs, dtype=dtype, pairwise=pairwise)
+
+def spearman_target_correlation(values: np.ndarray, target: np.ndarray, block_size: int = DEFAULT_BLOCK_SIZE) -> np.ndarray:
+    """
+    Compute the Spearman rank correlation of every column of an array with a target vector.
+    
+    Args:
+        values (np.ndarray): Array of shape (n_rows, n_columns), NaN marking missing values
+        target (np.ndarray): Array of shape (n_rows,)
+        block_size (int): Number of columns processed at a time
+    
+    Returns:
+        np.ndarray: Correlations of shape (n_columns,)
+    """
+    target_ranks = rank_columns(np.asarray(target, dtype=np.float64).reshape(-1, 1))[:, 0]
+    return target_correlation(rank_columns(values), target_ranks, block_size=block_size)
+
+def kendall_tau(x: np.ndarray, y: np.ndarray) -> float:
+    """
+    Kendall's tau-b between two vectors over the rows where both are present.
+    
+    Uses scipy's implementation of Knight's O(n log n) algorithm, which sorts the pairs
+    and counts discordant pairs with a merge sort, instead of comparing all n^2 pairs.
+    
+    Args:
+        x (np.ndarray): Array of shape (n_rows,)
+        y (np.ndarray): Array of shape (n_rows,)
+    
+    Returns:
+        float: Correlation in [-1, 1], NaN if fewer than two rows remain or either vector is constant
+    """
+    from scipy.stats import kendalltau
+    
+    present = ~(np.isnan(x) | np.isnan(y))
+    if present.sum() < 2:
+        return np.nan
+    return float(kendalltau(x[present], y[present]).statistic)
+
+def kendall_correlation(values: np.ndarray, n_jobs: int = 1) -> np.ndarray:
+    """
+    Compute the Kendall tau-b correlation matrix of the columns of an array.
+    
+    Each of the n_columns * (n_columns - 1) / 2 pairs costs O(n_rows log n_rows). Missing
+    values are handled pairwise, like DataFrame.corr(method='kendall').
+    
+    Args:
+        values (np.ndarray): Array of shape (n_rows, n_columns), NaN marking missing values
+        n_jobs (int): Number of worker threads
+    
+    Returns:
+        np.ndarray: Correlation matrix of shape (n_columns, n_columns)
+    """
+    if n_jobs <= 0:
+        raise ValueError("n_jobs must be a positive integer")
+    
+    values = np.asfortranarray(values, dtype=np.float64)
+    n_columns = values.shape[1]
+    result = np.full((n_columns, n_columns), np.nan)
+    
+    def fill_row(i: int) -> None:
+        for j in range(i, n_columns):
+            result[i, j] = result[j, i] = kendall_tau(values[:, i], values[:, j])
+    
+    if n_jobs == 1:
+        for i in range(n_columns):
+            fill_row(i)
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            list(executor.map(fill_row, range(n_columns)))
+    
+    return np.clip(result, -1.0, 1.0)
+
+def kendall_target_correlation(values: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """
+    Compute the Kendall tau-b correlation of every column of an array with a target vector.
+    
+    Args:
+        values (np.ndarray): Array of shape (n_rows, n_columns), NaN marking missing values
+        target (np.ndarray): Array of shape (n_rows,)
+    
+    Returns:
+        np.ndarray: Correlations of shape (n_columns,)
+    """
+    target = np.asarray(target, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    return np.array([kendall_tau(values[:, i], target) for i in range(values.shape[1])], dtype=np.float64)
@@ -0,0 +1,117 @@
+from typing import List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .blocked import pairwise_block_correlation
+from .rank_correlation import check_correlation_method, rank_columns
+from .ranking import rank_features_by_correlation
+
+# Same default as group_correlated_features
+DEFAULT_REDUNDANCY_THRESHOLD = 0.8
+
+# Candidates whose correlations with the kept features are computed at a time
+DEFAULT_CANDIDATE_BLOCK_SIZE = 64
+
+def select_non_redundant_features(values: np.ndarray, order: np.ndarray, threshold: float = DEFAULT_REDUNDANCY_THRESHOLD,
+                                  max_features: Optional[int] = None, block_size: int = DEFAULT_CANDIDATE_BLOCK_SIZE,
+                                  rank: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Walk candidate columns from best to worst and keep those not correlated with a kept column.
+    
+    A candidate whose absolute correlation with an already kept (better scoring) column is
+    at least threshold joins that column's group, so every group is represented by its best
+    scoring member. Candidates are processed in blocks: only the correlations between a
+    block and the columns kept so far are computed, never the full matrix, and the walk
+    stops as soon as max_features columns are kept. Unlike group_correlated_features,
+    groups are not transitive: two columns that are only linked through a dropped third
+    column are both kept.
+    
+    Args:
+        values (np.ndarray): Array of shape (n_rows, n_columns), NaN marking missing values
+        order (np.ndarray): Positions of the candidate columns, best scoring first
+        threshold (float): Absolute correlation from which a candidate is redundant
+        max_features (Optional[int]): If set, stop after keeping this many columns
+        block_size (int): Number of candidates per block
+        rank (bool): If True, compare column ranks (Spearman) instead of values (Pearson)
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (positions of the kept columns in candidate order, position of the
+                                       kept column representing each column; -1 for columns never reached)
+    """
+    if threshold < 0 or threshold > 1:
+        raise ValueError("Threshold must be between 0 and 1")
+    if block_size <= 0:
+        raise ValueError("block_size must be a positive integer")
+    
+    order = np.asarray(order, dtype=np.intp)
+    representatives = np.full(values.shape[1], -1, dtype=np.intp)
+    kept: List[int] = []
+    # Columns (or ranks) of the kept features, gathered once as they are kept
+    kept_values = np.empty((values.shape[0], 0))
+    
+    for start in range(0, len(order), block_size):
+        if max_features is not None and len(kept) >= max_features:
+            break
+        block = order[start:start + block_size]
+        candidates = np.asarray(values[:, block], dtype=np.float64)
+        if rank:
+            candidates = rank_columns(candidates)
+        
+        with np.errstate(invalid='ignore'):
+            # Earlier kept columns score higher than any column of this block, so they are checked first
+            against_kept = np.abs(pairwise_block_correlation(candidates, kept_values)) >= threshold
+            within_block = np.abs(pairwise_block_correlation(candidates, candidates)) >= threshold
+        
+        block_kept: List[int] = []
+        for i, position in enumerate(block.tolist()):
+            if max_features is not None and len(kept) + len(block_kept) >= max_features:
+                break
+            matches = np.flatnonzero(against_kept[i])
+            if len(matches):
+                representatives[position] = kept[matches[0]]
+                continue
+            matches = [j for j in block_kept if within_block[i, j]]
+            if matches:
+                representatives[position] = block[matches[0]]
+                continue
+            block_kept.append(i)
+            representatives[position] = position
+        
+        kept.extend(block[block_kept].tolist())
+        kept_values = np.hstack([kept_values, candidates[:, block_kept]])
+    
+    return np.asarray(kept, dtype=np.intp), representatives
+
+def prune_redundant_features(correlation_df: pd.DataFrame, values: np.ndarray, columns: List[str],
+                             threshold: float = DEFAULT_REDUNDANCY_THRESHOLD, top_k: Optional[int] = None,
+                             method: str = 'pearson') -> pd.DataFrame:
+    """
+    Keep one representative per group of mutually correlated features and rank the kept features.
+    
+    Args:
+        correlation_df (pd.DataFrame): Scores with columns ['feature', 'importance_score'], e.g. from
+                                       compute_correlation_scores without top_k
+        values (np.ndarray): Array of shape (n_rows, len(columns)) holding at least the scored features
+        columns (List[str]): Names of the columns of values
+        threshold (float): Absolute feature-feature correlation from which features are redundant
+        top_k (Optional[int]): If set, keep only the top_k best scoring representatives
+        method (str): 'pearson', or 'spearman' to compare features by their ranks; 'kendall' is rejected,
+                      as tau thresholds are not comparable with the rho used between features
+    
+    Returns:
+        pd.DataFrame: DataFrame with columns ['feature', 'importance_score', 'rank'] of the representatives
+    """
+    check_correlation_method(method)
+    if method == 'kendall':
+        raise ValueError("Redundancy pruning supports the pearson and spearman methods, not kendall")
+    if top_k is not None and top_k < 0:
+        raise ValueError("top_k must be a non-negative integer")
+    
+    correlation_df = correlation_df.sort_values('importance_score', ascending=False, kind='stable')
+    positions = pd.Index(columns).get_indexer(correlation_df['feature'])
+    if (positions < 0).any():
+        raise ValueError("Every scored feature must be a column of values")
+    
+    kept, _ = select_non_redundant_features(values, positions, threshold, max_features=top_k,
+                                            rank=method == 'spearman')
+    kept_df = correlation_df.iloc[pd.Index(positions).get_indexer(kept)]
+    return rank_features_by_correlation(kept_df)
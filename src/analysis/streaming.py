@@ -0,0 +1,282 @@
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+@dataclass
+class CorrelationState:
+    """
+    Pairwise sufficient statistics for Pearson correlations between numerical columns.
+    
+    Every matrix is indexed by [i, j] and only accounts for rows where both column i
+    and column j are present, which reproduces the pairwise-NaN semantics of
+    DataFrame.corr().
+    
+    Attributes:
+        columns (List[str]): Column names, in matrix order
+        n_rows (int): Total number of rows seen, including rows with missing values
+        count (np.ndarray): Number of rows where both columns are present
+        mean (np.ndarray): Mean of column i over those rows
+        m2 (np.ndarray): Sum of squared deviations of column i over those rows
+        comoment (np.ndarray): Sum of cross deviations of columns i and j over those rows
+    """
+    columns: List[str]
+    n_rows: int
+    count: np.ndarray
+    mean: np.ndarray
+    m2: np.ndarray
+    comoment: np.ndarray
+
+def pairwise_moments(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Compute pairwise-complete moments between the columns of two 2-D arrays.
+    
+    Missing values (NaN) are handled pairwise: entry [i, j] of every result only uses
+    rows where both x[:, i] and y[:, j] are present. Columns are shifted by their own
+    mean before accumulating to limit floating point cancellation.
+    
+    Args:
+        x (np.ndarray): Array of shape (n_rows, p)
+        y (np.ndarray): Array of shape (n_rows, q)
+        
+    Returns:
+        Tuple[np.ndarray, ...]: (count, mean_x, mean_y, m2_x, m2_y, comoment), each of shape (p, q)
+    """
+    mask_x = ~np.isnan(x)
+    mask_y = ~np.isnan(y)
+    shift_x = _column_shift(x, mask_x)
+    shift_y = _column_shift(y, mask_y)
+    x0 = np.where(mask_x, x - shift_x, 0.0)
+    y0 = np.where(mask_y, y - shift_y, 0.0)
+    fx = mask_x.astype(x0.dtype)
+    fy = mask_y.astype(y0.dtype)
+    
+    count = fx.T @ fy
+    sum_x = x0.T @ fy
+    sum_y = fx.T @ y0
+    sq_x = (x0 * x0).T @ fy
+    sq_y = fx.T @ (y0 * y0)
+    cross = x0.T @ y0
+    
+    safe_count = np.where(count > 0, count, 1.0)
+    mean_x = np.where(count > 0, sum_x / safe_count + shift_x[:, None], 0.0)
+    mean_y = np.where(count > 0, sum_y / safe_count + shift_y[None, :], 0.0)
+    m2_x = np.maximum(sq_x - sum_x * sum_x / safe_count, 0.0)
+    m2_y = np.maximum(sq_y - sum_y * sum_y / safe_count, 0.0)
+    comoment = cross - sum_x * sum_y / safe_count
+    
+    return count, mean_x, mean_y, m2_x, m2_y, comoment
+
+def _column_shift(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Per-column mean of the present values, 0 for columns without any."""
+    present = mask.sum(axis=0)
+    totals = np.where(mask, values, 0.0).sum(axis=0)
+    return np.divide(totals, present, out=np.zeros(values.shape[1]), where=present > 0)
+
+def compute_chunk_state(df: pd.DataFrame) -> CorrelationState:
+    """
+    Compute the correlation state of a single in-memory chunk of numerical columns.
+    
+    Args:
+        df (pd.DataFrame): DataFrame containing only numerical columns
+        
+    Returns:
+        CorrelationState: Sufficient statistics for the chunk
+    """
+    values = df.to_numpy(dtype=np.float64, na_value=np.nan)
+    count, mean, _, m2, _, comoment = pairwise_moments(values, values)
+    return CorrelationState(
+        columns=df.columns.tolist(),
+        n_rows=len(df),
+        count=count,
+        mean=mean,
+        m2=m2,
+        comoment=comoment
+    )
+
+def merge_correlation_states(left: CorrelationState, right: CorrelationState) -> CorrelationState:
+    """
+    Combine the statistics of two disjoint sets of rows (Chan et al. parallel update).
+    
+    Args:
+        left (CorrelationState): Statistics of the first set of rows
+        right (CorrelationState): Statistics of the second set of rows, same columns
+        
+    Returns:
+        CorrelationState: Statistics of the union of both sets of rows
+    """
+    if left.columns != right.columns:
+        raise ValueError("Correlation states must have the same columns to be merged")
+    
+    count = left.count + right.count
+    safe_count = np.where(count > 0, count, 1.0)
+    weight = left.count * right.count / safe_count
+    delta = right.mean - left.mean
+    
+    return CorrelationState(
+        columns=list(left.columns),
+        n_rows=left.n_rows + right.n_rows,
+        count=count,
+        mean=left.mean + delta * right.count / safe_count,
+        m2=left.m2 + right.m2 + delta * delta * weight,
+        comoment=left.comoment + right.comoment + delta * delta.T * weight
+    )
+
+def accumulate_correlation_state(chunks: Iterable[pd.DataFrame]) -> CorrelationState:
+    """
+    Accumulate correlation statistics over an iterable of DataFrame chunks.
+    
+    A column is treated as numerical only if it is numerical in every chunk, matching the
+    dtype pandas would infer when reading the whole file at once. Peak memory is bounded
+    by the chunk size and the number of columns.
+    
+    Args:
+        chunks (Iterable[pd.DataFrame]): Chunks sharing the same columns, e.g. from pd.read_csv(chunksize=...)
+        
+    Returns:
+        CorrelationState: Statistics for the numerical columns over all chunks
+    """
+    state = None
+    non_numeric = set()
+    columns: List[str] = []
+    
+    for chunk in chunks:
+        if state is None:
+            columns = chunk.columns.tolist()
+        non_numeric.update(chunk.select_dtypes(exclude=['number']).columns)
+        
+        # Non-numerical values are masked out; those columns are dropped at the end
+        numeric_chunk = chunk.reindex(columns=columns)
+        numeric_chunk = numeric_chunk.assign(**{col: np.nan for col in non_numeric})
+        chunk_state = compute_chunk_state(numeric_chunk)
+        state = chunk_state if state is None else merge_correlation_states(state, chunk_state)
+    
+    if state is None:
+        return compute_chunk_state(pd.DataFrame())
+    
+    return select_state_columns(state, [col for col in columns if col not in non_numeric])
+
+def update_correlation_state(state: CorrelationState, chunks: Iterable[pd.DataFrame]) -> CorrelationState:
+    """
+    Merge the statistics of newly appended rows into an existing correlation state.
+    
+    Only the new rows are read, so the cost is proportional to their number. Columns that
+    are not numerical in the new rows are dropped, as they would be by a full recompute.
+    
+    Args:
+        state (CorrelationState): Statistics of the rows seen so far
+        chunks (Iterable[pd.DataFrame]): Chunks of the appended rows, with the same columns as the original data
+        
+    Returns:
+        CorrelationState: Statistics of the old and new rows together
+    """
+    appended = accumulate_correlation_state(chunk for chunk in chunks if len(chunk))
+    if appended.n_rows == 0:
+        return state
+    
+    columns = [col for col in state.columns if col in appended.columns]
+    return merge_correlation_states(select_state_columns(state, columns), select_state_columns(appended, columns))
+
+def save_correlation_state(state: CorrelationState, path: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Persist a correlation state, with optional JSON-serializable metadata, as a .npz file.
+    
+    Args:
+        state (CorrelationState): Correlation state
+        path (str): Destination file; written atomically
+        metadata (Optional[Dict[str, Any]]): Extra information stored alongside the statistics
+    """
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, 'wb') as f:
+        np.savez(
+            f,
+            columns=np.array([str(col) for col in state.columns]),
+            n_rows=np.array(state.n_rows),
+            count=state.count,
+            mean=state.mean,
+            m2=state.m2,
+            comoment=state.comoment,
+            metadata=np.array(json.dumps(metadata or {}))
+        )
+    os.replace(temporary_path, path)
+
+def load_correlation_state(path: str) -> Tuple[CorrelationState, Dict[str, Any]]:
+    """
+    Load a correlation state written by save_correlation_state.
+    
+    Args:
+        path (str): File written by save_correlation_state
+        
+    Returns:
+        Tuple[CorrelationState, Dict[str, Any]]: (correlation state, metadata)
+    """
+    with np.load(path, allow_pickle=False) as data:
+        state = CorrelationState(
+            columns=data['columns'].tolist(),
+            n_rows=int(data['n_rows']),
+            count=data['count'],
+            mean=data['mean'],
+            m2=data['m2'],
+            comoment=data['comoment']
+        )
+        metadata = json.loads(str(data['metadata']))
+    return state, metadata
+
+def select_state_columns(state: CorrelationState, columns: List[str]) -> CorrelationState:
+    """
+    Restrict a correlation state to a subset of its columns.
+    
+    Args:
+        state (CorrelationState): Correlation state
+        columns (List[str]): Columns to keep, in the desired order
+        
+    Returns:
+        CorrelationState: Correlation state for the selected columns
+    """
+    positions = [state.columns.index(col) for col in columns]
+    grid = np.ix_(positions, positions)
+    return CorrelationState(
+        columns=list(columns),
+        n_rows=state.n_rows,
+        count=state.count[grid],
+        mean=state.mean[grid],
+        m2=state.m2[grid],
+        comoment=state.comoment[grid]
+    )
+
+def handle_missing_values_state(state: CorrelationState, threshold: float) -> Tuple[CorrelationState, List[str]]:
+    """
+    Remove columns that have missing values above the specified threshold.
+    
+    Streaming counterpart of handle_missing_values, using the per-column counts of the state.
+    
+    Args:
+        state (CorrelationState): Correlation state
+        threshold (float): Maximum percentage of missing values allowed (0-1)
+        
+    Returns:
+        Tuple[CorrelationState, List[str]]: State with columns removed and list of removed column names
+    """
+    present = np.diag(state.count)
+    missing_percentages = 1 - present / state.n_rows if state.n_rows else np.zeros(len(present))
+    columns_to_remove = [col for col, pct in zip(state.columns, missing_percentages) if pct > threshold]
+    kept = [col for col in state.columns if col not in columns_to_remove]
+    return select_state_columns(state, kept), columns_to_remove
+
+def correlation_matrix_from_state(state: CorrelationState) -> pd.DataFrame:
+    """
+    Compute the Pearson correlation matrix described by a correlation state.
+    
+    Args:
+        state (CorrelationState): Correlation state
+        
+    Returns:
+        pd.DataFrame: Correlation matrix, equivalent to DataFrame.corr() over the same rows
+    """
+    denominator = np.sqrt(state.m2 * state.m2.T)
+    valid = (state.count > 0) & (denominator > 0)
+    correlations = np.divide(state.comoment, denominator, out=np.full(denominator.shape, np.nan), where=valid)
+    correlations = np.clip(correlations, -1.0, 1.0)
+    return pd.DataFrame(correlations, index=state.columns, columns=state.columns)
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+
+import argparse
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .main import Response
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Times a job is run alone before a crashing worker is blamed on it
+_MAX_ATTEMPTS = 2
+
+@dataclass
+class BatchJob:
+    """
+    One file to analyze in a batch.
+    
+    Attributes:
+        filename (str): Name of the CSV file in the data directory
+        target_column (str): Name of the column to predict
+    """
+    filename: str
+    target_column: str
+
+def jobs_from_glob(pattern: str, target_column: str) -> List[BatchJob]:
+    """
+    Create one job per file of the data directory matching a glob pattern.
+    
+    Args:
+        pattern (str): Glob pattern relative to the data directory, e.g. 'daily/*.csv'
+        target_column (str): Name of the column to predict in every file
+    
+    Returns:
+        List[BatchJob]: Jobs in sorted filename order
+    """
+    paths = sorted(glob.glob(os.path.join('data', pattern), recursive=True))
+    return [BatchJob(os.path.relpath(path, 'data'), target_column) for path in paths if os.path.isfile(path)]
+
+def jobs_from_manifest(manifest_path: str) -> List[BatchJob]:
+    """
+    Read jobs from a CSV manifest with 'filename' and 'target_column' columns.
+    
+    Args:
+        manifest_path (str): Path of the manifest file
+    
+    Returns:
+        List[BatchJob]: Jobs in manifest order
+    """
+    import pandas as pd
+    
+    manifest = pd.read_csv(manifest_path, dtype=str)
+    missing = {'filename', 'target_column'} - set(manifest.columns)
+    if missing:
+        raise ValueError(f"Manifest '{manifest_path}' is missing columns: {', '.join(sorted(missing))}")
+    return [BatchJob(row.filename, row.target_column) for row in manifest.itertuples(index=False)]
+
+def run_batch(jobs: List[BatchJob], max_workers: Optional[int] = None, memory_limit_mb: Optional[int] = None,
+              **options: Any) -> Iterator[Tuple[BatchJob, 'Response']]:
+    """
+    Analyze many files in a pool of worker processes, yielding results as they complete.
+    
+    Workers import pandas and the analysis code once and then serve many jobs, so the
+    per-file cost is the analysis itself. Any exception raised while analyzing a file,
+    including MemoryError when the memory limit is hit, becomes an error Response for that
+    job. If a worker dies outright, the jobs the broken pool left unfinished are rerun one
+    at a time in a fresh single-worker pool, so only the job that crashes is reported as failed.
+    
+    Args:
+        jobs (List[BatchJob]): Files to analyze
+        max_workers (Optional[int]): Number of worker processes (default: number of CPUs)
+        memory_limit_mb (Optional[int]): Address space limit of each worker in megabytes, None for no limit
+        **options: Keyword arguments passed to analyze_features, e.g. top_k or chunksize
+    
+    Yields:
+        Tuple[BatchJob, Response]: Each job with its response, in completion order
+    """
+    from .main import Response
+    
+    # A worker dying breaks the whole pool and fails every unfinished job, not only its own
+    suspects: List[int] = []
+    with _new_pool(max_workers, memory_limit_mb) as executor:
+        futures = {}
+        try:
+            for i, job in enumerate(jobs):
+                futures[executor.submit(run_job, job, options)] = i
+        except BrokenProcessPool:
+            suspects.extend(range(len(futures), len(jobs)))
+        
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                response = future.result()
+            except BrokenProcessPool:
+                suspects.append(i)
+                continue
+            except Exception as e:
+                response = Response(success=False, result=[],
+                                    error_message=f"Error analyzing '{jobs[i].filename}': {e}")
+            yield jobs[i], response
+    
+    yield from _run_isolated(jobs, sorted(suspects), options, memory_limit_mb)
+
+def _run_isolated(jobs: List[BatchJob], indices: List[int], options: Dict[str, Any],
+                  memory_limit_mb: Optional[int]) -> Iterator[Tuple[BatchJob, 'Response']]:
+    """Rerun jobs one at a time in a single-worker pool, so a crash is only charged to the job that caused it."""
+    from .main import Response
+    
+    executor = None
+    try:
+        for i in indices:
+            response = None
+            for _ in range(_MAX_ATTEMPTS):
+                if executor is None:
+                    executor = _new_pool(1, memory_limit_mb)
+                try:
+                    response = executor.submit(run_job, jobs[i], options).result()
+                    break
+                except BrokenProcessPool:
+                    executor.shutdown()
+                    executor = None
+                except Exception as e:
+                    response = Response(success=False, result=[],
+                                        error_message=f"Error analyzing '{jobs[i].filename}': {e}")
+                    break
+            if response is None:
+                response = Response(success=False, result=[],
+                                    error_message=f"Worker process died while analyzing '{jobs[i].filename}'")
+            yield jobs[i], response
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+def _new_pool(max_workers: Optional[int], memory_limit_mb: Optional[int]) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=max_workers, initializer=limit_worker_memory, initargs=(memory_limit_mb,))
+
+def response_to_json(job: BatchJob, response: 'Response') -> str:
+    """
+    Serialize the outcome of a job as a single JSON line.
+    
+    Args:
+        job (BatchJob): Analyzed job
+        response (Response): Its response
+    
+    Returns:
+        str: JSON object without a trailing newline
+    """
+    return json.dumps(response_to_record(job, response))
+
+def response_to_record(job: BatchJob, response: 'Response') -> Dict[str, Any]:
+    """JSON-serializable dictionary describing the outcome of a job."""
+    record: Dict[str, Any] = {
+        'filename': job.filename,
+        'target_column': job.target_column,
+        'success': response.success,
+        'result': response.result,
+        'error_message': response.error_message
+    }
+    if response.profile is not None:
+        record['profile'] = response.profile
+    return record
+
+def run_job(job: BatchJob, options: Dict[str, Any]) -> 'Response':
+    """
+    Analyze one job inside a worker, turning any failure into an error Response.
+    
+    Args:
+        job (BatchJob): File and target column to analyze
+        options (Dict[str, Any]): Keyword arguments for analyze_features
+    
+    Returns:
+        Response: Result of analyze_features, or an error Response if it raised
+    """
+    from .main import analyze_features, Response
+    
+    try:
+        return analyze_features(job.filename, job.target_column, **options)
+    except MemoryError:
+        return Response(success=False, result=[], error_message=f"Out of memory analyzing '{job.filename}'")
+    except Exception as e:
+        return Response(success=False, result=[], error_message=f"Error analyzing '{job.filename}': {e}")
+
+def limit_worker_memory(memory_limit_mb: Optional[int]) -> None:
+    """
+    Pool initializer capping the address space of the worker process.
+    
+    Does nothing where the resource module is unavailable, e.g. on Windows.
+    
+    Args:
+        memory_limit_mb (Optional[int]): Address space limit in megabytes, None for no limit
+    """
+    if memory_limit_mb is None or resource is None:
+        return
+    limit = memory_limit_mb * 1024 ** 2
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Analyze many CSV files from the data directory in a pool of worker processes.'
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        '--glob',
+        metavar='PATTERN',
+        help="Glob pattern relative to the data directory, e.g. 'daily/*.csv' (requires --target)"
+    )
+    source.add_argument(
+        '--manifest',
+        metavar='PATH',
+        help="CSV file with 'filename' and 'target_column' columns"
+    )
+    parser.add_argument(
+        '--target',
+        default=None,
+        help='Name of the column to predict in every file matched by --glob'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of worker processes (default: number of CPUs)'
+    )
+    parser.add_argument(
+        '--memory-limit',
+        type=int,
+        default=None,
+        metavar='MB',
+        help='Address space limit of each worker process in megabytes'
+    )
+    parser.add_argument(
+        '--chunksize',
+        type=int,
+        default=None,
+        help='Stream each file in chunks of this many rows to bound memory usage'
+    )
+    parser.add_argument(
+        '--top-k',
+        type=int,
+        default=None,
+        help='Only report the top K most relevant features'
+    )
+    parser.add_argument(
+        '--min-score',
+        type=float,
+        default=None,
+        help='Only report features whose absolute correlation with the target is at least this value'
+    )
+    parser.add_argument(
+        '--method',
+        choices=['pearson', 'spearman', 'kendall', 'mutual_info'],
+        default='pearson',
+        help='Scoring method; spearman and kendall are rank-based, mutual_info also scores categorical '
+             'features; all but pearson need the whole file in memory'
+    )
+    parser.add_argument(
+        '--optimize-memory',
+        action='store_true',
+        help='Parse only numerical columns (categorical ones too with --method mutual_info) with compact dtypes '
+             '(float32, small integers, category)'
+    )
+    
+    args = parser.parse_args()
+    
+    if args.glob is not None:
+        if args.target is None:
+            parser.error('--glob requires --target')
+        jobs = jobs_from_glob(args.glob, args.target)
+    else:
+        jobs = jobs_from_manifest(args.manifest)
+    
+    failures = 0
+    results = run_batch(
+        jobs,
+        max_workers=args.workers,
+        memory_limit_mb=args.memory_limit,
+        chunksize=args.chunksize,
+        top_k=args.top_k,
+        min_score=args.min_score,
+        optimize_memory=args.optimize_memory,
+        method=args.method
+    )
+    for job, response in results:
+        failures += not response.success
+        print(response_to_json(job, response), flush=True)
+    
+    if failures:
+        print(f"{failures} of {len(jobs)} jobs failed", file=sys.stderr)
+        exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+import numpy as np
+import pandas as pd
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'column_predictor')
+DEFAULT_MAX_CACHE_BYTES = 2 * 1024 ** 3
+
+# Bump when the on-disk layout or the meaning of cached results changes
+CACHE_VERSION = 1
+
+_HASH_BLOCK_BYTES = 1024 ** 2
+_INDEX_FILE = 'file_index.json'
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def hash_file_contents(file_path: str) -> str:
+    """
+    Compute the SHA-256 digest of a file, reading it in blocks.
+    
+    Args:
+        file_path (str): Path of the file
+        
+    Returns:
+        str: Hexadecimal digest
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_BYTES), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+class ResultCache:
+    """
+    On-disk cache of parsed frames and correlation matrices, keyed by file content.
+    
+    Files are identified by the SHA-256 of their contents. The digest is remembered per
+    (path, size, mtime), so an unchanged file is only hashed once. Entries are evicted in
+    least-recently-used order once the cache grows beyond max_bytes.
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_CACHE_BYTES):
+        self.cache_dir = cache_dir or os.environ.get('COLUMN_PREDICTOR_CACHE_DIR', DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes
+        self.use_feather = _has_pyarrow()
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def file_digest(self, file_path: str) -> str:
+        """
+        Return the content digest of a file, reusing the last digest if size and mtime are unchanged.
+        
+        Args:
+            file_path (str): Path of the file
+            
+        Returns:
+            str: Hexadecimal SHA-256 digest of the file contents
+        """
+        stat = os.stat(file_path)
+        index_path = os.path.join(self.cache_dir, _INDEX_FILE)
+        index = self._read_index(index_path)
+        
+        fingerprint = [stat.st_size, stat.st_mtime_ns]
+        entry = index.get(os.path.abspath(file_path))
+        if entry and entry['fingerprint'] == fingerprint:
+            return entry['digest']
+        
+        digest = hash_file_contents(file_path)
+        index[os.path.abspath(file_path)] = {'fingerprint': fingerprint, 'digest': digest}
+        self._write_atomic(index_path, lambda path: _write_json(path, index))
+        return digest
+    
+    def entry_key(self, digest: str, kind: str, params: Dict[str, Any]) -> str:
+        """Key of a cached artifact derived from a file digest, an artifact kind and analysis parameters."""
+        payload = json.dumps({'version': CACHE_VERSION, 'digest': digest, 'kind': kind, 'params': params}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def load_frame(self, key: str) -> Optional[pd.DataFrame]:
+        """Return a cached DataFrame, or None on a miss."""
+        for path, reader in ((self._path(key, '.feather'), pd.read_feather), (self._path(key, '.pkl'), pd.read_pickle)):
+            if os.path.exists(path):
+                try:
+                    df = reader(path)
+                except Exception:
+                    return None
+                self._touch(path)
+                return df
+        return None
+    
+    def store_frame(self, key: str, df: pd.DataFrame) -> None:
+        """Store a DataFrame, as Feather if pyarrow is installed and as a pickle otherwise."""
+        if self.use_feather and _feather_compatible(df):
+            self._write_atomic(self._path(key, '.feather'), lambda path: df.to_feather(path))
+        else:
+            self._write_atomic(self._path(key, '.pkl'), lambda path: df.to_pickle(path))
+        self.evict()
+    
+    def load_matrix(self, key: str) -> Optional[pd.DataFrame]:
+        """Return a cached square matrix, or None on a miss."""
+        path = self._path(key, '.npz')
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                matrix = pd.DataFrame(data['values'], index=data['columns'].tolist(), columns=data['columns'].tolist())
+        except Exception:
+            return None
+        self._touch(path)
+        return matrix
+    
+    def store_matrix(self, key: str, matrix: pd.DataFrame) -> None:
+        """Store a square matrix with its labels."""
+        columns = np.array([str(col) for col in matrix.columns])
+        
+        def write(path: str) -> None:
+            with open(path, 'wb') as f:
+                np.savez(f, values=matrix.to_numpy(dtype=np.float64), columns=columns)
+        
+        self._write_atomic(self._path(key, '.npz'), write)
+        self.evict()
+    
+    def evict(self) -> None:
+        """Delete least-recently-used entries until the cache fits in max_bytes."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name == _INDEX_FILE or name.endswith('.tmp'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+    
+    def _path(self, key: str, extension: str) -> str:
+        return os.path.join(self.cache_dir, key + extension)
+    
+    def _touch(self, path: str) -> None:
+        # The modification time doubles as the last-use time for LRU eviction
+        os.utime(path)
+    
+    def _write_atomic(self, path: str, write) -> None:
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        write(temporary_path)
+        os.replace(temporary_path, path)
+    
+    def _read_index(self, index_path: str) -> Dict[str, Any]:
+        try:
+            with open(index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
+def _feather_compatible(df: pd.DataFrame) -> bool:
+    """Feather needs string column labels and a default index."""
+    return all(isinstance(col, str) for col in df.columns) and df.index.equals(pd.RangeIndex(len(df)))
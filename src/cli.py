@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 
 import argparse
-from .main import analyze_features
+import json
+from .validations import file_exists
+from .profiling import format_profile
 
 def main():
     parser = argparse.ArgumentParser(
@@ -9,33 +11,240 @@ def main():
     )
     parser.add_argument(
         'filename',
-        help='Name of the CSV file in the data directory'
+        help='Name of the CSV (optionally compressed), Parquet or Feather file in the data directory'
     )
     parser.add_argument(
         'target_column',
+        nargs='?',
+        default=None,
         help='Name of the column to predict'
     )
+    parser.add_argument(
+        '--targets',
+        nargs='+',
+        default=None,
+        metavar='COLUMN',
+        help='Rank features for several target columns from one shared correlation matrix'
+    )
+    parser.add_argument(
+        '--all-targets',
+        action='store_true',
+        help='Rank features for every numerical column as a target'
+    )
     parser.add_argument(
         '-debug',
         action='store_true',
         help='Show debug information including correlation matrix'
     )
+    parser.add_argument(
+        '--chunksize',
+        type=int,
+        default=None,
+        help='Stream the file in chunks of this many rows to bound memory usage'
+    )
+    parser.add_argument(
+        '--top-k',
+        type=int,
+        default=None,
+        help='Only report the top K most relevant features'
+    )
+    parser.add_argument(
+        '--min-score',
+        type=float,
+        default=None,
+        help='Only report features whose absolute correlation with the target is at least this value'
+    )
+    parser.add_argument(
+        '--method',
+        choices=['pearson', 'spearman', 'kendall', 'mutual_info'],
+        default='pearson',
+        help='Scoring method; spearman and kendall are rank-based, mutual_info also scores categorical '
+             'features; all but pearson need the whole file in memory'
+    )
+    parser.add_argument(
+        '--optimize-memory',
+        action='store_true',
+        help='Parse only numerical columns (categorical ones too with --method mutual_info) with compact dtypes '
+             '(float32, small integers, category)'
+    )
+    parser.add_argument(
+        '--engine',
+        choices=['c', 'python', 'pyarrow'],
+        default=None,
+        help='CSV parser engine (pyarrow requires the pyarrow package)'
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print wall time, CPU time, shapes and memory of each pipeline stage'
+    )
+    parser.add_argument(
+        '--profile-json',
+        metavar='PATH',
+        default=None,
+        help='Write the per-stage profile as JSON to PATH'
+    )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse parsed data and correlation results of an unchanged file from an on-disk cache'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='Cache directory (default: $COLUMN_PREDICTOR_CACHE_DIR or ~/.cache/column_predictor)'
+    )
+    parser.add_argument(
+        '--state',
+        metavar='PATH',
+        default=None,
+        help='Keep correlation statistics at PATH and only read rows appended since the previous run'
+    )
+    parser.add_argument(
+        '--sample-size',
+        type=int,
+        default=None,
+        metavar='ROWS',
+        help='Rank approximately from a random sample of ROWS rows, with confidence intervals'
+    )
+    parser.add_argument(
+        '--max-sample-size',
+        type=int,
+        default=None,
+        metavar='ROWS',
+        help='Double the sample until the top features are stable or the sample reaches ROWS rows'
+    )
+    parser.add_argument(
+        '--sampling',
+        choices=['offset', 'reservoir'],
+        default='reservoir',
+        help='reservoir (default) reads the whole file once for an exactly uniform sample; offset reads only the '
+             'sampled lines (fast) but favours rows that follow long lines, which biases the confidence intervals'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Random seed of the sample'
+    )
+    parser.add_argument(
+        '--redundancy-threshold',
+        type=float,
+        default=None,
+        metavar='T',
+        help='Report only the best feature of each group of features whose absolute correlation '
+             'with each other is at least T'
+    )
+    parser.add_argument(
+        '--matrix',
+        metavar='PATH',
+        default=None,
+        help='Materialize the preprocessed numerical columns as a memory-mapped .npy file at PATH '
+             'and reopen it instead of parsing on reruns while the file is unchanged'
+    )
     
     args = parser.parse_args()
     
-    result = analyze_features(args.filename, args.target_column, debug=args.debug)
+    if args.target_column is None and not args.targets and not args.all_targets:
+        parser.error('a target column, --targets or --all-targets is required')
+    if args.method != 'pearson' and (args.chunksize is not None or args.state is not None):
+        parser.error(f'--method {args.method} cannot be used with --chunksize or --state')
+    if args.method == 'mutual_info' and (args.targets or args.all_targets or args.cache):
+        parser.error('--method mutual_info cannot be used with --targets, --all-targets or --cache')
+    if args.sample_size is not None and (args.method != 'pearson' or args.targets or args.all_targets
+                                         or args.chunksize is not None or args.state is not None or args.cache):
+        parser.error('--sample-size only supports the pearson method on a single target, without '
+                     '--chunksize, --state or --cache')
+    if args.redundancy_threshold is not None and (args.method in ('mutual_info', 'kendall') or args.targets
+                                                  or args.all_targets
+                                                  or args.chunksize is not None or args.state is not None
+                                                  or args.cache or args.sample_size is not None):
+        parser.error('--redundancy-threshold cannot be used with --method mutual_info or kendall, --targets, --all-targets, '
+                     '--chunksize, --state, --cache or --sample-size')
+    if args.matrix is not None and (args.method == 'mutual_info' or args.targets or args.all_targets
+                                    or args.chunksize is not None or args.state is not None or args.cache
+                                    or args.sample_size is not None):
+        parser.error('--matrix cannot be used with --method mutual_info, --targets, --all-targets, '
+                     '--chunksize, --state, --cache or --sample-size')
+    
+    # Cheap checks run before pandas and the analysis stack are imported
+    exists, error = file_exists(args.filename)
+    if not exists:
+        _exit_with_error(error)
+    
+    from .main import analyze_features, analyze_targets, ALL_TARGETS
+    
+    targets = None
+    if args.all_targets:
+        targets = ALL_TARGETS
+    elif args.targets:
+        targets = ([args.target_column] if args.target_column else []) + args.targets
+    
+    options = dict(
+        debug=args.debug,
+        chunksize=args.chunksize,
+        top_k=args.top_k,
+        min_score=args.min_score,
+        optimize_memory=args.optimize_memory,
+        engine=args.engine,
+        profile=args.profile or args.profile_json is not None,
+        cache=args.cache,
+        cache_dir=args.cache_dir,
+        state_path=args.state,
+        method=args.method
+    )
+    if targets is None:
+        result = analyze_features(
+            args.filename,
+            args.target_column,
+            sample_size=args.sample_size,
+            max_sample_size=args.max_sample_size,
+            sampling=args.sampling,
+            seed=args.seed,
+            matrix_path=args.matrix,
+            redundancy_threshold=args.redundancy_threshold,
+            **options
+        )
+    else:
+        result = analyze_targets(args.filename, targets, **options)
+    
+    if result.profile is not None:
+        if args.profile:
+            print("\nProfile:")
+            print(format_profile(result.profile))
+        if args.profile_json:
+            with open(args.profile_json, 'w') as f:
+                json.dump(result.profile, f, indent=2)
     
     if not result.success:
-        print(f"Error: {result.error_message}")
-        print("\nPlease check if:")
-        print("- The file exists in the data directory")
-        print("- The file is a valid CSV")
-        print("- The target column exists in the file")
-        exit(1)
+        _exit_with_error(result.error_message)
         
+    if targets is not None:
+        for target, ranked_df in result.scores.groupby('target', sort=False):
+            print(f"\nMost relevant features for '{target}':")
+            for feature in ranked_df['feature']:
+                print(f"- {feature}")
+        return
+    
+    if args.sample_size is not None:
+        n_rows = int(result.scores['n_rows'].max()) if len(result.scores) else 0
+        print(f"\nMost relevant features (approximate, {n_rows} sampled rows, 95% intervals):")
+        for row in result.scores.itertuples(index=False):
+            print(f"- {row.feature}: {row.importance_score:.3f} [{row.ci_low:.3f}, {row.ci_high:.3f}], "
+                  f"rank {row.rank_low}-{row.rank_high}")
+        return
+    
     print("\nMost relevant features:")
     for feature in result.result:
         print(f"- {feature}")
 
+def _exit_with_error(error_message: str) -> None:
+    print(f"Error: {error_message}")
+    print("\nPlease check if:")
+    print("- The file exists in the data directory")
+    print("- The file is a valid CSV, Parquet or Feather file")
+    print("- The target column exists in the file")
+    exit(1)
+
 if __name__ == '__main__':
     main() 
\ No newline at end of file
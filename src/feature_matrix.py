@@ -0,0 +1,243 @@
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+import numpy as np
+import pandas as pd
+from .analysis.blocked import DEFAULT_BLOCK_SIZE, blocked_correlation, target_correlation
+from .analysis.correlation import scores_from_correlations
+from .analysis.rank_correlation import (
+    check_correlation_method,
+    spearman_correlation,
+    spearman_target_correlation,
+    kendall_correlation,
+    kendall_target_correlation
+)
+
+# Bump when the on-disk layout or the meaning of materialized matrices changes
+MATRIX_VERSION = 1
+
+_FLOAT_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+@dataclass
+class FeatureMatrix:
+    """
+    Numerical feature matrix stored column-major in a memory-mapped .npy file.
+    
+    Every column is a contiguous slice of the mapped buffer, so column blocks are read
+    without copies. Any process that opens the same file with open_feature_matrix shares
+    the pages of the operating system's file cache instead of receiving a pickled copy.
+    
+    Attributes:
+        path (str): Path of the .npy file
+        columns (List[str]): Column names, in matrix order
+        values (np.ndarray): Read-only array of shape (n_rows, n_columns), NaN marking missing values
+        metadata (Dict[str, Any]): Caller-provided description of the source, checked when reopening
+    """
+    path: str
+    columns: List[str]
+    values: np.ndarray
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def column(self, name: str) -> np.ndarray:
+        """Return a column as a view of the mapped buffer."""
+        if name not in self.columns:
+            raise ValueError(f"Column '{name}' not found in feature matrix")
+        return self.values[:, self.columns.index(name)]
+
+def write_feature_matrix(df: pd.DataFrame, path: str, dtype: np.dtype = np.float64,
+                         max_categories: Optional[int] = None, normalize: bool = False,
+                         metadata: Optional[Dict[str, Any]] = None) -> FeatureMatrix:
+    """
+    Materialize the numerical features of a DataFrame into a column-major memory-mapped file.
+    
+    Columns are converted and written one at a time straight into the mapped file, so the
+    preprocessing below never copies the whole frame. With max_categories, categorical
+    columns are added as indicator columns named and ordered like apply_one_hot_encoding;
+    with normalize, numerical columns are min-max scaled like normalize_features. The column
+    names are kept in a JSON sidecar next to the .npy file.
+    
+    Args:
+        df (pd.DataFrame): Input DataFrame, e.g. after handle_missing_values
+        path (str): Path of the .npy file; the sidecar is written to path + '.json'
+        dtype (np.dtype): np.float64, or np.float32 to halve the size of the file
+        max_categories (Optional[int]): If set, one-hot encode categorical columns keeping at most this
+                                        many categories per column; if None, categorical columns are skipped
+        normalize (bool): If True, scale numerical columns to [0, 1]; constant columns become 0.0
+        metadata (Optional[Dict[str, Any]]): JSON-serializable description of the source, e.g. its size
+                                             and modification time, checked by open_feature_matrix
+    
+    Returns:
+        FeatureMatrix: The written matrix, mapped read-only
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in _FLOAT_DTYPES:
+        raise ValueError("dtype must be np.float32 or np.float64")
+    if max_categories is not None and max_categories <= 0:
+        raise ValueError("max_categories must be a positive integer")
+    
+    # Each writer fills one column of the mapped array
+    writers = []
+    columns = []
+    for col in df.select_dtypes(include=['number']).columns:
+        writers.append(lambda out, col=col: _write_numerical_column(out, df[col], normalize))
+        columns.append(str(col))
+    if max_categories is not None:
+        for col in df.select_dtypes(include=['object', 'category']).columns:
+            categories = _collapse_categories(df[col], max_categories)
+            for k, category in enumerate(categories.categories):
+                writers.append(lambda out, codes=categories.codes, k=k: np.equal(codes, k, out=out, casting='unsafe'))
+                columns.append(f"{col}_{category}")
+    
+    shape = (len(df), len(columns))
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    if shape[0] * shape[1] == 0:
+        # Empty files cannot be mapped for writing
+        np.save(temporary_path + '.npy', np.empty(shape, dtype=dtype, order='F'))
+        os.replace(temporary_path + '.npy', temporary_path)
+    else:
+        values = np.lib.format.open_memmap(temporary_path, mode='w+', dtype=dtype, shape=shape, fortran_order=True)
+        for j, write in enumerate(writers):
+            write(values[:, j])
+        values.flush()
+        del values
+    os.replace(temporary_path, path)
+    
+    # The sidecar pins the exact .npy file it describes, so a crash between the two
+    # replacements is detected as a mismatch instead of pairing wrong column names
+    stat = os.stat(path)
+    sidecar = {
+        'version': MATRIX_VERSION,
+        'columns': columns,
+        'metadata': metadata or {},
+        'file': [stat.st_size, stat.st_mtime_ns]
+    }
+    with open(temporary_path, 'w') as f:
+        json.dump(sidecar, f)
+    os.replace(temporary_path, path + '.json')
+    
+    return FeatureMatrix(path=path, columns=columns, values=_map_values(path), metadata=sidecar['metadata'])
+
+def open_feature_matrix(path: str, metadata: Optional[Dict[str, Any]] = None) -> Optional[FeatureMatrix]:
+    """
+    Reopen a materialized feature matrix without reading it into memory.
+    
+    Args:
+        path (str): Path of the .npy file written by write_feature_matrix
+        metadata (Optional[Dict[str, Any]]): If set, the matrix is only returned if it was written
+                                             with equal metadata, e.g. from an unchanged source file
+    
+    Returns:
+        Optional[FeatureMatrix]: The mapped matrix, or None if it is missing, unreadable or stale
+    """
+    try:
+        with open(path + '.json') as f:
+            sidecar = json.load(f)
+        stat = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    
+    if sidecar.get('version') != MATRIX_VERSION or sidecar.get('file') != [stat.st_size, stat.st_mtime_ns]:
+        return None
+    if metadata is not None and sidecar.get('metadata') != metadata:
+        return None
+    
+    try:
+        values = _map_values(path)
+    except (OSError, ValueError):
+        return None
+    if values.ndim != 2 or values.shape[1] != len(sidecar['columns']) or values.dtype not in _FLOAT_DTYPES:
+        return None
+    
+    return FeatureMatrix(path=path, columns=list(sidecar['columns']), values=values, metadata=sidecar['metadata'])
+
+def feature_matrix_scores(matrix: FeatureMatrix, target_column: str, top_k: Optional[int] = None,
+                          min_score: Optional[float] = None, method: str = 'pearson') -> pd.DataFrame:
+    """
+    Calculate correlation scores between features and target variable off a mapped matrix.
+    
+    Counterpart of compute_correlation_scores; Pearson correlations read column blocks
+    straight from the mapped buffer.
+    
+    Args:
+        matrix (FeatureMatrix): Materialized feature matrix including the target column
+        target_column (str): Name of the target column
+        top_k (Optional[int]): If set, keep only the top_k features with the highest score
+        min_score (Optional[float]): If set, drop features scoring below this value
+        method (str): 'pearson', 'spearman' (rank correlation) or 'kendall' (tau-b)
+    
+    Returns:
+        pd.DataFrame: DataFrame with columns ['feature', 'importance_score']
+                     where importance_score is absolute correlation with target
+    """
+    check_correlation_method(method)
+    
+    if len(matrix.values) == 0:
+        return pd.DataFrame(columns=['feature', 'importance_score'])
+    
+    if target_column not in matrix.columns:
+        raise ValueError(f"Target column '{target_column}' must be numeric")
+    
+    # The target is scored against itself too and dropped with the other results
+    target = matrix.column(target_column)
+    if method == 'spearman':
+        correlations = spearman_target_correlation(matrix.values, target)
+    elif method == 'kendall':
+        correlations = kendall_target_correlation(matrix.values, target)
+    else:
+        correlations = target_correlation(matrix.values, target)
+    correlations = pd.Series(correlations, index=matrix.columns, name=target_column)
+    
+    return scores_from_correlations(correlations, target_column, top_k, min_score)
+
+def feature_matrix_correlation(matrix: FeatureMatrix, n_jobs: int = 1, block_size: int = DEFAULT_BLOCK_SIZE,
+                               pairwise: Optional[bool] = None, method: str = 'pearson') -> pd.DataFrame:
+    """
+    Calculate the correlation matrix between the columns of a mapped feature matrix.
+    
+    Args:
+        matrix (FeatureMatrix): Materialized feature matrix
+        n_jobs (int): Number of worker threads used for the tiles (default: 1)
+        block_size (int): Number of columns per tile
+        pairwise (Optional[bool]): Missing value handling, see blocked_correlation
+        method (str): 'pearson', 'spearman' (rank correlation) or 'kendall' (tau-b)
+    
+    Returns:
+        pd.DataFrame: Correlation matrix, diagonal included
+    """
+    check_correlation_method(method)
+    
+    if method == 'spearman':
+        correlations = spearman_correlation(matrix.values, block_size=block_size, n_jobs=n_jobs, pairwise=pairwise)
+    elif method == 'kendall':
+        correlations = kendall_correlation(matrix.values, n_jobs=n_jobs)
+    else:
+        correlations = blocked_correlation(matrix.values, block_size=block_size, n_jobs=n_jobs, pairwise=pairwise)
+    return pd.DataFrame(correlations, index=matrix.columns, columns=matrix.columns)
+
+def _map_values(path: str) -> np.ndarray:
+    return np.load(path, mmap_mode='r', allow_pickle=False)
+
+def _write_numerical_column(out: np.ndarray, column: pd.Series, normalize: bool) -> None:
+    """Convert one numerical column into a column of the mapped array, optionally min-max scaled."""
+    out[:] = column.to_numpy(dtype=np.float64, na_value=np.nan)
+    if not normalize:
+        return
+    present = out[~np.isnan(out)]
+    if len(present) == 0:
+        return
+    data_min, data_max = present.min(), present.max()
+    if data_max == data_min:
+        out[:] = 0.0
+    else:
+        out -= data_min
+        out /= data_max - data_min
+
+def _collapse_categories(column: pd.Series, max_categories: int) -> pd.Categorical:
+    """Categories of a column as in apply_one_hot_encoding, rare ones collapsed into 'other'."""
+    value_counts = column.value_counts()
+    value_counts = value_counts[value_counts > 0]
+    if len(value_counts) > max_categories:
+        values = column.astype(object)
+        column = values.where(values.isin(value_counts.index[:max_categories]), 'other')
+    return pd.Categorical(column).remove_unused_categories()
@@ -0,0 +1,201 @@
+import os
+import re
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pandas and pyarrow are imported inside the functions that read files, like in validations
+
+CSV = 'csv'
+PARQUET = 'parquet'
+FEATHER = 'feather'
+FILE_FORMATS = (CSV, PARQUET, FEATHER)
+
+# Full signatures, so that a CSV header such as 'PAR1_score,...' or 'BZh9,...' is not mistaken
+# for a container. Parquet files start and end with PAR1; Feather v2 is the Arrow IPC file format
+_PARQUET_MAGIC = b'PAR1'
+_FEATHER_MAGIC = b'ARROW1\x00\x00'
+_MAGIC_COMPRESSIONS = (
+    (re.compile(rb'\x1f\x8b'), 'gzip'),
+    (re.compile(rb'\x28\xb5\x2f\xfd'), 'zstd'),
+    (re.compile(rb'BZh[1-9]1AY&SY'), 'bz2'),
+    (re.compile(rb'\xfd7zXZ\x00'), 'xz'),
+    (re.compile(rb'PK\x03\x04'), 'zip')
+)
+_EXTENSION_FORMATS = {'.parquet': PARQUET, '.pq': PARQUET, '.feather': FEATHER, '.arrow': FEATHER, '.ipc': FEATHER}
+# Compressions pandas infers from the extension of a CSV file
+_EXTENSION_COMPRESSIONS = {'.gz': 'gzip', '.zst': 'zstd', '.bz2': 'bz2', '.xz': 'xz', '.zip': 'zip'}
+_MAGIC_BYTES = 10
+
+def detect_format(file_path: str) -> Tuple[str, Optional[str]]:
+    """
+    Detect the format of a data file from its leading bytes, falling back to its extension.
+    
+    Args:
+        file_path (str): Path of the file
+    
+    Returns:
+        Tuple[str, Optional[str]]: (one of FILE_FORMATS, compression of a CSV file such as 'gzip' or
+                                   'zstd', None if uncompressed or unknown)
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(_MAGIC_BYTES)
+            if head.startswith(_PARQUET_MAGIC) and _read_trailer(f, len(_PARQUET_MAGIC)) == _PARQUET_MAGIC:
+                return PARQUET, None
+    except OSError:
+        head = b''
+    
+    if head.startswith(_FEATHER_MAGIC):
+        return FEATHER, None
+    for magic, compression in _MAGIC_COMPRESSIONS:
+        if magic.match(head):
+            return CSV, compression
+    return _EXTENSION_FORMATS.get(os.path.splitext(file_path)[1].lower(), CSV), None
+
+def is_plain_csv(file_path: str) -> bool:
+    """True for uncompressed CSV files, whose rows can be located by byte offset."""
+    extension = os.path.splitext(file_path)[1].lower()
+    return detect_format(file_path) == (CSV, None) and extension not in _EXTENSION_COMPRESSIONS
+
+def read_columns(file_path: str) -> List[str]:
+    """
+    Read the column names of a data file without reading its rows.
+    
+    Only the header row of a CSV file is parsed; for Parquet and Feather files only the
+    schema in the file footer is read.
+    
+    Args:
+        file_path (str): Path of the file
+    
+    Returns:
+        List[str]: Column names in file order
+    """
+    file_format, compression = detect_format(file_path)
+    if file_format == CSV:
+        import pandas as pd
+        return pd.read_csv(file_path, nrows=0, compression=compression or 'infer').columns.tolist()
+    return _read_schema(file_path, file_format).names
+
+def read_numeric_columns(file_path: str) -> Optional[List[str]]:
+    """
+    Names of the integer and floating point columns declared in the schema of a Parquet or Feather file.
+    
+    Args:
+        file_path (str): Path of the file
+    
+    Returns:
+        Optional[List[str]]: Column names in file order, or None for CSV files, whose types are only known after parsing
+    """
+    file_format, _ = detect_format(file_path)
+    if file_format == CSV:
+        return None
+    
+    import pyarrow as pa
+    
+    schema = _read_schema(file_path, file_format)
+    return [field.name for field in schema if pa.types.is_integer(field.type) or pa.types.is_floating(field.type)]
+
+def read_frame(file_path: str, columns: Optional[List[str]] = None, **read_options) -> 'pd.DataFrame':
+    """
+    Read a whole data file into a DataFrame.
+    
+    Args:
+        file_path (str): Path of the file
+        columns (Optional[List[str]]): If set, read only these columns; Parquet and Feather files skip
+                                       the other columns on disk
+        **read_options: Extra keyword arguments for read_csv, e.g. engine; ignored for other formats
+    
+    Returns:
+        pd.DataFrame: File contents
+    """
+    import pandas as pd
+    
+    file_format, compression = detect_format(file_path)
+    if file_format == PARQUET:
+        _require_pyarrow(file_format)
+        return pd.read_parquet(file_path, columns=columns)
+    if file_format == FEATHER:
+        _require_pyarrow(file_format)
+        return pd.read_feather(file_path, columns=columns)
+    return pd.read_csv(file_path, usecols=columns, compression=compression or 'infer', **read_options)
+
+def iter_frames(file_path: str, chunksize: int, columns: Optional[List[str]] = None) -> Iterator['pd.DataFrame']:
+    """
+    Read a data file in chunks of at most chunksize rows.
+    
+    Parquet files are decoded one row group at a time and Feather files one record batch at
+    a time from a memory map, so memory stays bounded by the chunk size for every format.
+    
+    Args:
+        file_path (str): Path of the file
+        chunksize (int): Maximum number of rows per chunk
+        columns (Optional[List[str]]): If set, read only these columns
+    
+    Returns:
+        Iterator[pd.DataFrame]: Chunks in file order
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize must be a positive integer")
+    
+    file_format, compression = detect_format(file_path)
+    if file_format == CSV:
+        import pandas as pd
+        return pd.read_csv(file_path, usecols=columns, chunksize=chunksize, compression=compression or 'infer')
+    _require_pyarrow(file_format)
+    return _iter_arrow_frames(file_path, file_format, chunksize, columns)
+
+def read_sample(file_path: str, n_rows: int) -> 'pd.DataFrame':
+    """Read the first n_rows rows of a data file, decoding as little of it as possible."""
+    file_format, compression = detect_format(file_path)
+    if file_format == CSV:
+        import pandas as pd
+        return pd.read_csv(file_path, nrows=n_rows, compression=compression or 'infer')
+    
+    # Files without any row group or record batch still yield their (empty) columns
+    chunk = next(iter_frames(file_path, n_rows), None)
+    return chunk if chunk is not None else read_frame(file_path)
+
+def _iter_arrow_frames(file_path: str, file_format: str, chunksize: int,
+                       columns: Optional[List[str]]) -> Iterator['pd.DataFrame']:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    if file_format == PARQUET:
+        for batch in pq.ParquetFile(file_path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+        return
+    
+    with pa.memory_map(file_path) as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            if columns is not None:
+                batch = batch.select(columns)
+            for start in range(0, batch.num_rows, chunksize):
+                yield batch.slice(start, chunksize).to_pandas()
+
+def _read_schema(file_path: str, file_format: str):
+    _require_pyarrow(file_format)
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    if file_format == PARQUET:
+        return pq.read_schema(file_path)
+    with pa.memory_map(file_path) as source:
+        return pa.ipc.open_file(source).schema
+
+def _read_trailer(f, n_bytes: int) -> bytes:
+    """Last n_bytes of an open binary file, or b'' if it is too short to also hold a header."""
+    size = f.seek(0, os.SEEK_END)
+    if size < 2 * n_bytes:
+        return b''
+    f.seek(-n_bytes, os.SEEK_END)
+    return f.read(n_bytes)
+
+def _require_pyarrow(file_format: str) -> None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError(f"Reading {file_format.capitalize()} files requires the pyarrow package") from None
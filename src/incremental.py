@@ -0,0 +1,108 @@
+import hashlib
+import os
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+import pandas as pd
+from .loader import validate_dataset
+from .validations import read_csv_header, csv_read_error_message
+from .formats import is_plain_csv
+from .analysis.streaming import (
+    CorrelationState,
+    accumulate_correlation_state,
+    update_correlation_state,
+    save_correlation_state,
+    load_correlation_state
+)
+
+# Rows read per chunk when catching up with appended rows
+DEFAULT_UPDATE_CHUNKSIZE = 100000
+
+# Bump when the meaning of persisted states changes
+STATE_VERSION = 1
+
+# Bytes before the last read position that are checked to detect rewritten (not appended) files
+_TAIL_BYTES = 4096
+
+def update_state_from_file(filename: str, state_path: str,
+                           chunksize: int = DEFAULT_UPDATE_CHUNKSIZE) -> Tuple[Optional[CorrelationState], str]:
+    """
+    Bring the persisted correlation state of an append-only CSV file up to date.
+
+    The state file remembers the byte offset up to which the CSV file was read. Only rows
+    after that offset are parsed and merged into the state, so an update costs time
+    proportional to the appended data. If the file was rewritten rather than appended to
+    (different header, truncated, or changed bytes before the offset), the state is rebuilt
+    from the whole file.
+
+    Args:
+        filename (str): Name of the CSV file in the data directory
+        state_path (str): Path of the persisted state; created if it does not exist
+        chunksize (int): Number of rows per chunk while reading new rows
+
+    Returns:
+        Tuple[Optional[CorrelationState], str]: (state covering every row of the file or None on failure, error_message)
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize must be a positive integer")
+
+    error = validate_dataset(filename, None)
+    if error:
+        return None, error
+    file_path = os.path.join('data', filename)
+    if not is_plain_csv(file_path):
+        return None, f"File '{filename}' must be an uncompressed CSV file to be updated incrementally"
+    columns, _ = read_csv_header(filename)
+
+    state, metadata = _load_state(state_path)
+
+    with open(file_path, 'rb') as f:
+        header = f.readline()
+        if state is None or not _is_appended(f, header, metadata):
+            state, offset = None, len(header)
+        else:
+            offset = metadata['offset']
+
+        f.seek(offset)
+        try:
+            chunks = pd.read_csv(f, header=None, names=columns, chunksize=chunksize)
+            if state is None:
+                state = accumulate_correlation_state(chunk for chunk in chunks if len(chunk))
+            else:
+                state = update_correlation_state(state, chunks)
+        except Exception as e:
+            return None, csv_read_error_message(filename, e)
+
+        offset = f.tell()
+        metadata = {
+            'version': STATE_VERSION,
+            'header': header.hex(),
+            'offset': offset,
+            'tail_digest': _tail_digest(f, offset)
+        }
+
+    save_correlation_state(state, state_path, metadata)
+    return state, ""
+
+def _load_state(state_path: str) -> Tuple[Optional[CorrelationState], Dict[str, Any]]:
+    """Load a persisted state, treating missing, unreadable or outdated files as absent."""
+    if not os.path.exists(state_path):
+        return None, {}
+    try:
+        state, metadata = load_correlation_state(state_path)
+    except Exception:
+        return None, {}
+    if metadata.get('version') != STATE_VERSION:
+        return None, {}
+    return state, metadata
+
+def _is_appended(f: BinaryIO, header: bytes, metadata: Dict[str, Any]) -> bool:
+    """Whether the file still starts with the bytes the state was computed from."""
+    offset = metadata.get('offset', 0)
+    if metadata.get('header') != header.hex() or os.fstat(f.fileno()).st_size < offset:
+        return False
+    return _tail_digest(f, offset) == metadata.get('tail_digest')
+
+def _tail_digest(f: BinaryIO, offset: int) -> str:
+    """SHA-256 of the bytes just before offset."""
+    start = max(offset - _TAIL_BYTES, 0)
+    f.seek(start)
+    return hashlib.sha256(f.read(offset - start)).hexdigest()
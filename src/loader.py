@@ -0,0 +1,207 @@
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .validations import file_exists, read_csv_header, column_in_header, csv_read_error_message
+from .formats import CSV, detect_format, read_columns, read_numeric_columns, read_frame, iter_frames, read_sample
+
+# Rows read up front to infer compact dtypes and the columns worth parsing
+DEFAULT_SAMPLE_ROWS = 10000
+
+# Object columns whose distinct values make up at most this share of rows are loaded as 'category'
+MAX_CATEGORY_RATIO = 0.5
+
+def validate_dataset(filename: str, target_column: Optional[str]) -> str:
+    """
+    Run the cheap checks on a data file: existence, header (or schema) sniff and target column presence.
+    
+    Args:
+        filename (str): Name of the CSV, Parquet or Feather file in the data directory
+        target_column (Optional[str]): Name of the column that must be present in the file, None to skip
+        
+    Returns:
+        str: Error message, empty if the file passed every check
+    """
+    exists, error = file_exists(filename)
+    if not exists:
+        return error
+    
+    # Header-only sniff (schema-only for Parquet and Feather): catches empty files and missing target columns cheaply
+    columns, error = read_csv_header(filename)
+    if error:
+        return error
+    
+    if target_column is None:
+        return ""
+    _, error = column_in_header(filename, columns, target_column)
+    return error
+
+def infer_compact_dtypes(sample: pd.DataFrame, max_category_ratio: float = MAX_CATEGORY_RATIO) -> Dict[str, Any]:
+    """
+    Infer memory-saving dtypes for read_csv from a sample of rows.
+    
+    Float columns become float32 and low-cardinality object columns become 'category'.
+    Integer columns are left out: a sample cannot prove their range or that they have no
+    missing values, so they are downcast after parsing with downcast_integer_columns.
+    
+    Args:
+        sample (pd.DataFrame): Sample of the file parsed with default dtypes
+        max_category_ratio (float): Maximum ratio of distinct values to non-missing values for 'category'
+        
+    Returns:
+        Dict[str, Any]: Mapping of column name to dtype, suitable for read_csv(dtype=...)
+    """
+    dtypes: Dict[str, Any] = {}
+    for col in sample.columns:
+        column = sample[col]
+        if pd.api.types.is_float_dtype(column):
+            dtypes[col] = np.float32
+        elif pd.api.types.is_object_dtype(column):
+            n_present = column.count()
+            if n_present and column.nunique() / n_present <= max_category_ratio:
+                dtypes[col] = 'category'
+    return dtypes
+
+def downcast_integer_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast integer columns to the smallest signed integer type that holds their values.
+    
+    Args:
+        df (pd.DataFrame): Input DataFrame
+        
+    Returns:
+        pd.DataFrame: DataFrame with downcast integer columns, others unchanged
+    """
+    integer_columns = df.select_dtypes(include=['integer']).columns
+    if integer_columns.empty:
+        return df
+    return df.assign(**{col: pd.to_numeric(df[col], downcast='integer') for col in integer_columns})
+
+def estimate_default_memory(filename: str, n_rows: int, sample_rows: int = DEFAULT_SAMPLE_ROWS) -> int:
+    """
+    Estimate the memory a plain read_csv of the file would take, extrapolated from a sample.
+    
+    Args:
+        filename (str): Name of the data file in the data directory
+        n_rows (int): Number of rows in the file
+        sample_rows (int): Number of rows to sample
+        
+    Returns:
+        int: Estimated footprint in bytes with default dtypes and all columns
+    """
+    sample = read_sample(os.path.join('data', filename), sample_rows)
+    if sample.empty:
+        return int(sample.memory_usage(deep=True).sum())
+    per_row = sample.memory_usage(deep=True, index=False).sum() / len(sample)
+    return int(per_row * n_rows)
+
+def _read_compact_csv(file_path: str, target_column: Optional[str], read_options: Dict[str, Any],
+                      sample_rows: int, keep_categorical: bool) -> pd.DataFrame:
+    """Parse only the columns the analysis can use, with dtypes inferred from a sample."""
+    sample = read_sample(file_path, sample_rows)
+    
+    # A column that is not numerical in the sample cannot be numerical in the whole file
+    numeric_columns = set(sample.select_dtypes(include=['number']).columns)
+    usecols = [col for col in sample.columns if keep_categorical or col in numeric_columns or col == target_column]
+    dtypes = infer_compact_dtypes(sample[usecols])
+    
+    try:
+        df = read_frame(file_path, columns=usecols, dtype=dtypes, **read_options)
+    except pd.errors.ParserError:
+        raise
+    except (ValueError, TypeError):
+        # A column that looked numerical in the sample holds other values further down
+        df = read_frame(file_path, columns=usecols, **read_options)
+    
+    return downcast_integer_columns(df)
+
+def _columnar_analysis_columns(file_path: str, target_column: Optional[str]) -> List[str]:
+    """Numerical columns of a Parquet or Feather file plus the target, in file order."""
+    numeric_columns = set(read_numeric_columns(file_path))
+    # The schema gives the types, so the other columns are never read from disk
+    return [col for col in read_columns(file_path) if col in numeric_columns or col == target_column]
+
+def _read_compact_columnar(file_path: str, target_column: Optional[str], keep_categorical: bool) -> pd.DataFrame:
+    """Read only the numerical columns (plus the target) of a Parquet or Feather file, then shrink their dtypes."""
+    columns = None if keep_categorical else _columnar_analysis_columns(file_path, target_column)
+    df = read_frame(file_path, columns=columns)
+    return downcast_integer_columns(df.astype(infer_compact_dtypes(df)))
+
+def load_dataset(filename: str, target_column: Optional[str], optimize_memory: bool = False,
+                 engine: Optional[str] = None, sample_rows: int = DEFAULT_SAMPLE_ROWS,
+                 keep_categorical: bool = False) -> Tuple[Optional[pd.DataFrame], str]:
+    """
+    Validate and load a data file from the data directory, parsing its contents only once.
+    
+    The header row (or the schema of a Parquet or Feather file) is sniffed first so that
+    empty files and missing target columns are reported without parsing the whole file.
+    The data is then parsed a single time and the resulting DataFrame is handed back for
+    analysis. Parquet and Feather files only read their numerical columns (plus the target)
+    from disk unless keep_categorical is set. Compressed CSV files are detected from their
+    leading bytes or extension.
+    
+    Args:
+        filename (str): Name of the CSV (optionally gzip, zstd, bz2, xz or zip compressed), Parquet
+                        or Feather file in the data directory
+        target_column (Optional[str]): Name of the column that must be present in the file, None to skip the check
+        optimize_memory (bool): If True, parse only the numerical columns (plus the target) with
+                                compact dtypes inferred from a sample: float32 and the smallest
+                                integer types. Scores then carry float32 precision
+        engine (Optional[str]): read_csv parser engine for CSV files, e.g. 'pyarrow' (requires the pyarrow package)
+        sample_rows (int): Number of rows sampled to infer dtypes when optimize_memory is True
+        keep_categorical (bool): If True, categorical columns are read from Parquet and Feather files and
+                                 parsed by optimize_memory too, for methods that score them such as mutual_info
+        
+    Returns:
+        Tuple[Optional[pd.DataFrame], str]: (DataFrame or None on failure, error_message)
+    """
+    error = validate_dataset(filename, target_column)
+    if error:
+        return None, error
+    
+    # Single full parse of the data
+    file_path = os.path.join('data', filename)
+    file_format, _ = detect_format(file_path)
+    read_options = {} if engine is None else {'engine': engine}
+    try:
+        if file_format != CSV and optimize_memory:
+            df = _read_compact_columnar(file_path, target_column, keep_categorical)
+        elif optimize_memory:
+            df = _read_compact_csv(file_path, target_column, read_options, sample_rows, keep_categorical)
+        elif file_format != CSV and not keep_categorical:
+            df = read_frame(file_path, columns=_columnar_analysis_columns(file_path, target_column))
+        else:
+            df = read_frame(file_path, **read_options)
+    except Exception as e:
+        return None, csv_read_error_message(filename, e)
+    
+    return df, ""
+
+def iter_dataset_chunks(filename: str, target_column: Optional[str], chunksize: int) -> Tuple[Optional[Iterator[pd.DataFrame]], str]:
+    """
+    Validate a data file from the data directory and open it for chunked reading.
+    
+    Only the header row (or schema) is read up front; Parquet files are then read one row
+    group at a time. Parquet and Feather files only read their numerical columns (plus the
+    target), which are all the chunked analysis uses. Parse errors in the body surface while iterating and can be
+    translated with csv_read_error_message.
+    
+    Args:
+        filename (str): Name of the CSV, Parquet or Feather file in the data directory
+        target_column (Optional[str]): Name of the column that must be present in the file, None to skip the check
+        chunksize (int): Number of rows per chunk
+        
+    Returns:
+        Tuple[Optional[Iterator[pd.DataFrame]], str]: (chunk iterator or None on failure, error_message)
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize must be a positive integer")
+    
+    error = validate_dataset(filename, target_column)
+    if error:
+        return None, error
+    
+    file_path = os.path.join('data', filename)
+    file_format, _ = detect_format(file_path)
+    columns = _columnar_analysis_columns(file_path, target_column) if file_format != CSV else None
+    return iter_frames(file_path, chunksize, columns), ""
@@ -1,64 +1,592 @@
 import os
 from dataclasses import dataclass
-from typing import List, Any
+from typing import List, Any, Dict, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 from .preprocessing.missing_values import handle_missing_values
-from .validations import file_exists, is_valid_csv, has_target_column
-from .analysis.correlation import compute_correlation_scores
+from .loader import load_dataset, iter_dataset_chunks, estimate_default_memory, validate_dataset
+from .validations import csv_read_error_message, read_csv_header, column_in_header
+from .profiling import Profiler
+from .cache import ResultCache
+from .sampling import SAMPLING_STRATEGIES, DEFAULT_SAMPLE_CHUNKSIZE, LineSampler, reservoir_sample
+from .incremental import update_state_from_file, DEFAULT_UPDATE_CHUNKSIZE
+from .formats import is_plain_csv, iter_frames
+from .feature_matrix import open_feature_matrix, write_feature_matrix, feature_matrix_scores, feature_matrix_correlation
+from .analysis.correlation import (
+    compute_correlation_scores,
+    compute_streaming_correlation_scores,
+    correlation_scores_from_matrix
+)
+from .analysis.blocked import blocked_correlation
+from .analysis.confidence import correlation_scores_with_intervals
+from .analysis.mutual_information import compute_mutual_information_scores
+from .analysis.rank_correlation import check_correlation_method, spearman_correlation, kendall_correlation
+from .analysis.ranking import rank_features_by_correlation
+from .analysis.redundancy import prune_redundant_features
+from .analysis.streaming import accumulate_correlation_state, handle_missing_values_state, correlation_matrix_from_state
+
+# Maximum share of missing values a column may have before it is dropped
+MISSING_THRESHOLD = 0.5
+
+# analyze_targets value selecting every numerical column as a target
+ALL_TARGETS = 'all'
+
+# analyze_features method scoring features by mutual information instead of correlation
+MUTUAL_INFO = 'mutual_info'
+
+# Leading features whose order must hold between two rounds of a growing sample when top_k is not set
+STABLE_TOP_K = 10
 
 @dataclass
 class Response:
     success: bool
     result: List[Any]
     error_message: str = ""
+    profile: Optional[List[Dict[str, Any]]] = None
+    scores: Optional[pd.DataFrame] = None
 
-def analyze_features(filename: str, target_column: str, debug: bool = False) -> Response:
+def analyze_features(filename: str, target_column: str, debug: bool = False, chunksize: Optional[int] = None,
+                     top_k: Optional[int] = None, min_score: Optional[float] = None,
+                     optimize_memory: bool = False, engine: Optional[str] = None,
+                     profile: bool = False, cache: bool = False, cache_dir: Optional[str] = None,
+                     state_path: Optional[str] = None, method: str = 'pearson',
+                     sample_size: Optional[int] = None, max_sample_size: Optional[int] = None,
+                     sampling: str = 'reservoir', seed: Optional[int] = None,
+                     matrix_path: Optional[str] = None, redundancy_threshold: Optional[float] = None) -> Response:
     """
-    Analyze features in a CSV file to determine which columns best predict a target variable.
+    Analyze features in a data file to determine which columns best predict a target variable.
     
     Args:
-        filename (str): Name of the CSV file in the data directory
+        filename (str): Name of the CSV (optionally compressed), Parquet or Feather file in the data directory
         target_column (str): Name of the column to predict
         debug (bool): If True, prints debug information including correlation matrix
-        
+        chunksize (Optional[int]): If set, stream the file in chunks of this many rows so that
+                                   memory stays bounded by the chunk size instead of the file size
+        top_k (Optional[int]): If set, return only the top_k most relevant features
+        min_score (Optional[float]): If set, return only features whose absolute correlation is at least this value
+        optimize_memory (bool): If True, parse only numerical columns (categorical ones too with 'mutual_info')
+                                with compact dtypes inferred from a sample
+        engine (Optional[str]): CSV parser engine for the in-memory read, e.g. 'pyarrow'
+        profile (bool): If True, record wall time, CPU time, shapes and memory of each stage in Response.profile
+        cache (bool): If True, reuse the parsed frame and correlation matrix of an unchanged file from an
+                      on-disk cache; a hit skips parsing and correlation entirely
+        cache_dir (Optional[str]): Cache directory (default: $COLUMN_PREDICTOR_CACHE_DIR or ~/.cache/column_predictor)
+        state_path (Optional[str]): If set, persist the correlation statistics of the file at this path and
+                                    on later runs only read the rows appended since the previous run
+        method (str): 'pearson', 'spearman', 'kendall', or 'mutual_info' to also rank categorical features
+                      and non-linear relationships; all but 'pearson' need the whole file in memory and
+                      cannot be combined with chunksize or state_path ('mutual_info' neither with cache)
+        sample_size (Optional[int]): If set, score an approximate ranking on a random sample of this many rows;
+                                     Response.scores then holds confidence intervals and rank bounds per feature
+        max_sample_size (Optional[int]): If set, double the sample until the top features keep the same order
+                                         between two rounds or the sample reaches this many rows
+        sampling (str): 'reservoir' reads the whole file once and keeps an exactly uniform sample; 'offset'
+                        reads only the sampled lines (fast) but favours rows that follow long lines, so the
+                        confidence intervals are only right when lines have similar lengths; compressed CSV,
+                        Parquet and Feather files always use 'reservoir'
+        seed (Optional[int]): Random seed of the sample
+        matrix_path (Optional[str]): If set, materialize the numerical columns left after missing-value handling
+                                     into a memory-mapped .npy file at this path and score off the mapped
+                                     buffer; later runs on the unchanged file reopen it without parsing
+        redundancy_threshold (Optional[float]): If set, keep only the best scoring feature of every group of
+                                                features whose absolute correlation with each other is at least
+                                                this value; Response.scores then holds the kept features with
+                                                columns ['feature', 'importance_score', 'rank']. Only for the
+                                                in-memory and matrix_path modes of the pearson and spearman methods
+    
     Returns:
         Response: Object containing success status and results
     """
-    # Validate file exists
-    exists, error = file_exists(filename)
-    if not exists:
-        return Response(success=False, result=[], error_message=error)
-    
-    # Validate CSV is valid
-    is_valid, error = is_valid_csv(filename)
-    if not is_valid:
-        return Response(success=False, result=[], error_message=error)
-    
-    # Validate target column exists
-    has_column, error = has_target_column(filename, target_column)
-    if not has_column:
-        return Response(success=False, result=[], error_message=error)
-    
-    # Read CSV file (we know it's valid now)
-    file_path = os.path.join('data', filename)
-    df = pd.read_csv(file_path)
+    check_method_options(method, chunksize, state_path, cache)
+    if redundancy_threshold is not None and (method in (MUTUAL_INFO, 'kendall') or chunksize is not None
+                                             or state_path is not None or cache or sample_size is not None):
+        raise ValueError("redundancy_threshold cannot be used with the mutual_info or kendall methods, chunksize, "
+                         "state_path, cache or sample_size")
+    profiler = Profiler(enabled=profile)
+    
+    if sample_size is not None:
+        if method != 'pearson' or chunksize is not None or state_path is not None or cache:
+            raise ValueError("sample_size only supports the pearson method without chunksize, state_path or cache")
+        return _analyze_features_sampled(filename, target_column, top_k, min_score, sample_size, max_sample_size,
+                                         sampling, seed, profiler)
+    
+    if matrix_path is not None:
+        if method == MUTUAL_INFO or chunksize is not None or state_path is not None or cache:
+            raise ValueError("matrix_path cannot be used with the mutual_info method, chunksize, state_path or cache")
+        return _analyze_features_mapped(filename, target_column, debug, top_k, min_score, optimize_memory, engine,
+                                        profiler, matrix_path, method, redundancy_threshold)
+    
+    if state_path is not None:
+        return _analyze_features_streaming(filename, target_column, debug, chunksize or DEFAULT_UPDATE_CHUNKSIZE,
+                                           top_k, min_score, profiler, state_path)
+    
+    if cache:
+        # The full matrix is cached so that later runs with any target can skip parsing and correlation
+        correlation_matrix, error = _correlation_matrix_for_file(
+            filename, [target_column], debug, chunksize, optimize_memory, engine, profiler, cache_dir, method=method
+        )
+        if correlation_matrix is None:
+            return Response(success=False, result=[], error_message=error, profile=profiler.to_list())
+        return _respond_from_matrix(correlation_matrix, target_column, debug, top_k, min_score, profiler)
+    
+    if chunksize is not None:
+        return _analyze_features_streaming(filename, target_column, debug, chunksize, top_k, min_score, profiler)
+    
+    # Validate and parse the file once
+    with profiler.stage('load') as stage:
+        df, error = load_dataset(filename, target_column, optimize_memory=optimize_memory, engine=engine,
+                                 keep_categorical=method == MUTUAL_INFO)
+        stage.output(df)
+    if df is None:
+        return Response(success=False, result=[], error_message=error, profile=profiler.to_list())
+    
+    if debug:
+        _print_memory_footprint(filename, df)
     
     # Handle missing values
-    df_cleaned, removed_columns = handle_missing_values(df, threshold=0.5)
+    with profiler.stage('handle_missing_values', df) as stage:
+        df_cleaned, removed_columns = handle_missing_values(df, threshold=MISSING_THRESHOLD)
+        stage.output(df_cleaned)
     
     if debug:
         # Get numerical columns only for correlation matrix
         numeric_df = df_cleaned.select_dtypes(include=['number'])
         if not numeric_df.empty:
-            print("\nCorrelation Matrix:")
-            pd.set_option('display.max_columns', None)
-            pd.set_option('display.width', None)
-            print(numeric_df.corr().round(3))
-            pd.reset_option('display.max_columns')
-            pd.reset_option('display.width')
+            _print_correlation_matrix(_numeric_correlation_matrix(numeric_df, profiler, method))
+    
+    # Calculate correlation scores; with pruning, top_k applies to the kept representatives
+    with profiler.stage('compute_correlation_scores', df_cleaned) as stage:
+        if method == MUTUAL_INFO:
+            correlation_df = compute_mutual_information_scores(df_cleaned, target_column, top_k=top_k, min_score=min_score)
+        else:
+            correlation_df = compute_correlation_scores(df_cleaned, target_column, min_score=min_score, method=method,
+                                                        top_k=top_k if redundancy_threshold is None else None)
+        stage.output(correlation_df)
+    
+    if redundancy_threshold is not None:
+        numeric_df = df_cleaned.select_dtypes(include=['number'])
+        with profiler.stage('prune_redundant_features', numeric_df) as stage:
+            ranked_df = prune_redundant_features(correlation_df, numeric_df.to_numpy(dtype=np.float64, na_value=np.nan),
+                                                 numeric_df.columns.tolist(), redundancy_threshold, top_k, method)
+            stage.output(ranked_df)
+        return Response(success=True, result=ranked_df['feature'].tolist(), profile=profiler.to_list(), scores=ranked_df)
+    
+    # Return features sorted by importance (absolute correlation)
+    return Response(success=True, result=correlation_df['feature'].tolist(), profile=profiler.to_list())
+
+def analyze_targets(filename: str, target_columns: Union[List[str], str] = ALL_TARGETS, debug: bool = False,
+                    chunksize: Optional[int] = None, top_k: Optional[int] = None, min_score: Optional[float] = None,
+                    optimize_memory: bool = False, engine: Optional[str] = None, profile: bool = False,
+                    cache: bool = False, cache_dir: Optional[str] = None, state_path: Optional[str] = None,
+                    method: str = 'pearson') -> Response:
+    """
+    Rank features for several target variables from a single shared correlation matrix.
+    
+    The file is parsed and the correlation matrix computed once, so ranking many targets
+    takes roughly the time of a single analysis.
+    
+    Args:
+        filename (str): Name of the CSV file in the data directory
+        target_columns (Union[List[str], str]): Names of the columns to predict, or 'all' for every
+                                                numerical column left after missing-value handling
+        debug (bool): If True, prints debug information including correlation matrix
+        chunksize (Optional[int]): If set, stream the file in chunks of this many rows
+        top_k (Optional[int]): If set, keep only the top_k most relevant features per target
+        min_score (Optional[float]): If set, keep only features whose absolute correlation is at least this value
+        optimize_memory (bool): If True, parse only numerical columns (categorical ones too with 'mutual_info')
+                                with compact dtypes inferred from a sample
+        engine (Optional[str]): CSV parser engine for the in-memory read, e.g. 'pyarrow'
+        profile (bool): If True, record per-stage measurements in Response.profile
+        cache (bool): If True, reuse the parsed frame and correlation matrix of an unchanged file from an on-disk cache
+        cache_dir (Optional[str]): Cache directory
+        state_path (Optional[str]): If set, persist the correlation statistics of the file at this path and
+                                    on later runs only read the rows appended since the previous run
+        method (str): 'pearson', 'spearman' or 'kendall'; rank methods need the whole file in memory
+                      and cannot be combined with chunksize or state_path
+    
+    Returns:
+        Response: result lists the analyzed targets; scores holds the combined frame with columns
+                  ['target', 'feature', 'importance_score', 'rank']
+    """
+    check_correlation_method(method)
+    check_method_options(method, chunksize, state_path)
+    profiler = Profiler(enabled=profile)
+    
+    if isinstance(target_columns, str) and target_columns != ALL_TARGETS:
+        target_columns = [target_columns]
+    requested = None if target_columns == ALL_TARGETS else list(target_columns)
+    
+    correlation_matrix, error = _correlation_matrix_for_file(
+        filename, requested or [], debug, chunksize, optimize_memory, engine, profiler, cache_dir,
+        use_cache=cache and state_path is None, state_path=state_path, method=method
+    )
+    if correlation_matrix is None:
+        return Response(success=False, result=[], error_message=error, profile=profiler.to_list())
+    
+    if debug:
+        _print_correlation_matrix(correlation_matrix)
+    
+    targets = correlation_matrix.columns.tolist() if requested is None else requested
+    
+    with profiler.stage('rank_targets', correlation_matrix) as stage:
+        rankings = []
+        for target in targets:
+            correlation_df = correlation_scores_from_matrix(correlation_matrix, target, top_k=top_k, min_score=min_score)
+            ranked_df = rank_features_by_correlation(correlation_df)
+            ranked_df.insert(0, 'target', target)
+            rankings.append(ranked_df)
+        columns = ['target', 'feature', 'importance_score', 'rank']
+        scores = pd.concat(rankings, ignore_index=True) if rankings else pd.DataFrame(columns=columns)
+        stage.output(scores)
+    
+    return Response(success=True, result=targets, profile=profiler.to_list(), scores=scores)
+
+def correlation_matrix_for_file(filename: str, *, method: str = 'pearson', chunksize: Optional[int] = None,
+                                optimize_memory: bool = False) -> Tuple[Optional[pd.DataFrame], str]:
+    """
+    Compute the correlation matrix of every numerical column of a file left after missing-value handling.
+    
+    The on-disk result cache is not used, so callers such as the analysis service can keep
+    the matrix in a cache of their own and rank any target from it.
+    
+    Args:
+        filename (str): Name of the data file in the data directory
+        method (str): 'pearson', 'spearman' or 'kendall'; rank methods need the whole file in memory
+                      and cannot be combined with chunksize
+        chunksize (Optional[int]): If set, stream the file in chunks of this many rows
+        optimize_memory (bool): If True, parse only numerical columns with compact dtypes inferred from a sample
+    
+    Returns:
+        Tuple[Optional[pd.DataFrame], str]: (correlation matrix or None on failure, error_message)
+    """
+    check_method_options(method, chunksize, None)
+    return _correlation_matrix_for_file(filename, [], False, chunksize, optimize_memory, None, Profiler(enabled=False),
+                                        None, use_cache=False, method=method)
+
+def _correlation_matrix_for_file(filename: str, target_columns: List[str], debug: bool, chunksize: Optional[int],
+                                 optimize_memory: bool, engine: Optional[str], profiler: Profiler,
+                                 cache_dir: Optional[str], use_cache: bool = True,
+                                 state_path: Optional[str] = None, method: str = 'pearson') -> Tuple[Optional[pd.DataFrame], str]:
+    """
+    Full correlation matrix of the numerical columns left after missing-value handling.
+    
+    Returns (matrix, "") on success or (None, error_message) if the file or a target column is invalid.
+    """
+    result_cache = None
+    with profiler.stage('validate') as stage:
+        error = _validate_targets(filename, target_columns)
+        if not error and use_cache:
+            result_cache = ResultCache(cache_dir)
+            # With optimize_memory and a single target, the target is parsed even if it is not numerical
+            frame_target = target_columns[0] if len(target_columns) == 1 else None
+            frame_key, matrix_key = _cache_keys(result_cache, filename, frame_target, optimize_memory, method)
+            correlation_matrix = result_cache.load_matrix(matrix_key)
+            stage.output(correlation_matrix)
+            if correlation_matrix is not None:
+                return correlation_matrix, ""
+    if error:
+        return None, error
+    
+    if state_path is not None:
+        with profiler.stage('update_state') as stage:
+            state, error = update_state_from_file(filename, state_path, chunksize or DEFAULT_UPDATE_CHUNKSIZE)
+            if state is not None:
+                stage.output_shape(state.n_rows, len(state.columns))
+        if state is None:
+            return None, error
+        state, removed_columns = handle_missing_values_state(state, threshold=MISSING_THRESHOLD)
+        correlation_matrix = correlation_matrix_from_state(state)
+    elif chunksize is not None:
+        chunks, error = iter_dataset_chunks(filename, None, chunksize)
+        if chunks is None:
+            return None, error
+        try:
+            with profiler.stage('load_and_accumulate') as stage:
+                state = accumulate_correlation_state(chunks)
+                stage.output_shape(state.n_rows, len(state.columns))
+        except Exception as e:
+            return None, csv_read_error_message(filename, e)
+        state, removed_columns = handle_missing_values_state(state, threshold=MISSING_THRESHOLD)
+        correlation_matrix = correlation_matrix_from_state(state)
+    else:
+        frame_target = target_columns[0] if len(target_columns) == 1 else None
+        with profiler.stage('load') as stage:
+            df = result_cache.load_frame(frame_key) if result_cache is not None else None
+            if df is None:
+                df, error = load_dataset(filename, frame_target, optimize_memory=optimize_memory, engine=engine)
+                if df is not None and result_cache is not None:
+                    result_cache.store_frame(frame_key, df)
+            stage.output(df)
+        if df is None:
+            return None, error
+        
+        if debug:
+            _print_memory_footprint(filename, df)
+        
+        with profiler.stage('handle_missing_values', df) as stage:
+            df_cleaned, removed_columns = handle_missing_values(df, threshold=MISSING_THRESHOLD)
+            stage.output(df_cleaned)
+        
+        correlation_matrix = _numeric_correlation_matrix(df_cleaned.select_dtypes(include=['number']), profiler, method)
+    
+    if result_cache is not None and not correlation_matrix.empty:
+        result_cache.store_matrix(matrix_key, correlation_matrix)
+    
+    return correlation_matrix, ""
+
+def _validate_targets(filename: str, target_columns: List[str]) -> str:
+    """Check the file and that every target column is in its header; return an error message, if any."""
+    error = validate_dataset(filename, target_columns[0] if target_columns else None)
+    if error or len(target_columns) < 2:
+        return error
+    
+    columns, error = read_csv_header(filename)
+    for target in target_columns[1:]:
+        _, error = column_in_header(filename, columns, target)
+        if error:
+            return error
+    return ""
+
+def check_method_options(method: str, chunksize: Optional[int], state_path: Optional[str], cache: bool = False) -> None:
+    """
+    Reject scoring methods that cannot be computed from streamed statistics or a cached matrix.
+    
+    Raises ValueError for unknown methods and for methods that cannot be combined with the
+    other options.
+    
+    Args:
+        method (str): Scoring method of analyze_features
+        chunksize (Optional[int]): Chunk size of a streamed analysis, None for in-memory
+        state_path (Optional[str]): Path of a persisted correlation state, if any
+        cache (bool): Whether the on-disk result cache is used
+    """
+    if method == MUTUAL_INFO:
+        if chunksize is not None or state_path is not None or cache:
+            raise ValueError(f"Method '{method}' needs the whole file in memory and cannot be used with "
+                             "chunksize, state_path or cache")
+        return
+    check_correlation_method(method)
+    if method != 'pearson' and (chunksize is not None or state_path is not None):
+        raise ValueError(f"Method '{method}' needs the whole file in memory and cannot be used with chunksize or state_path")
+
+def _numeric_correlation_matrix(numeric_df: pd.DataFrame, profiler: Profiler, method: str = 'pearson') -> pd.DataFrame:
+    """Correlation matrix of numerical columns, diagonal included."""
+    with profiler.stage('calculate_correlation_matrix', numeric_df) as stage:
+        values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        if method == 'spearman':
+            correlations = spearman_correlation(values)
+        elif method == 'kendall':
+            correlations = kendall_correlation(values)
+        else:
+            correlations = blocked_correlation(values)
+        correlation_matrix = pd.DataFrame(correlations, index=numeric_df.columns, columns=numeric_df.columns)
+        stage.output(correlation_matrix)
+    return correlation_matrix
+
+def _analyze_features_streaming(filename: str, target_column: str, debug: bool, chunksize: int,
+                                top_k: Optional[int], min_score: Optional[float], profiler: Profiler,
+                                state_path: Optional[str] = None) -> Response:
+    """Chunked variant of analyze_features that accumulates correlation statistics while reading."""
+    if state_path is not None:
+        error = validate_dataset(filename, target_column)
+        if error:
+            return Response(success=False, result=[], error_message=error, profile=profiler.to_list())
+        
+        # Only rows appended since the state was saved are read
+        with profiler.stage('update_state') as stage:
+            state, error = update_state_from_file(filename, state_path, chunksize)
+            if state is not None:
+                stage.output_shape(state.n_rows, len(state.columns))
+        if state is None:
+            return Response(success=False, result=[], error_message=error, profile=profiler.to_list())
+    else:
+        chunks, error = iter_dataset_chunks(filename, target_column, chunksize)
+        if chunks is None:
+            return Response(success=False, result=[], error_message=error, profile=profiler.to_list())
+        
+        # Reading and accumulating are interleaved, so they are measured as a single stage
+        try:
+            with profiler.stage('load_and_accumulate') as stage:
+                state = accumulate_correlation_state(chunks)
+                stage.output_shape(state.n_rows, len(state.columns))
+        except Exception as e:
+            return Response(success=False, result=[], error_message=csv_read_error_message(filename, e),
+                            profile=profiler.to_list())
+    
+    # Handle missing values
+    state, removed_columns = handle_missing_values_state(state, threshold=MISSING_THRESHOLD)
+    
+    if debug and state.columns:
+        _print_correlation_matrix(correlation_matrix_from_state(state))
     
     # Calculate correlation scores
-    correlation_df = compute_correlation_scores(df_cleaned, target_column)
+    with profiler.stage('compute_correlation_scores') as stage:
+        correlation_df = compute_streaming_correlation_scores(state, target_column, top_k=top_k, min_score=min_score)
+        stage.output(correlation_df)
     
     # Return features sorted by importance (absolute correlation)
-    return Response(success=True, result=correlation_df['feature'].tolist())
+    return Response(success=True, result=correlation_df['feature'].tolist(), profile=profiler.to_list())
+
+def _analyze_features_sampled(filename: str, target_column: str, top_k: Optional[int], min_score: Optional[float],
+                              sample_size: int, max_sample_size: Optional[int], sampling: str, seed: Optional[int],
+                              profiler: Profiler) -> Response:
+    """Approximate variant of analyze_features that scores a random sample of rows."""
+    if sampling not in SAMPLING_STRATEGIES:
+        raise ValueError(f"Unknown sampling strategy '{sampling}', expected one of: {', '.join(SAMPLING_STRATEGIES)}")
+    if sample_size <= 0:
+        raise ValueError("sample_size must be a positive integer")
+    max_sample_size = max(max_sample_size or sample_size, sample_size)
+    
+    error = validate_dataset(filename, target_column)
+    if error:
+        return Response(success=False, result=[], error_message=error, profile=profiler.to_list())
+    columns, _ = read_csv_header(filename)
+    file_path = os.path.join('data', filename)
+    
+    try:
+        with profiler.stage('sample') as stage:
+            # Rows of compressed and columnar files cannot be located by byte offset
+            if sampling == 'offset' and not is_plain_csv(file_path):
+                sampling = 'reservoir'
+            if sampling == 'reservoir':
+                # One pass over the file; prefixes of the reservoir are themselves uniform samples
+                chunks = iter_frames(file_path, DEFAULT_SAMPLE_CHUNKSIZE)
+                reservoir = reservoir_sample(chunks, max_sample_size, seed)
+                sample = reservoir.iloc[:sample_size]
+            else:
+                sampler = LineSampler(file_path, columns, seed)
+                sample = sampler.sample(sample_size)
+            stage.output(sample)
+        
+        # Grow the sample until the leading features keep their order between rounds
+        leaders = None
+        while True:
+            with profiler.stage('compute_correlation_scores', sample) as stage:
+                df_cleaned, removed_columns = handle_missing_values(sample, threshold=MISSING_THRESHOLD)
+                scores_df = correlation_scores_with_intervals(df_cleaned, target_column)
+                stage.output(scores_df)
+            
+            previous, leaders = leaders, scores_df['feature'].tolist()[:top_k or STABLE_TOP_K]
+            if leaders == previous or len(sample) >= max_sample_size:
+                break
+            
+            with profiler.stage('sample') as stage:
+                target_size = min(2 * len(sample), max_sample_size)
+                if sampling == 'reservoir':
+                    grown = reservoir.iloc[:target_size]
+                else:
+                    # A draw can come back empty when every offset lands on an already drawn line
+                    drawn = sampler.sample(target_size - len(sample))
+                    grown = pd.concat([sample, drawn], ignore_index=True) if len(drawn) else sample
+                stage.output(grown)
+            if len(grown) == len(sample):
+                break
+            sample = grown
+    except (pd.errors.EmptyDataError, pd.errors.ParserError) as e:
+        return Response(success=False, result=[], error_message=csv_read_error_message(filename, e),
+                        profile=profiler.to_list())
+    
+    if min_score is not None:
+        scores_df = scores_df[scores_df['importance_score'] >= min_score]
+    if top_k is not None:
+        scores_df = scores_df.head(top_k)
+    
+    return Response(success=True, result=scores_df['feature'].tolist(), profile=profiler.to_list(), scores=scores_df)
+
+def _analyze_features_mapped(filename: str, target_column: str, debug: bool, top_k: Optional[int],
+                             min_score: Optional[float], optimize_memory: bool, engine: Optional[str],
+                             profiler: Profiler, matrix_path: str, method: str,
+                             redundancy_threshold: Optional[float] = None) -> Response:
+    """Variant of analyze_features that scores off a memory-mapped feature matrix, reused while the file is unchanged."""
+    error = validate_dataset(filename, target_column)
+    if error:
+        return Response(success=False, result=[], error_message=error, profile=profiler.to_list())
+    
+    # The matrix holds every numerical column, so it is reused for any target
+    stat = os.stat(os.path.join('data', filename))
+    metadata = {
+        'source': os.path.abspath(os.path.join('data', filename)),
+        'fingerprint': [stat.st_size, stat.st_mtime_ns],
+        'optimize_memory': optimize_memory,
+        'missing_threshold': MISSING_THRESHOLD
+    }
+    with profiler.stage('open_feature_matrix') as stage:
+        matrix = open_feature_matrix(matrix_path, metadata)
+        if matrix is not None:
+            stage.output_shape(*matrix.values.shape)
+    
+    if matrix is None:
+        with profiler.stage('load') as stage:
+            df, error = load_dataset(filename, target_column, optimize_memory=optimize_memory, engine=engine)
+            stage.output(df)
+        if df is None:
+            return Response(success=False, result=[], error_message=error, profile=profiler.to_list())
+        
+        with profiler.stage('handle_missing_values', df) as stage:
+            df_cleaned, removed_columns = handle_missing_values(df, threshold=MISSING_THRESHOLD)
+            stage.output(df_cleaned)
+        
+        with profiler.stage('write_feature_matrix', df_cleaned) as stage:
+            matrix = write_feature_matrix(df_cleaned, matrix_path, metadata=metadata)
+            stage.output_shape(*matrix.values.shape)
+        # Scoring only needs the mapped matrix
+        del df, df_cleaned
+    
+    if debug and matrix.columns:
+        with profiler.stage('calculate_correlation_matrix') as stage:
+            correlation_matrix = feature_matrix_correlation(matrix, method=method)
+            stage.output(correlation_matrix)
+        _print_correlation_matrix(correlation_matrix)
+    
+    with profiler.stage('compute_correlation_scores') as stage:
+        correlation_df = feature_matrix_scores(matrix, target_column, min_score=min_score, method=method,
+                                               top_k=top_k if redundancy_threshold is None else None)
+        stage.output(correlation_df)
+    
+    if redundancy_threshold is not None:
+        with profiler.stage('prune_redundant_features') as stage:
+            ranked_df = prune_redundant_features(correlation_df, matrix.values, matrix.columns, redundancy_threshold,
+                                                 top_k, method)
+            stage.output(ranked_df)
+        return Response(success=True, result=ranked_df['feature'].tolist(), profile=profiler.to_list(), scores=ranked_df)
+    
+    return Response(success=True, result=correlation_df['feature'].tolist(), profile=profiler.to_list())
+
+def _cache_keys(result_cache: ResultCache, filename: str, target_column: Optional[str],
+                optimize_memory: bool, method: str = 'pearson') -> Tuple[str, str]:
+    """Cache keys of the parsed frame and of the correlation matrix of a file."""
+    digest = result_cache.file_digest(os.path.join('data', filename))
+    # With optimize_memory, and for Parquet and Feather files, the parsed columns depend on the target
+    # (kept even if not numerical)
+    frame_params = {'optimize_memory': optimize_memory, 'target': target_column}
+    matrix_params = {'optimize_memory': optimize_memory, 'missing_threshold': MISSING_THRESHOLD, 'method': method}
+    return result_cache.entry_key(digest, 'frame', frame_params), result_cache.entry_key(digest, 'matrix', matrix_params)
+
+def _respond_from_matrix(correlation_matrix: pd.DataFrame, target_column: str, debug: bool, top_k: Optional[int],
+                         min_score: Optional[float], profiler: Profiler) -> Response:
+    """Build the response from a full correlation matrix of the numerical columns."""
+    if debug:
+        _print_correlation_matrix(correlation_matrix)
+    
+    with profiler.stage('compute_correlation_scores', correlation_matrix) as stage:
+        correlation_df = correlation_scores_from_matrix(correlation_matrix, target_column, top_k=top_k, min_score=min_score)
+        stage.output(correlation_df)
+    
+    return Response(success=True, result=correlation_df['feature'].tolist(), profile=profiler.to_list())
+
+def _print_correlation_matrix(correlation_matrix: pd.DataFrame) -> None:
+    """Print a correlation matrix in full, without column truncation."""
+    print("\nCorrelation Matrix:")
+    pd.set_option('display.max_columns', None)
+    pd.set_option('display.width', None)
+    print(correlation_matrix.round(3))
+    pd.reset_option('display.max_columns')
+    pd.reset_option('display.width')
+
+def _print_memory_footprint(filename: str, df: pd.DataFrame) -> None:
+    """Print the footprint of the loaded frame next to the estimate for a default read_csv."""
+    default_bytes = estimate_default_memory(filename, len(df))
+    loaded_bytes = int(df.memory_usage(deep=True, index=False).sum())
+    print("\nMemory footprint:")
+    print(f"- default dtypes (estimated): {default_bytes / 1024 ** 2:.2f} MB")
+    print(f"- loaded: {loaded_bytes / 1024 ** 2:.2f} MB ({len(df.columns)} columns)")
@@ -1,39 +1,48 @@
 from typing import List, Tuple
 import pandas as pd
 
-def apply_one_hot_encoding(df: pd.DataFrame, max_categories: int) -> Tuple[pd.DataFrame, List[str]]:
+def apply_one_hot_encoding(df: pd.DataFrame, max_categories: int, sparse: bool = False) -> Tuple[pd.DataFrame, List[str]]:
     """
     Apply one-hot encoding to categorical columns while respecting category limits.
     
+    Categories beyond the max_categories most frequent ones are collapsed into 'other'
+    with a vectorized membership test, and all indicator columns are built in a single
+    get_dummies call instead of one concat per column.
+    
     Args:
         df (pd.DataFrame): Input DataFrame
         max_categories (int): Maximum number of categories to encode per feature
+        sparse (bool): If True, indicator columns use a SparseDtype to save memory on
+                       high-cardinality data (default: False)
         
     Returns:
         Tuple[pd.DataFrame, List[str]]: DataFrame with encoded columns and list of original categorical columns
     """
     # Store original categorical columns
-    categorical_columns = df.select_dtypes(include=['object']).columns.tolist()
+    categorical_columns = df.select_dtypes(include=['object', 'category']).columns.tolist()
+    
+    if not categorical_columns:
+        return df.copy(), categorical_columns
     
-    # Create a copy to avoid modifying the original
-    df_encoded = df.copy()
+    # Shallow copy: only the collapsed columns are replaced, the rest is shared
+    df_collapsed = df.copy(deep=False)
     
     for col in categorical_columns:
-        # Get unique values and their counts
+        # Get unique values and their counts (unused levels of categorical columns are ignored)
         value_counts = df[col].value_counts()
+        value_counts = value_counts[value_counts > 0]
         
         # If number of categories exceeds max_categories, keep only the most frequent ones
         if len(value_counts) > max_categories:
-            # Keep the most frequent categories
-            top_categories = value_counts.head(max_categories).index
-            # Replace other categories with 'other'
-            df_encoded[col] = df_encoded[col].apply(lambda x: x if x in top_categories else 'other')
-        
-        # Apply one-hot encoding
-        dummies = pd.get_dummies(df_encoded[col], prefix=col)
-        df_encoded = pd.concat([df_encoded, dummies], axis=1)
-        
-        # Drop the original categorical column
-        df_encoded = df_encoded.drop(columns=[col])
+            top_categories = value_counts.index[:max_categories]
+            # Replace other categories (and missing values) with 'other'
+            values = df[col].astype(object)
+            df_collapsed[col] = values.where(values.isin(top_categories), 'other')
+        elif isinstance(df[col].dtype, pd.CategoricalDtype):
+            # get_dummies emits an all-zero column for every unused level of a categorical column
+            df_collapsed[col] = df[col].cat.remove_unused_categories()
+    
+    # Encode all categorical columns at once; originals are dropped and dummies appended in column order
+    df_encoded = pd.get_dummies(df_collapsed, columns=categorical_columns, sparse=sparse)
     
     return df_encoded, categorical_columns
@@ -2,28 +2,48 @@ from typing import Tuple, List
 import pandas as pd
 import numpy as np
 
+def feature_type_of_dtype(dtype) -> str:
+    """
+    Classify a column dtype as numerical or categorical.
+    
+    Args:
+        dtype: pandas or NumPy dtype of the column
+    
+    Returns:
+        str: 'numerical' or 'categorical'
+    """
+    # Check if column is numeric
+    if pd.api.types.is_numeric_dtype(dtype):
+        return 'numerical'
+    # Check if column is categorical (object/string or category type)
+    if pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+        return 'categorical'
+    # Default to numerical for other types
+    return 'numerical'
+
+def detect_feature_types_from_dtypes(dtypes: pd.Series) -> Tuple[List[str], List[str]]:
+    """
+    Detect which columns are numerical and which are categorical from dtype metadata only.
+    
+    No column data is touched, so the types can be decided from the first chunk of a
+    streamed file.
+    
+    Args:
+        dtypes (pd.Series): Dtype of each column indexed by column name, e.g. df.dtypes
+    
+    Returns:
+        Tuple[List[str], List[str]]: Lists of column names and their types ('numerical' or 'categorical')
+    """
+    return dtypes.index.tolist(), [feature_type_of_dtype(dtype) for dtype in dtypes]
+
 def detect_feature_types(df: pd.DataFrame) -> Tuple[List[str], List[str]]:
     """
     Detect which columns are numerical and which are categorical.
     
     Args:
         df (pd.DataFrame): Input DataFrame
-        
+    
     Returns:
         Tuple[List[str], List[str]]: Lists of column names and their types ('numerical' or 'categorical')
     """
-    column_names = df.columns.tolist()
-    column_types = []
-    
-    for col in df.columns:
-        # Check if column is numeric
-        if pd.api.types.is_numeric_dtype(df[col]):
-            column_types.append('numerical')
-        # Check if column is categorical (object/string type)
-        elif pd.api.types.is_object_dtype(df[col]):
-            column_types.append('categorical')
-        # Default to numerical for other types
-        else:
-            column_types.append('numerical')
-    
-    return column_names, column_types
+    return detect_feature_types_from_dtypes(df.dtypes)
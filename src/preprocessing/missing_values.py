@@ -1,6 +1,43 @@
 from typing import Tuple, List
+import numpy as np
 import pandas as pd
 
+# Rows of a float column checked for NaN at a time, bounding the temporary mask
+_COUNT_BLOCK_ROWS = 1 << 20
+
+def count_missing_values(df: pd.DataFrame) -> pd.Series:
+    """
+    Count the missing values of each column without building a null mask of the whole frame.
+    
+    Columns are counted one at a time: Arrow-backed columns read the null count kept with
+    their validity bitmaps, float columns are scanned for NaN in row blocks, and other
+    columns fall back to Series.count(). Extra memory is O(columns) plus one block.
+    
+    Args:
+        df (pd.DataFrame): Input DataFrame
+    
+    Returns:
+        pd.Series: Number of missing values per column, indexed like df.columns
+    """
+    counts = [_count_missing(series) for _, series in df.items()]
+    return pd.Series(counts, index=df.columns, dtype=np.int64)
+
+def columns_above_missing_threshold(missing_counts: pd.Series, n_rows: int, threshold: float) -> List[str]:
+    """
+    Select the columns whose share of missing values is above the threshold.
+    
+    Args:
+        missing_counts (pd.Series): Number of missing values per column
+        n_rows (int): Number of rows the counts cover
+        threshold (float): Maximum percentage of missing values allowed (0-1)
+    
+    Returns:
+        List[str]: Column names to remove, in the order of missing_counts; none if there are no rows
+    """
+    if n_rows == 0:
+        return []
+    return missing_counts.index[missing_counts / n_rows > threshold].tolist()
+
 def handle_missing_values(df: pd.DataFrame, threshold: float) -> Tuple[pd.DataFrame, List[str]]:
     """
     Remove columns that have missing values above the specified threshold.
@@ -8,17 +45,32 @@ def handle_missing_values(df: pd.DataFrame, threshold: float) -> Tuple[pd.DataFr
     Args:
         df (pd.DataFrame): Input DataFrame
         threshold (float): Maximum percentage of missing values allowed (0-1)
-        
+    
     Returns:
         Tuple[pd.DataFrame, List[str]]: DataFrame with columns removed and list of removed column names
     """
-    # Calculate percentage of missing values for each column
-    missing_percentages = df.isnull().mean()
+    missing_counts = count_missing_values(df)
     
     # Get columns to remove (those above threshold)
-    columns_to_remove = missing_percentages[missing_percentages > threshold].index.tolist()
+    columns_to_remove = columns_above_missing_threshold(missing_counts, len(df), threshold)
     
     # Remove columns
     df_cleaned = df.drop(columns=columns_to_remove)
     
     return df_cleaned, columns_to_remove
+
+def _count_missing(series: pd.Series) -> int:
+    dtype = series.dtype
+    if isinstance(dtype, pd.ArrowDtype):
+        return series.array.__arrow_array__().null_count
+    
+    if isinstance(dtype, np.dtype):
+        # NumPy integer and boolean columns cannot hold missing values
+        if dtype.kind in 'iub':
+            return 0
+        if dtype.kind == 'f':
+            values = series.to_numpy()
+            return sum(int(np.count_nonzero(np.isnan(values[start:start + _COUNT_BLOCK_ROWS])))
+                       for start in range(0, len(values), _COUNT_BLOCK_ROWS))
+    
+    return len(series) - int(series.count())
@@ -1,12 +1,117 @@
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional
+import numpy as np
 import pandas as pd
 
-def normalize_features(df: pd.DataFrame, normalize: bool = True) -> pd.DataFrame:
+@dataclass
+class MinMaxScaler:
+    """
+    Fitted min-max scaling parameters for a set of numerical columns.
+    
+    Attributes:
+        columns (List[str]): Names of the numerical columns the scaler was fitted on
+        data_min (List[float]): Minimum of each column
+        data_max (List[float]): Maximum of each column
+    """
+    columns: List[str]
+    data_min: List[float]
+    data_max: List[float]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the parameters as a JSON-serializable dictionary."""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, params: Dict[str, Any]) -> 'MinMaxScaler':
+        """Rebuild a scaler from the output of to_dict."""
+        return cls(
+            columns=list(params['columns']),
+            data_min=[float(value) for value in params['data_min']],
+            data_max=[float(value) for value in params['data_max']]
+        )
+
+def _column_extremes(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """Per-column [min, max] rows of the given columns, ignoring missing values (NaN if all missing)."""
+    values = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+    present = ~np.isnan(values)
+    extremes = np.vstack([
+        np.min(values, axis=0, initial=np.inf, where=present),
+        np.max(values, axis=0, initial=-np.inf, where=present)
+    ])
+    extremes[np.isinf(extremes) & ~present.any(axis=0)] = np.nan
+    return extremes
+
+def fit_min_max_scaler(df: pd.DataFrame) -> MinMaxScaler:
+    """
+    Compute the min-max scaling parameters of the numerical columns of a DataFrame.
+    
+    Args:
+        df (pd.DataFrame): Input DataFrame
+        
+    Returns:
+        MinMaxScaler: Fitted scaler
+    """
+    columns = df.select_dtypes(include=['number']).columns.tolist()
+    extremes = _column_extremes(df, columns)
+    return MinMaxScaler(columns=columns, data_min=extremes[0].tolist(), data_max=extremes[1].tolist())
+
+def update_min_max_scaler(scaler: MinMaxScaler, df: pd.DataFrame) -> MinMaxScaler:
+    """
+    Extend a fitted scaler with the values of another chunk or batch of rows.
+    
+    Args:
+        scaler (MinMaxScaler): Scaler fitted on the previous rows
+        df (pd.DataFrame): New rows containing the scaler's columns
+        
+    Returns:
+        MinMaxScaler: Scaler fitted on the previous and the new rows
+    """
+    extremes = _column_extremes(df, scaler.columns)
+    return MinMaxScaler(
+        columns=list(scaler.columns),
+        data_min=np.fmin(scaler.data_min, extremes[0]).tolist(),
+        data_max=np.fmax(scaler.data_max, extremes[1]).tolist()
+    )
+
+def apply_min_max_scaler(df: pd.DataFrame, scaler: MinMaxScaler, copy: bool = True) -> pd.DataFrame:
+    """
+    Scale the scaler's columns of a DataFrame to [0, 1] using previously fitted parameters.
+    
+    Constant columns (min equal to max) are set to 0.0.
+    
+    Args:
+        df (pd.DataFrame): Input DataFrame containing the scaler's columns
+        scaler (MinMaxScaler): Fitted scaler
+        copy (bool): If False, the scaled columns are written into df instead of a copy
+        
+    Returns:
+        pd.DataFrame: DataFrame with scaled columns, others unchanged
+    """
+    df_normalized = df.copy() if copy else df
+    if not scaler.columns:
+        return df_normalized
+    
+    data_min = np.asarray(scaler.data_min, dtype=np.float64)
+    data_range = np.asarray(scaler.data_max, dtype=np.float64) - data_min
+    constant = data_range == 0
+    
+    values = df[scaler.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+    scaled = (values - data_min) / np.where(constant, 1.0, data_range)
+    scaled[:, constant] = 0.0
+    
+    df_normalized[scaler.columns] = scaled
+    return df_normalized
+
+def normalize_features(df: pd.DataFrame, normalize: bool = True, copy: bool = True,
+                       scaler: Optional[MinMaxScaler] = None) -> pd.DataFrame:
     """
     Normalize numerical features in DataFrame using min-max scaling if normalize is True.
     
     Args:
         df (pd.DataFrame): Input DataFrame
         normalize (bool): Flag to determine whether to perform normalization
+        copy (bool): If False, normalized columns are written into df instead of a copy
+        scaler (Optional[MinMaxScaler]): Previously fitted scaler to reuse; fitted on df if not given
         
     Returns:
         pd.DataFrame: DataFrame with normalized numerical columns (if normalize is True), others unchanged
@@ -14,16 +119,7 @@ def normalize_features(df: pd.DataFrame, normalize: bool = True) -> pd.DataFrame
     if not normalize:
         return df
     
-    df_normalized = df.copy()
-    numeric_cols = df_normalized.select_dtypes(include=['number']).columns
+    if scaler is None:
+        scaler = fit_min_max_scaler(df)
     
-    for col in numeric_cols:
-        col_min = df_normalized[col].min()
-        col_max = df_normalized[col].max()
-        if col_max - col_min == 0:
-            # Column is constant, set to 0.0
-            df_normalized[col] = 0.0
-        else:
-            df_normalized[col] = (df_normalized[col] - col_min) / (col_max - col_min)
-    
-    return df_normalized
+    return apply_min_max_scaler(df, scaler, copy=copy)
@@ -0,0 +1,176 @@
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+@dataclass
+class StageProfile:
+    """
+    Measurements of one pipeline stage.
+    
+    Attributes:
+        stage (str): Stage name
+        wall_seconds (float): Elapsed wall-clock time
+        cpu_seconds (float): CPU time of the process during the stage
+        rows_in (Optional[int]): Rows of the stage input, if known
+        columns_in (Optional[int]): Columns of the stage input, if known
+        rows_out (Optional[int]): Rows of the stage output, if known
+        columns_out (Optional[int]): Columns of the stage output, if known
+        peak_rss_bytes (Optional[int]): Peak resident set size of the process at the end of the stage
+        traced_peak_bytes (Optional[int]): Peak Python/NumPy allocations during the stage above its
+                                           starting point (tracemalloc), if memory tracing is on
+    """
+    stage: str
+    wall_seconds: float
+    cpu_seconds: float
+    rows_in: Optional[int] = None
+    columns_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    columns_out: Optional[int] = None
+    peak_rss_bytes: Optional[int] = None
+    traced_peak_bytes: Optional[int] = None
+
+class StageRecorder:
+    """Handle yielded by Profiler.stage to report the shape of a stage output."""
+    
+    def __init__(self):
+        self.shape_out: Tuple[Optional[int], Optional[int]] = (None, None)
+    
+    def output(self, data: Any) -> None:
+        """Record the rows and columns of the stage output."""
+        self.shape_out = data_shape(data)
+    
+    def output_shape(self, rows: int, columns: int) -> None:
+        """Record the rows and columns of a stage output that has no shape attribute."""
+        self.shape_out = (rows, columns)
+
+class Profiler:
+    """
+    Collect per-stage timing and memory measurements of a pipeline run.
+    
+    When disabled, stage() hands out a shared no-op recorder and measures nothing, so
+    instrumented code pays only a function call per stage.
+    """
+    
+    def __init__(self, enabled: bool = True, trace_memory: bool = True):
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.stages: List[StageProfile] = []
+    
+    @contextmanager
+    def stage(self, name: str, data_in: Any = None) -> Iterator[StageRecorder]:
+        """
+        Measure the enclosed block as a pipeline stage.
+        
+        Args:
+            name (str): Stage name
+            data_in (Any): Stage input, used to record its shape
+            
+        Yields:
+            StageRecorder: Recorder on which the stage output can be reported
+        """
+        if not self.enabled:
+            yield _NULL_RECORDER
+            return
+        
+        recorder = StageRecorder()
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            traced_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield recorder
+        finally:
+            wall_seconds = time.perf_counter() - wall_start
+            cpu_seconds = time.process_time() - cpu_start
+            traced_peak = None
+            if self.trace_memory:
+                traced_peak = max(tracemalloc.get_traced_memory()[1] - traced_start, 0)
+            if started_tracing:
+                tracemalloc.stop()
+            rows_in, columns_in = data_shape(data_in)
+            rows_out, columns_out = recorder.shape_out
+            self.stages.append(StageProfile(
+                stage=name,
+                wall_seconds=wall_seconds,
+                cpu_seconds=cpu_seconds,
+                rows_in=rows_in,
+                columns_in=columns_in,
+                rows_out=rows_out,
+                columns_out=columns_out,
+                peak_rss_bytes=peak_rss_bytes(),
+                traced_peak_bytes=traced_peak
+            ))
+    
+    def to_list(self) -> Optional[List[Dict[str, Any]]]:
+        """Return the measurements as a list of dictionaries, or None when disabled."""
+        if not self.enabled:
+            return None
+        return [asdict(stage) for stage in self.stages]
+
+class _NullRecorder(StageRecorder):
+    def output(self, data: Any) -> None:
+        pass
+    
+    def output_shape(self, rows: int, columns: int) -> None:
+        pass
+
+_NULL_RECORDER = _NullRecorder()
+
+def data_shape(data: Any) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Return (rows, columns) of a DataFrame-like object, or (None, None) if it has no 2-D shape.
+    
+    Args:
+        data (Any): DataFrame, array or any object with a shape attribute
+        
+    Returns:
+        Tuple[Optional[int], Optional[int]]: (rows, columns)
+    """
+    shape = getattr(data, 'shape', None)
+    if shape is None or len(shape) != 2:
+        return None, None
+    return int(shape[0]), int(shape[1])
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of the current process, in bytes (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return int(peak if sys.platform == 'darwin' else peak * 1024)
+
+def format_profile(profile: List[Dict[str, Any]]) -> str:
+    """
+    Format stage measurements as a fixed-width table.
+    
+    Args:
+        profile (List[Dict[str, Any]]): Measurements from Profiler.to_list
+        
+    Returns:
+        str: Table with one line per stage
+    """
+    def shape(rows: Optional[int], columns: Optional[int]) -> str:
+        return '-' if rows is None else f"{rows}x{columns}"
+    
+    def megabytes(value: Optional[int]) -> str:
+        return '-' if value is None else f"{value / 1024 ** 2:.1f}"
+    
+    lines = [f"{'stage':<28} {'wall s':>9} {'cpu s':>9} {'in':>14} {'out':>14} {'traced MB':>10} {'peak RSS MB':>12}"]
+    for stage in profile:
+        lines.append(
+            f"{stage['stage']:<28} {stage['wall_seconds']:>9.4f} {stage['cpu_seconds']:>9.4f} "
+            f"{shape(stage['rows_in'], stage['columns_in']):>14} {shape(stage['rows_out'], stage['columns_out']):>14} "
+            f"{megabytes(stage['traced_peak_bytes']):>10} {megabytes(stage['peak_rss_bytes']):>12}"
+        )
+    return "\n".join(lines)
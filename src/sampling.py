@@ -0,0 +1,103 @@
+import io
+import os
+from typing import Iterable, List, Optional, Set
+import numpy as np
+import pandas as pd
+
+SAMPLING_STRATEGIES = ('offset', 'reservoir')
+
+# Rows per chunk while a reservoir sample is drawn from the whole file
+DEFAULT_SAMPLE_CHUNKSIZE = 100000
+
+class LineSampler:
+    """
+    Draw random rows of a CSV file by seeking to random byte offsets.
+    
+    Only the sampled lines are read, so the cost depends on the sample size and not on
+    the file size. Each draw picks the first line starting at or after a uniformly random
+    byte, wrapping around at the end of the file, which favours lines that follow long
+    lines; for files whose lines have similar lengths the sample is close to uniform.
+    Records must not contain quoted line breaks.
+    Lines are never drawn twice, so repeated calls grow one sample without replacement.
+    """
+    
+    def __init__(self, file_path: str, columns: List[str], seed: Optional[int] = None):
+        self.file_path = file_path
+        self.columns = columns
+        self.rng = np.random.default_rng(seed)
+        self.seen: Set[int] = set()
+        with open(file_path, 'rb') as f:
+            f.readline()
+            self.data_start = f.tell()
+        self.file_size = os.path.getsize(file_path)
+    
+    def sample(self, n_rows: int) -> pd.DataFrame:
+        """
+        Draw up to n_rows lines that were not drawn before.
+        
+        Args:
+            n_rows (int): Number of random byte offsets to draw
+        
+        Returns:
+            pd.DataFrame: Parsed rows; fewer than n_rows if offsets hit already drawn lines or the file is small
+        """
+        lines = []
+        if self.file_size > self.data_start:
+            offsets = np.sort(self.rng.integers(self.data_start, self.file_size, size=n_rows))
+            with open(self.file_path, 'rb') as f:
+                for offset in offsets:
+                    # Skip the rest of the line containing byte offset - 1 to land on a line start
+                    f.seek(offset - 1)
+                    f.readline()
+                    start = f.tell()
+                    line = f.readline()
+                    if not line:
+                        # Offsets inside the last line wrap around to the first data line
+                        start = self.data_start
+                        f.seek(start)
+                        line = f.readline()
+                    if not line.strip() or start in self.seen:
+                        continue
+                    self.seen.add(start)
+                    lines.append(line if line.endswith(b'\n') else line + b'\n')
+        
+        if not lines:
+            return pd.DataFrame(columns=self.columns)
+        return pd.read_csv(io.BytesIO(b''.join(lines)), header=None, names=self.columns)
+
+def reservoir_sample(chunks: Iterable[pd.DataFrame], n_rows: int, seed: Optional[int] = None) -> pd.DataFrame:
+    """
+    Keep a uniform random sample of n_rows rows while reading a file in chunks.
+    
+    Every row gets a random key and the n_rows rows with the smallest keys are kept, which
+    is a uniform sample without replacement. Peak memory is bounded by the sample plus one
+    chunk. Rows are returned in random order, so every prefix of the result is itself a
+    uniform sample.
+    
+    Args:
+        chunks (Iterable[pd.DataFrame]): Chunks of the file, e.g. from pd.read_csv(chunksize=...)
+        n_rows (int): Sample size
+        seed (Optional[int]): Random seed
+    
+    Returns:
+        pd.DataFrame: Sampled rows with a fresh RangeIndex
+    """
+    if n_rows <= 0:
+        raise ValueError("n_rows must be a positive integer")
+    
+    rng = np.random.default_rng(seed)
+    reservoir = None
+    keys = np.empty(0)
+    for chunk in chunks:
+        chunk_keys = rng.random(len(chunk))
+        candidates = chunk if reservoir is None else pd.concat([reservoir, chunk], ignore_index=True)
+        keys = np.concatenate([keys, chunk_keys])
+        if len(keys) > n_rows:
+            keep = np.argpartition(keys, n_rows)[:n_rows]
+            candidates, keys = candidates.iloc[keep], keys[keep]
+        reservoir = candidates.reset_index(drop=True)
+    
+    if reservoir is None:
+        return pd.DataFrame()
+    order = np.argsort(keys)
+    return reservoir.iloc[order].reset_index(drop=True)
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, Tuple
+from .batch import BatchJob, response_to_record, run_job, limit_worker_memory
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from .main import Response
+
+DEFAULT_CACHE_MB = 512
+
+# Request fields besides filename and target_column, passed on to analyze_features
+REQUEST_OPTIONS = ('top_k', 'min_score', 'method', 'optimize_memory', 'chunksize',
+                   'sample_size', 'max_sample_size', 'sampling', 'seed')
+
+# Options that change the correlation matrix; the others only change how it is ranked
+_MATRIX_OPTIONS = ('method', 'optimize_memory', 'chunksize')
+
+class MatrixCache:
+    """
+    In-memory LRU cache of correlation matrices bounded by their total size in bytes.
+    
+    A matrix larger than the whole budget is not cached.
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries: 'OrderedDict[Hashable, pd.DataFrame]' = OrderedDict()
+        self.total_bytes = 0
+    
+    def get(self, key: Hashable) -> Optional['pd.DataFrame']:
+        """Return a cached matrix and mark it as most recently used, or None on a miss."""
+        matrix = self.entries.get(key)
+        if matrix is not None:
+            self.entries.move_to_end(key)
+        return matrix
+    
+    def put(self, key: Hashable, matrix: 'pd.DataFrame') -> None:
+        """Store a matrix, evicting least recently used ones until the cache fits in max_bytes."""
+        size = matrix.values.nbytes
+        if size > self.max_bytes:
+            return
+        if key in self.entries:
+            self.total_bytes -= self.entries.pop(key).values.nbytes
+        self.entries[key] = matrix
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.total_bytes -= evicted.values.nbytes
+
+class AnalysisService:
+    """
+    Serve analyze_features requests from a long-running process.
+    
+    Parsing and correlation run in a pool of worker processes that import pandas once, so
+    requests do not block each other or the event loop. The correlation matrix of each
+    file is kept in an LRU cache keyed by the file's path, size and modification time:
+    requests for any target of a cached file are ranked straight from the matrix, and
+    concurrent requests for a file that is still being analyzed wait for the same
+    computation. Methods that need the rows themselves (mutual_info, sampling) run
+    analyze_features in the pool on every request.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, max_cache_bytes: int = DEFAULT_CACHE_MB * 1024 ** 2,
+                 memory_limit_mb: Optional[int] = None):
+        self.max_workers = max_workers
+        self.memory_limit_mb = memory_limit_mb
+        self.cache = MatrixCache(max_cache_bytes)
+        self.matrix_computations = 0
+        self._executor = self._new_executor()
+        self._pending: Dict[Hashable, asyncio.Task] = {}
+    
+    async def analyze(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Answer one request.
+        
+        Args:
+            request (Dict[str, Any]): Object with 'filename', 'target_column' and optionally the
+                                      fields of REQUEST_OPTIONS
+        
+        Returns:
+            Dict[str, Any]: Record in the format of the batch mode's JSON lines
+        """
+        from .main import Response
+        
+        job, options, error = _parse_request(request)
+        if job is None:
+            return {'success': False, 'result': [], 'error_message': error}
+        
+        try:
+            if options.get('method', 'pearson') == 'mutual_info' or options.get('sample_size') is not None:
+                response = await self._in_pool(run_job, job, options)
+            else:
+                response = await self._analyze_from_matrix(job, options)
+        except BrokenProcessPool:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._new_executor()
+            response = Response(success=False, result=[],
+                                error_message=f"Worker process died while analyzing '{job.filename}'")
+        except Exception as e:
+            response = Response(success=False, result=[], error_message=f"Error analyzing '{job.filename}': {e}")
+        return response_to_record(job, response)
+    
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve newline-delimited JSON requests on one connection.
+        
+        Requests on the same connection are answered concurrently, in completion order; the
+        'id' field of a request, if any, is copied to its answer.
+        """
+        lock = asyncio.Lock()
+        tasks = set()
+        
+        async def answer(line: bytes) -> None:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                request = None
+            record = await self.analyze(request)
+            if isinstance(request, dict) and 'id' in request:
+                record['id'] = request['id']
+            async with lock:
+                writer.write(json.dumps(record).encode() + b'\n')
+                await writer.drain()
+        
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    task = asyncio.create_task(answer(line))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown(cancel_futures=True)
+    
+    async def _analyze_from_matrix(self, job: BatchJob, options: Dict[str, Any]) -> 'Response':
+        from .loader import validate_dataset
+        from .main import Response, check_method_options
+        from .analysis.correlation import correlation_scores_from_matrix
+        
+        # Same restrictions as analyze_features, e.g. rank methods cannot be streamed with chunksize
+        check_method_options(options.get('method', 'pearson'), options.get('chunksize'), None)
+        # Header-only check, so unknown files and targets fail fast without using a worker
+        error = await asyncio.to_thread(validate_dataset, job.filename, job.target_column)
+        if error:
+            return Response(success=False, result=[], error_message=error)
+        
+        matrix, error = await self._matrix(job.filename, {key: options[key] for key in _MATRIX_OPTIONS if key in options})
+        if matrix is None:
+            return Response(success=False, result=[], error_message=error)
+        
+        correlation_df = correlation_scores_from_matrix(matrix, job.target_column, top_k=options.get('top_k'),
+                                                        min_score=options.get('min_score'))
+        return Response(success=True, result=correlation_df['feature'].tolist())
+    
+    async def _matrix(self, filename: str, matrix_options: Dict[str, Any]) -> Tuple[Optional['pd.DataFrame'], str]:
+        """Correlation matrix of a file from the cache, from a running computation, or computed in the pool."""
+        stat = os.stat(os.path.join('data', filename))
+        key = (os.path.abspath(os.path.join('data', filename)), stat.st_size, stat.st_mtime_ns,
+               tuple(sorted(matrix_options.items())))
+        
+        matrix = self.cache.get(key)
+        if matrix is not None:
+            return matrix, ""
+        
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.create_task(self._compute_matrix(key, filename, matrix_options))
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        # A cancelled request must not cancel the computation other requests wait for
+        return await asyncio.shield(task)
+    
+    async def _compute_matrix(self, key: Hashable, filename: str,
+                              matrix_options: Dict[str, Any]) -> Tuple[Optional['pd.DataFrame'], str]:
+        self.matrix_computations += 1
+        matrix, error = await self._in_pool(_correlation_matrix_job, filename, matrix_options)
+        if matrix is not None:
+            self.cache.put(key, matrix)
+        return matrix, error
+    
+    async def _in_pool(self, function, *args) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+    
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.max_workers, initializer=limit_worker_memory,
+                                   initargs=(self.memory_limit_mb,))
+
+async def serve(service: AnalysisService, socket_path: Optional[str] = None, host: str = '127.0.0.1',
+                port: int = 8765) -> None:
+    """
+    Run the service on a Unix socket, or on a TCP port if no socket path is given, until cancelled.
+    
+    Args:
+        service (AnalysisService): Service answering the requests
+        socket_path (Optional[str]): Path of the Unix socket
+        host (str): TCP host to listen on when socket_path is None
+        port (int): TCP port to listen on when socket_path is None
+    """
+    if socket_path is not None:
+        server = await asyncio.start_unix_server(service.handle_connection, path=socket_path)
+    else:
+        server = await asyncio.start_server(service.handle_connection, host=host, port=port)
+    async with server:
+        await server.serve_forever()
+
+def _parse_request(request: Any) -> Tuple[Optional[BatchJob], Dict[str, Any], str]:
+    """Split a request into its job and analyze_features options, or return an error message."""
+    if not isinstance(request, dict) or not isinstance(request.get('filename'), str) \
+            or not isinstance(request.get('target_column'), str):
+        return None, {}, "Request must be a JSON object with string 'filename' and 'target_column' fields"
+    
+    unknown = set(request) - set(REQUEST_OPTIONS) - {'filename', 'target_column', 'id'}
+    if unknown:
+        return None, {}, f"Unknown request fields: {', '.join(sorted(unknown))}"
+    
+    options = {key: request[key] for key in REQUEST_OPTIONS if request.get(key) is not None}
+    return BatchJob(request['filename'], request['target_column']), options, ""
+
+def _correlation_matrix_job(filename: str, matrix_options: Dict[str, Any]) -> Tuple[Optional['pd.DataFrame'], str]:
+    """Compute the correlation matrix of every numerical column of a file inside a worker."""
+    from .main import correlation_matrix_for_file
+    
+    return correlation_matrix_for_file(filename, method=matrix_options.get('method', 'pearson'),
+                                       chunksize=matrix_options.get('chunksize'),
+                                       optimize_memory=matrix_options.get('optimize_memory', False))
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Serve feature analyses of files in the data directory as newline-delimited JSON.'
+    )
+    parser.add_argument(
+        '--socket',
+        metavar='PATH',
+        default=None,
+        help='Listen on a Unix socket at PATH instead of a TCP port'
+    )
+    parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='TCP host to listen on (default: 127.0.0.1)'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8765,
+        help='TCP port to listen on (default: 8765)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of worker processes (default: number of CPUs)'
+    )
+    parser.add_argument(
+        '--memory-limit',
+        type=int,
+        default=None,
+        metavar='MB',
+        help='Address space limit of each worker process in megabytes'
+    )
+    parser.add_argument(
+        '--cache-size',
+        type=int,
+        default=DEFAULT_CACHE_MB,
+        metavar='MB',
+        help=f'Memory budget of the correlation matrix cache in megabytes (default: {DEFAULT_CACHE_MB})'
+    )
+    
+    args = parser.parse_args()
+    
+    service = AnalysisService(max_workers=args.workers, max_cache_bytes=args.cache_size * 1024 ** 2,
+                              memory_limit_mb=args.memory_limit)
+    try:
+        asyncio.run(serve(service, socket_path=args.socket, host=args.host, port=args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,9 @@
 import os
-import pandas as pd
-from typing import Tuple
+from typing import List, Tuple
+from .formats import read_columns, read_frame
+
+# pandas is imported inside the functions that parse files (here and in formats), so the
+# CLI can check that a file exists without paying for the pandas import
 
 def file_exists(filename: str) -> Tuple[bool, str]:
     """
@@ -17,9 +20,45 @@ def file_exists(filename: str) -> Tuple[bool, str]:
     error_message = "" if exists else f"File '{filename}' not found in data directory"
     return exists, error_message
 
+def csv_read_error_message(filename: str, error: Exception) -> str:
+    """
+    Translate an exception raised while parsing a CSV file into a user-facing error message.
+    
+    Args:
+        filename (str): Name of the file that was being read
+        error (Exception): Exception raised by the CSV reader
+        
+    Returns:
+        str: Error message describing why the file could not be read
+    """
+    import pandas as pd
+    
+    if isinstance(error, pd.errors.EmptyDataError):
+        return f"File '{filename}' is empty"
+    if isinstance(error, pd.errors.ParserError):
+        return f"File '{filename}' is not a valid CSV file"
+    return f"Error reading '{filename}': {str(error)}"
+
+def read_csv_header(filename: str) -> Tuple[List[str], str]:
+    """
+    Read only the header row of a CSV file, or only the schema of a Parquet or Feather file.
+    
+    Args:
+        filename (str): Name of the file to read
+        
+    Returns:
+        Tuple[List[str], str]: (column_names, error_message)
+    """
+    file_path = os.path.join('data', filename)
+    try:
+        columns = read_columns(file_path)
+        return columns, ""
+    except Exception as e:
+        return [], csv_read_error_message(filename, e)
+
 def is_valid_csv(filename: str) -> Tuple[bool, str]:
     """
-    Check if file is a valid CSV.
+    Check if file is a valid CSV (possibly compressed), Parquet or Feather file.
     
     Args:
         filename (str): Name of the file to check
@@ -29,19 +68,17 @@ def is_valid_csv(filename: str) -> Tuple[bool, str]:
     """
     file_path = os.path.join('data', filename)
     try:
-        pd.read_csv(file_path)
+        read_frame(file_path)
         return True, ""
-    except pd.errors.EmptyDataError:
-        return False, f"File '{filename}' is empty"
-    except pd.errors.ParserError:
-        return False, f"File '{filename}' is not a valid CSV file"
     except Exception as e:
-        return False, f"Error reading '{filename}': {str(e)}"
+        return False, csv_read_error_message(filename, e)
 
 def has_target_column(filename: str, target_column: str) -> Tuple[bool, str]:
     """
     Check if target column exists in the CSV file.
     
+    Only the header row is parsed, so the check is cheap even for large files.
+    
     Args:
         filename (str): Name of the file to check
         target_column (str): Name of the column to check
@@ -49,11 +86,23 @@ def has_target_column(filename: str, target_column: str) -> Tuple[bool, str]:
     Returns:
         Tuple[bool, str]: (has_column, error_message)
     """
-    file_path = os.path.join('data', filename)
-    try:
-        df = pd.read_csv(file_path)
-        has_column = target_column in df.columns
-        error_message = "" if has_column else f"Column '{target_column}' not found in '{filename}'"
-        return has_column, error_message
-    except Exception:
-        return False, f"Could not check for column '{target_column}' due to file read error" 
\ No newline at end of file
+    columns, error = read_csv_header(filename)
+    if error:
+        return False, f"Could not check for column '{target_column}' due to file read error"
+    return column_in_header(filename, columns, target_column)
+
+def column_in_header(filename: str, columns: List[str], target_column: str) -> Tuple[bool, str]:
+    """
+    Check if target column is present in an already-read list of column names.
+    
+    Args:
+        filename (str): Name of the file the columns were read from
+        columns (List[str]): Column names of the file
+        target_column (str): Name of the column to check
+        
+    Returns:
+        Tuple[bool, str]: (has_column, error_message)
+    """
+    has_column = target_column in columns
+    error_message = "" if has_column else f"Column '{target_column}' not found in '{filename}'"
+    return has_column, error_message
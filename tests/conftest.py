@@ -0,0 +1,8 @@
+import pytest
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    # Loader resolves files relative to ./data
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    return tmp_path / 'data'
@@ -0,0 +1,59 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.analysis.blocked import blocked_correlation
+from src.analysis.correlation import calculate_correlation_matrix
+
+@pytest.fixture
+def wide_df():
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=(300, 5))
+    values = np.hstack([base, base @ rng.normal(size=(5, 30)) + rng.normal(size=(300, 30))])
+    return pd.DataFrame(values * 100 + 1e5, columns=[f'f{i}' for i in range(35)])
+
+def test_blocked_correlation_matches_pandas(wide_df):
+    result = blocked_correlation(wide_df.to_numpy(), block_size=8, n_jobs=3)
+    
+    np.testing.assert_allclose(result, wide_df.corr().to_numpy(), atol=1e-12)
+
+def test_blocked_correlation_float32(wide_df):
+    result = blocked_correlation(wide_df.to_numpy(), block_size=16, dtype=np.float32)
+    
+    np.testing.assert_allclose(result, wide_df.corr().to_numpy(), atol=1e-5)
+
+def test_blocked_correlation_pairwise_missing(wide_df):
+    rng = np.random.default_rng(1)
+    df = wide_df.mask(rng.random(wide_df.shape) < 0.1)
+    
+    result = blocked_correlation(df.to_numpy(), block_size=7, n_jobs=2)
+    
+    np.testing.assert_allclose(result, df.corr().to_numpy(), atol=1e-12)
+
+def test_blocked_correlation_mean_imputed_missing(wide_df):
+    df = wide_df.copy()
+    df.iloc[::10, 0] = np.nan
+    
+    approximate = blocked_correlation(df.to_numpy(), pairwise=False)
+    
+    assert not np.isnan(approximate).any()
+    np.testing.assert_allclose(approximate, df.corr().to_numpy(), atol=0.1)
+
+def test_blocked_correlation_constant_column():
+    values = np.array([[1.0, 5.0], [2.0, 5.0], [3.0, 5.0]])
+    
+    result = blocked_correlation(values)
+    
+    assert result[0, 0] == pytest.approx(1.0)
+    assert np.isnan(result[0, 1])
+    assert np.isnan(result[1, 1])
+
+def test_blocked_correlation_invalid_block_size():
+    with pytest.raises(ValueError, match="block_size must be a positive integer"):
+        blocked_correlation(np.ones((3, 2)), block_size=0)
+
+def test_calculate_correlation_matrix_parallel_matches_pandas(wide_df):
+    result = calculate_correlation_matrix(wide_df, n_jobs=4, block_size=10)
+    expected = wide_df.corr()
+    np.fill_diagonal(expected.values, np.nan)
+    
+    pd.testing.assert_frame_equal(result, expected, atol=1e-12, rtol=0)
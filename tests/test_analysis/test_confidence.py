@@ -0,0 +1,69 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.analysis.confidence import fisher_confidence_interval, correlation_scores_with_intervals
+
+@pytest.fixture
+def sample_df():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(400, 4)), columns=['strong', 'medium', 'close', 'noise'])
+    df['target'] = df['strong'] + 0.5 * df['medium'] + 0.45 * df['close'] + rng.normal(size=400)
+    return df
+
+def test_fisher_interval_contains_estimate_and_narrows():
+    low_small, high_small = fisher_confidence_interval(np.array([0.5]), np.array([30]))
+    low_large, high_large = fisher_confidence_interval(np.array([0.5]), np.array([3000]))
+    
+    assert low_small[0] < low_large[0] < 0.5 < high_large[0] < high_small[0]
+
+def test_fisher_interval_coverage():
+    rng = np.random.default_rng(1)
+    covered = 0
+    for _ in range(400):
+        x = rng.normal(size=50)
+        y = 0.6 * x + 0.8 * rng.normal(size=50)
+        low, high = fisher_confidence_interval(np.array([np.corrcoef(x, y)[0, 1]]), np.array([50]))
+        covered += low[0] <= 0.6 <= high[0]
+    
+    assert 0.9 < covered / 400 < 0.99
+
+def test_fisher_interval_too_few_rows():
+    low, high = fisher_confidence_interval(np.array([0.9]), np.array([3]))
+    
+    assert (low[0], high[0]) == (-1.0, 1.0)
+
+def test_scores_with_intervals(sample_df):
+    result = correlation_scores_with_intervals(sample_df, 'target')
+    
+    assert list(result.columns) == ['feature', 'importance_score', 'ci_low', 'ci_high', 'n_rows',
+                                    'rank', 'rank_low', 'rank_high']
+    assert result['feature'].iloc[0] == 'strong'
+    assert result['feature'].iloc[-1] == 'noise'
+    assert (result['ci_low'] <= result['importance_score']).all()
+    assert (result['importance_score'] <= result['ci_high']).all()
+    assert (result['rank_low'] <= result['rank']).all() and (result['rank'] <= result['rank_high']).all()
+
+def test_scores_with_intervals_rank_bounds(sample_df):
+    result = correlation_scores_with_intervals(sample_df, 'target').set_index('feature')
+    
+    # The clear leader has a certain rank, the two similar features may swap
+    assert (result.loc['strong', 'rank_low'], result.loc['strong', 'rank_high']) == (1, 1)
+    assert result.loc['medium', 'rank_high'] >= 3
+    assert result.loc['close', 'rank_low'] <= 2
+
+def test_scores_with_intervals_noise_interval_starts_at_zero(sample_df):
+    result = correlation_scores_with_intervals(sample_df, 'target').set_index('feature')
+    
+    assert result.loc['noise', 'ci_low'] == 0.0
+
+def test_scores_with_intervals_top_k(sample_df):
+    result = correlation_scores_with_intervals(sample_df, 'target', top_k=2)
+    
+    assert result['feature'].tolist() == ['strong', result['feature'].iloc[1]]
+    assert len(result) == 2
+
+def test_scores_with_intervals_non_numeric_target():
+    df = pd.DataFrame({'a': [1, 2, 3], 'target': ['x', 'y', 'z']})
+    
+    with pytest.raises(ValueError, match="Target column 'target' must be numeric"):
+        correlation_scores_with_intervals(df, 'target')
@@ -78,6 +78,62 @@ def test_compute_correlation_scores_single_feature():
     assert result.iloc[0]['feature'] == 'feature'
     assert result.iloc[0]['importance_score'] == pytest.approx(1.0)
 
+def test_compute_correlation_scores_matches_full_matrix():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(50, 4)), columns=['A', 'B', 'C', 'target'])
+    df['A'] += df['target']
+    df.loc[::7, 'B'] = np.nan
+    
+    result = compute_correlation_scores(df, 'target')
+    expected = df.corr()['target'].drop('target').abs().sort_values(ascending=False)
+    
+    assert result['feature'].tolist() == expected.index.tolist()
+    assert result['importance_score'].to_numpy() == pytest.approx(expected.to_numpy())
+
+def test_compute_correlation_scores_top_k():
+    df = pd.DataFrame({
+        'weak': [1, 3, 2, 4, 5],
+        'strong': [1, 2, 3, 4, 6],
+        'none': [1, -1, 1, -1, 1],
+        'target': [1, 2, 3, 4, 5]
+    })
+    
+    result = compute_correlation_scores(df, 'target', top_k=2)
+    
+    assert result['feature'].tolist() == ['strong', 'weak']
+
+def test_compute_correlation_scores_min_score():
+    df = pd.DataFrame({
+        'weak': [1, 3, 2, 4, 5],
+        'strong': [1, 2, 3, 4, 6],
+        'none': [1, -1, 1, -1, 1],
+        'target': [1, 2, 3, 4, 5]
+    })
+    
+    result = compute_correlation_scores(df, 'target', min_score=0.5)
+    
+    assert set(result['feature']) == {'strong', 'weak'}
+    assert (result['importance_score'] >= 0.5).all()
+
+@pytest.mark.parametrize('method', ['spearman', 'kendall'])
+def test_compute_correlation_scores_rank_methods(method):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(np.exp(rng.normal(size=(80, 3)) * 3), columns=['A', 'B', 'target'])
+    df['A'] = df['target'] ** 5
+    
+    result = compute_correlation_scores(df, 'target', method=method)
+    expected = df.corr(method=method)['target'].drop('target').abs().sort_values(ascending=False)
+    
+    assert result['feature'].tolist() == ['A', 'B']
+    assert result['importance_score'].to_numpy() == pytest.approx(expected.to_numpy())
+    assert result['importance_score'].iloc[0] == pytest.approx(1.0)
+
+def test_compute_correlation_scores_unknown_method():
+    df = pd.DataFrame({'A': [1, 2, 3], 'target': [1, 2, 3]})
+    
+    with pytest.raises(ValueError, match="Unknown correlation method"):
+        compute_correlation_scores(df, 'target', method='cosine')
+
 def test_calculate_correlation_matrix_basic():
     df = pd.DataFrame({
         'A': [1, 2, 3, 4],
@@ -93,6 +149,18 @@ def test_calculate_correlation_matrix_basic():
     assert result.loc['A', 'B'] == pytest.approx(-1.0)  # Perfect negative correlation
     assert result.loc['A', 'C'] == pytest.approx(1.0)   # Perfect positive correlation
 
+@pytest.mark.parametrize('method', ['spearman', 'kendall'])
+def test_calculate_correlation_matrix_rank_methods(method):
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(rng.lognormal(size=(60, 4)), columns=['A', 'B', 'C', 'D'])
+    df['E'] = ['x'] * 60
+    
+    result = calculate_correlation_matrix(df, method=method)
+    expected = df[['A', 'B', 'C', 'D']].corr(method=method)
+    np.fill_diagonal(expected.values, np.nan)
+    
+    pd.testing.assert_frame_equal(result, expected, atol=1e-12)
+
 def test_calculate_correlation_matrix_with_exclusion():
     df = pd.DataFrame({
         'A': [1, 2, 3, 4],
@@ -264,6 +332,34 @@ def test_identify_highly_correlated_features_empty():
     
     assert len(pairs) == 0
 
+def test_identify_highly_correlated_features_as_indices():
+    corr_matrix = pd.DataFrame({
+        'A': [1.0, 0.9, 0.9],
+        'B': [0.9, 1.0, 0.2],
+        'C': [0.9, 0.2, 1.0]
+    }, index=['A', 'B', 'C'])
+    
+    rows, cols = identify_highly_correlated_features(corr_matrix, threshold=0.8, as_indices=True)
+    
+    assert rows.tolist() == [0, 0]
+    assert cols.tolist() == [1, 2]
+
+def test_identify_highly_correlated_features_matches_pairwise_scan():
+    rng = np.random.default_rng(1)
+    values = rng.uniform(-1, 1, size=(60, 60))
+    values = (values + values.T) / 2
+    values[rng.random(values.shape) < 0.05] = np.nan
+    columns = [f'f{i}' for i in range(60)]
+    corr_matrix = pd.DataFrame(values, index=columns, columns=columns)
+    
+    expected = [
+        (columns[i], columns[j])
+        for i in range(60) for j in range(i + 1, 60)
+        if abs(values[i, j]) >= 0.6
+    ]
+    
+    assert identify_highly_correlated_features(corr_matrix, threshold=0.6) == expected
+
 def test_group_correlated_features_overlapping_groups():
     # Create correlation matrix with:
     # 1. Initial groups will be: [A,B,C], [C,D,E]
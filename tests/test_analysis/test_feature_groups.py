@@ -0,0 +1,91 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.analysis.correlation import identify_highly_correlated_features, group_correlated_features
+from src.analysis.feature_groups import find_feature_groups, select_group_representatives
+
+def _group_pairs_by_scan(corr_pairs):
+    # Original grouping: first-fit assignment followed by pairwise merging
+    feature_groups = []
+    for feat1, feat2 in corr_pairs:
+        for group in feature_groups:
+            if feat1 in group or feat2 in group:
+                group.update((feat1, feat2))
+                break
+        else:
+            feature_groups.append({feat1, feat2})
+    i = 0
+    while i < len(feature_groups):
+        j = i + 1
+        while j < len(feature_groups):
+            if feature_groups[i] & feature_groups[j]:
+                feature_groups[i] |= feature_groups.pop(j)
+            else:
+                j += 1
+        i += 1
+    return [sorted(group) for group in feature_groups]
+
+def test_find_feature_groups_basic():
+    features = ['A', 'B', 'C', 'D', 'E']
+    
+    groups = find_feature_groups(features, np.array([3, 0, 1]), np.array([4, 2, 2]))
+    
+    assert groups == [['A', 'B', 'C'], ['D', 'E']]
+
+def test_find_feature_groups_no_pairs():
+    groups = find_feature_groups(['A', 'B'], np.array([], dtype=int), np.array([], dtype=int))
+    
+    assert groups == []
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_group_correlated_features_matches_original_scan(seed):
+    # These matrices have no bridged groups, where the original scan left groups split
+    rng = np.random.default_rng(seed)
+    values = rng.uniform(-1, 1, size=(80, 80))
+    values = (values + values.T) / 2
+    np.fill_diagonal(values, np.nan)
+    columns = [f'f{i:02d}' for i in rng.permutation(80)]
+    corr_matrix = pd.DataFrame(values, index=columns, columns=columns)
+    
+    expected = _group_pairs_by_scan(identify_highly_correlated_features(corr_matrix, 0.9))
+    
+    assert group_correlated_features(corr_matrix, threshold=0.9) == expected
+
+def test_group_correlated_features_merges_bridged_groups():
+    # Chain a-b-e-f-c-d: in this column order the pairs first form {a, b}, {c, d} and {e, f}, then
+    # b-e and f-c bridge them. The original scan merged each group only once and returned
+    # [['a', 'b', 'e', 'f'], ['c', 'd', 'f']], with f in both groups
+    columns = ['a', 'd', 'e', 'c', 'f', 'b']
+    corr_matrix = pd.DataFrame(np.zeros((6, 6)), index=columns, columns=columns)
+    for feat1, feat2 in [('a', 'b'), ('c', 'd'), ('e', 'f'), ('b', 'e'), ('f', 'c')]:
+        corr_matrix.loc[feat1, feat2] = corr_matrix.loc[feat2, feat1] = 0.95
+    np.fill_diagonal(corr_matrix.values, np.nan)
+    
+    assert _group_pairs_by_scan(identify_highly_correlated_features(corr_matrix, 0.9)) == [
+        ['a', 'b', 'e', 'f'], ['c', 'd', 'f']
+    ]
+    assert group_correlated_features(corr_matrix, threshold=0.9) == [['a', 'b', 'c', 'd', 'e', 'f']]
+
+def test_select_group_representatives():
+    correlation_df = pd.DataFrame({
+        'feature': ['A', 'B', 'C', 'D'],
+        'importance_score': [0.2, 0.7, 0.9, 0.4]
+    })
+    
+    representatives = select_group_representatives([['A', 'B'], ['C', 'D']], correlation_df)
+    
+    assert representatives == ['B', 'C']
+
+def test_select_group_representatives_missing_scores():
+    correlation_df = pd.DataFrame({
+        'feature': ['A', 'B'],
+        'importance_score': [np.nan, 0.1]
+    })
+    
+    representatives = select_group_representatives([['A', 'B'], ['X', 'Y']], correlation_df)
+    
+    assert representatives == ['B', 'X']
+
+def test_select_group_representatives_invalid_input():
+    with pytest.raises(ValueError, match="Input DataFrame must have 'feature' and 'importance_score' columns"):
+        select_group_representatives([['A', 'B']], pd.DataFrame({'feature': ['A']}))
@@ -0,0 +1,87 @@
+import pytest
+import numpy as np
+import pandas as pd
+from benchmarks.bench_lsh_pairs import make_correlated_columns, measure_recall
+from src.analysis.lsh import (
+    approximate_correlated_features,
+    candidate_pairs,
+    collision_probability,
+    find_correlated_pairs,
+    pair_correlations,
+    tables_for_recall
+)
+from src.analysis.correlation import calculate_correlation_matrix, identify_highly_correlated_features
+
+@pytest.fixture
+def correlated_values():
+    return make_correlated_columns(400, 300, group_size=3, noise=0.3, seed=1)
+
+def test_recall_against_exact_pairs(correlated_values):
+    result = measure_recall(correlated_values, threshold=0.85, recall=0.95, seed=0)
+    
+    assert result['exact_pairs'] > 100
+    assert result['precision'] == 1.0
+    assert result['recall'] >= 0.9
+
+def test_higher_recall_target_finds_more_pairs(correlated_values):
+    low = measure_recall(correlated_values, threshold=0.85, recall=0.5, seed=0)
+    high = measure_recall(correlated_values, threshold=0.85, recall=0.99, seed=0)
+    
+    assert high['n_tables'] > low['n_tables']
+    assert high['found_pairs'] >= low['found_pairs']
+    assert high['recall'] >= 0.97
+
+def test_matches_exact_path_on_dataframe():
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=200)
+    df = pd.DataFrame({
+        'a': base,
+        'b': 2 * base + 0.01 * rng.normal(size=200),
+        'c': -base + 0.01 * rng.normal(size=200),
+        'd': rng.normal(size=200),
+        'constant': 1.0,
+        'label': ['x'] * 200
+    })
+    df.loc[3, 'b'] = np.nan
+    
+    exact = identify_highly_correlated_features(calculate_correlation_matrix(df), 0.9)
+    
+    assert approximate_correlated_features(df, 0.9, recall=0.99, seed=0) == exact
+    rows, cols = approximate_correlated_features(df, 0.9, recall=0.99, seed=0, as_indices=True)
+    assert list(zip(rows.tolist(), cols.tolist())) == [(0, 1), (0, 2), (1, 2)]
+
+def test_pair_correlations_match_pandas():
+    rng = np.random.default_rng(2)
+    values = rng.normal(size=(50, 4))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    rows, cols = np.triu_indices(4, k=1)
+    
+    expected = pd.DataFrame(values).corr().to_numpy()[rows, cols]
+    
+    np.testing.assert_allclose(pair_correlations(values, rows, cols), expected)
+
+def test_candidate_pairs_fold_complements():
+    signatures = np.array([
+        [True, False, True, True],
+        [False, True, False, False],
+        [True, False, True, False]
+    ])
+    
+    rows, cols = candidate_pairs(signatures, n_tables=2, bits_per_table=2)
+    assert list(zip(rows.tolist(), cols.tolist())) == [(0, 1), (0, 2), (1, 2)]
+    
+    rows, _ = candidate_pairs(signatures, n_tables=2, bits_per_table=2, exclude=np.array([True, False, False]))
+    assert rows.tolist() == [1]
+
+def test_tables_for_recall_reaches_target():
+    n_tables = tables_for_recall(0.8, 0.9, bits_per_table=10)
+    
+    assert collision_probability(0.8, n_tables, 10) >= 0.9
+    assert collision_probability(0.8, n_tables - 1, 10) < 0.9
+    assert collision_probability(-0.8, n_tables, 10) == collision_probability(0.8, n_tables, 10)
+    with pytest.raises(ValueError, match="recall"):
+        tables_for_recall(0.8, 1.0, bits_per_table=10)
+
+def test_find_correlated_pairs_invalid_threshold(correlated_values):
+    with pytest.raises(ValueError, match="Threshold must be between 0 and 1"):
+        find_correlated_pairs(correlated_values, 1.5)
@@ -0,0 +1,116 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.analysis.mutual_information import (
+    discretize_column,
+    mutual_information,
+    compute_mutual_information_scores
+)
+from src.analysis.ranking import rank_features_by_correlation
+
+@pytest.fixture
+def mixed_df():
+    rng = np.random.default_rng(0)
+    n_rows = 2000
+    x = rng.normal(size=n_rows)
+    df = pd.DataFrame({
+        'square': x,
+        'noise': rng.normal(size=n_rows),
+        'category': rng.choice(['a', 'b', 'c'], n_rows)
+    })
+    df['target'] = x ** 2 + (df['category'] == 'a') * 3 + rng.normal(size=n_rows) * 0.1
+    return df
+
+def test_discretize_numeric_quantiles():
+    codes, n_codes = discretize_column(pd.Series(np.arange(100, dtype=float)), n_bins=4)
+    
+    assert n_codes == 4
+    assert np.bincount(codes).tolist() == [25, 25, 25, 25]
+
+def test_discretize_few_distinct_values():
+    codes, n_codes = discretize_column(pd.Series([0, 1, 0, 1, 1]), n_bins=32)
+    
+    assert len(np.unique(codes)) == 2
+    assert codes[0] == codes[2] != codes[1]
+
+def test_discretize_categorical_with_missing():
+    codes, n_codes = discretize_column(pd.Series(['x', None, 'y', 'x']))
+    
+    assert n_codes == 3
+    assert codes.tolist() == [0, 2, 1, 0]
+
+def test_discretize_caps_categories():
+    column = pd.Series(['a'] * 5 + ['b'] * 3 + ['c', 'd', None])
+    
+    codes, n_codes = discretize_column(column, n_bins=2)
+    
+    # 'a' and 'b' keep their codes, 'c' and 'd' share 'other', missing values get the last code
+    assert n_codes == 4
+    assert codes.tolist() == [0] * 5 + [1] * 3 + [2, 2, 3]
+
+def test_mutual_information_identical_and_independent():
+    codes = np.array([0, 1, 2, 0, 1, 2])
+    mi, h_x, h_y = mutual_information(codes, 3, codes, 3)
+    
+    assert mi == pytest.approx(np.log(3))
+    assert h_x == pytest.approx(np.log(3))
+    assert mutual_information(np.array([0, 0, 1, 1]), 2, np.array([0, 1, 0, 1]), 2)[0] == pytest.approx(0.0)
+
+def test_scores_rank_non_linear_and_categorical_features(mixed_df):
+    result = compute_mutual_information_scores(mixed_df, 'target')
+    
+    assert result['feature'].tolist()[-1] == 'noise'
+    assert set(result['feature'].tolist()[:2]) == {'square', 'category'}
+    assert result['importance_score'].between(0, 1).all()
+
+def test_scores_plug_into_ranking(mixed_df):
+    ranked = rank_features_by_correlation(compute_mutual_information_scores(mixed_df, 'target'))
+    
+    assert list(ranked.columns) == ['feature', 'importance_score', 'rank']
+    assert ranked['rank'].tolist() == [1.0, 2.0, 3.0]
+
+def test_scores_parallel_matches_serial(mixed_df):
+    serial = compute_mutual_information_scores(mixed_df, 'target')
+    parallel = compute_mutual_information_scores(mixed_df, 'target', n_jobs=3)
+    
+    pd.testing.assert_frame_equal(serial, parallel)
+
+def test_scores_categorical_target(mixed_df):
+    result = compute_mutual_information_scores(mixed_df, 'category', top_k=1)
+    
+    assert result['feature'].tolist() == ['target']
+
+def test_scores_identical_column_scores_one():
+    df = pd.DataFrame({'copy': [1, 2, 3, 4, 5, 6], 'target': [1, 2, 3, 4, 5, 6]})
+    
+    result = compute_mutual_information_scores(df, 'target')
+    
+    assert result['importance_score'].iloc[0] == pytest.approx(1.0)
+
+def test_scores_missing_target_column(mixed_df):
+    with pytest.raises(ValueError, match="Target column 'nope' not found"):
+        compute_mutual_information_scores(mixed_df, 'nope')
+
+def test_scores_empty():
+    result = compute_mutual_information_scores(pd.DataFrame(), 'target')
+    
+    assert list(result.columns) == ['feature', 'importance_score']
+    assert result.empty
+
+@pytest.mark.parametrize('n_rows', [300, 2000])
+def test_scores_rank_ids_and_noise_below_signal(n_rows):
+    rng = np.random.default_rng(1)
+    target = rng.normal(size=n_rows)
+    df = pd.DataFrame({
+        'signal': 0.6 * target + 0.8 * rng.normal(size=n_rows),
+        'noise': rng.normal(size=n_rows),
+        'zip_code': rng.integers(0, 100000, n_rows).astype(str),
+        'row_id': [f'row{i}' for i in range(n_rows)],
+        'target': target
+    })
+    
+    result = compute_mutual_information_scores(df, 'target')
+    
+    assert result['feature'].iloc[0] == 'signal'
+    scores = result.set_index('feature')['importance_score']
+    assert (scores.drop('signal') < scores['signal'] / 4).all()
@@ -0,0 +1,60 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.analysis.rank_correlation import (
+    check_correlation_method,
+    rank_columns,
+    spearman_correlation,
+    spearman_target_correlation,
+    kendall_tau,
+    kendall_correlation,
+    kendall_target_correlation
+)
+
+@pytest.fixture
+def skewed_df():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(np.exp(rng.normal(size=(300, 4)) * 2), columns=['A', 'B', 'C', 'target'])
+    df['B'] = df['target'] ** 3 + rng.normal(size=300)
+    df['C'] = np.round(df['C'])  # ties
+    return df
+
+def test_rank_columns_average_ties_and_missing():
+    values = np.array([[3.0, 1.0], [1.0, np.nan], [3.0, 0.5]])
+    
+    ranks = rank_columns(values)
+    
+    np.testing.assert_array_equal(ranks[:, 0], [2.5, 1.0, 2.5])
+    np.testing.assert_array_equal(ranks[:, 1], [2.0, np.nan, 1.0])
+
+def test_spearman_matches_pandas(skewed_df):
+    expected = skewed_df.corr(method='spearman').to_numpy()
+    
+    np.testing.assert_allclose(spearman_correlation(skewed_df.to_numpy(), block_size=3), expected, atol=1e-12)
+
+def test_spearman_target_matches_matrix(skewed_df):
+    values = skewed_df.drop(columns=['target']).to_numpy()
+    expected = skewed_df.corr(method='spearman')['target'].drop('target').to_numpy()
+    
+    np.testing.assert_allclose(spearman_target_correlation(values, skewed_df['target'].to_numpy()), expected, atol=1e-12)
+
+def test_kendall_matches_pandas_with_missing(skewed_df):
+    skewed_df.loc[::7, 'A'] = np.nan
+    expected = skewed_df.corr(method='kendall').to_numpy()
+    
+    np.testing.assert_allclose(kendall_correlation(skewed_df.to_numpy()), expected, atol=1e-12)
+    np.testing.assert_allclose(kendall_correlation(skewed_df.to_numpy(), n_jobs=2), expected, atol=1e-12)
+
+def test_kendall_target_matches_matrix(skewed_df):
+    values = skewed_df.drop(columns=['target']).to_numpy()
+    expected = skewed_df.corr(method='kendall')['target'].drop('target').to_numpy()
+    
+    np.testing.assert_allclose(kendall_target_correlation(values, skewed_df['target'].to_numpy()), expected, atol=1e-12)
+
+def test_kendall_tau_too_few_rows():
+    assert np.isnan(kendall_tau(np.array([1.0, np.nan]), np.array([np.nan, 2.0])))
+
+def test_check_correlation_method():
+    check_correlation_method('kendall')
+    with pytest.raises(ValueError, match="Unknown correlation method 'cosine'"):
+        check_correlation_method('cosine')
@@ -0,0 +1,74 @@
+import pytest
+import numpy as np
+import pandas as pd
+from src.analysis import redundancy
+from src.analysis.redundancy import select_non_redundant_features, prune_redundant_features
+from src.analysis.correlation import compute_correlation_scores
+
+@pytest.fixture
+def grouped_df():
+    # Three groups of near-duplicate features plus an unrelated one
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=(500, 3))
+    columns = {f'g{group}_{k}': base[:, group] + 0.1 * (k + 1) * rng.normal(size=500)
+               for group in range(3) for k in range(3)}
+    columns['noise'] = rng.normal(size=500)
+    df = pd.DataFrame(columns)
+    df['target'] = base @ np.array([3.0, 2.0, 1.0]) + rng.normal(size=500)
+    df.loc[5, 'g0_1'] = np.nan
+    return df
+
+def _prune(df, **kwargs):
+    correlation_df = compute_correlation_scores(df, 'target')
+    return prune_redundant_features(correlation_df, df.to_numpy(dtype=np.float64), df.columns.tolist(), **kwargs)
+
+def test_prune_keeps_best_member_of_each_group(grouped_df):
+    result = _prune(grouped_df)
+    scores = compute_correlation_scores(grouped_df, 'target').set_index('feature')['importance_score']
+    
+    assert list(result.columns) == ['feature', 'importance_score', 'rank']
+    assert result['rank'].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert result['feature'].iloc[-1] == 'noise'
+    for group in range(3):
+        members = [f'g{group}_{k}' for k in range(3)]
+        assert [feature for feature in result['feature'] if feature in members] == [scores[members].idxmax()]
+
+def test_prune_top_k_and_threshold(grouped_df):
+    assert len(_prune(grouped_df, top_k=2)) == 2
+    assert len(_prune(grouped_df, threshold=1.0)) == 10
+    
+    with pytest.raises(ValueError, match="Threshold must be between 0 and 1"):
+        _prune(grouped_df, threshold=1.5)
+
+def test_prune_spearman_matches_pearson_groups(grouped_df):
+    assert _prune(grouped_df, method='spearman')['feature'].tolist() == _prune(grouped_df)['feature'].tolist()
+
+def test_prune_rejects_kendall(grouped_df):
+    # Kendall tau is systematically smaller than the rho used between features
+    with pytest.raises(ValueError, match="not kendall"):
+        _prune(grouped_df, method='kendall')
+
+def test_select_stops_after_max_features(grouped_df, monkeypatch):
+    values = grouped_df.drop(columns=['target']).to_numpy(dtype=np.float64)
+    calls = []
+    original_tile = redundancy.pairwise_block_correlation
+    
+    def counting_tile(left, right):
+        calls.append(right.shape[1])
+        return original_tile(left, right)
+    
+    monkeypatch.setattr(redundancy, 'pairwise_block_correlation', counting_tile)
+    kept, representatives = select_non_redundant_features(values, np.arange(10), max_features=1, block_size=2)
+    
+    assert kept.tolist() == [0]
+    # Only the first block was compared, the other candidates were never touched
+    assert len(calls) == 2
+    assert representatives.tolist() == [0, -1, -1, -1, -1, -1, -1, -1, -1, -1]
+
+def test_select_across_blocks(grouped_df):
+    values = grouped_df.drop(columns=['target']).to_numpy(dtype=np.float64)
+    
+    kept, representatives = select_non_redundant_features(values, np.arange(10), block_size=2)
+    
+    assert kept.tolist() == [0, 3, 6, 9]
+    assert representatives.tolist() == [0, 0, 0, 3, 3, 3, 6, 6, 6, 9]
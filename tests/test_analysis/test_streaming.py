@@ -0,0 +1,141 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.analysis.streaming import (
+    accumulate_correlation_state,
+    compute_chunk_state,
+    merge_correlation_states,
+    update_correlation_state,
+    save_correlation_state,
+    load_correlation_state,
+    handle_missing_values_state,
+    correlation_matrix_from_state
+)
+from src.analysis.correlation import (
+    compute_correlation_scores,
+    compute_streaming_correlation_scores,
+    calculate_correlation_matrix,
+    calculate_streaming_correlation_matrix
+)
+
+def _chunks(df, chunksize):
+    return [df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize)]
+
+@pytest.fixture
+def df_with_missing():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(200, 4)) * [1, 10, 100, 1e4] + [0, 5, -50, 1e6], columns=['A', 'B', 'C', 'target'])
+    df['B'] = df['B'] + df['target'] / 1e3
+    df.loc[rng.choice(200, 30, replace=False), 'A'] = np.nan
+    df.loc[rng.choice(200, 50, replace=False), 'C'] = np.nan
+    return df
+
+def test_streaming_matrix_matches_pandas(df_with_missing):
+    state = accumulate_correlation_state(_chunks(df_with_missing, 17))
+    
+    result = correlation_matrix_from_state(state)
+    
+    pd.testing.assert_frame_equal(result, df_with_missing.corr(), atol=1e-12, rtol=0)
+
+def test_streaming_scores_match_in_memory(df_with_missing):
+    state = accumulate_correlation_state(_chunks(df_with_missing, 23))
+    
+    expected = compute_correlation_scores(df_with_missing, 'target')
+    result = compute_streaming_correlation_scores(state, 'target')
+    
+    assert result['feature'].tolist() == expected['feature'].tolist()
+    assert result['importance_score'].to_numpy() == pytest.approx(expected['importance_score'].to_numpy())
+
+def test_streaming_correlation_matrix_matches_in_memory(df_with_missing):
+    state = accumulate_correlation_state(_chunks(df_with_missing, 50))
+    
+    expected = calculate_correlation_matrix(df_with_missing, exclude_columns=['target'])
+    result = calculate_streaming_correlation_matrix(state, exclude_columns=['target'])
+    
+    pd.testing.assert_frame_equal(result, expected, atol=1e-12, rtol=0)
+
+def test_merge_correlation_states_matches_single_pass(df_with_missing):
+    merged = merge_correlation_states(
+        compute_chunk_state(df_with_missing.iloc[:120]),
+        compute_chunk_state(df_with_missing.iloc[120:])
+    )
+    single = compute_chunk_state(df_with_missing)
+    
+    assert merged.n_rows == single.n_rows
+    np.testing.assert_allclose(merged.count, single.count)
+    np.testing.assert_allclose(merged.comoment, single.comoment, rtol=1e-9)
+
+def test_accumulate_excludes_columns_non_numeric_in_any_chunk():
+    df = pd.DataFrame({
+        'mixed': ['1', '2', 'x', '4'],
+        'num': [1.0, 2.0, 3.0, 4.0],
+        'target': [2.0, 4.0, 6.0, 9.0]
+    })
+    chunks = [
+        df.iloc[:2].assign(mixed=[1, 2]),
+        df.iloc[2:]
+    ]
+    
+    state = accumulate_correlation_state(chunks)
+    
+    assert state.columns == ['num', 'target']
+    assert state.n_rows == 4
+
+def test_handle_missing_values_state():
+    df = pd.DataFrame({
+        'A': [1, 2, np.nan],
+        'B': [4, np.nan, np.nan],  # 66.7% missing
+        'C': [7, 8, 9]
+    })
+    state = accumulate_correlation_state(_chunks(df, 2))
+    
+    state, removed = handle_missing_values_state(state, threshold=0.5)
+    
+    assert removed == ['B']
+    assert state.columns == ['A', 'C']
+
+def test_streaming_correlation_matrix_no_numerical():
+    state = accumulate_correlation_state([pd.DataFrame({'cat': ['A', 'B']})])
+    
+    with pytest.raises(ValueError, match="No numerical features found in DataFrame"):
+        calculate_streaming_correlation_matrix(state)
+
+def test_streaming_scores_non_numeric_target():
+    state = accumulate_correlation_state([pd.DataFrame({'feature': [1, 2], 'target': ['A', 'B']})])
+    
+    with pytest.raises(ValueError, match="Target column 'target' must be numeric"):
+        compute_streaming_correlation_scores(state, 'target')
+
+def test_update_correlation_state_matches_full_recompute(df_with_missing):
+    state = accumulate_correlation_state(_chunks(df_with_missing.iloc[:150], 40))
+    updated = update_correlation_state(state, _chunks(df_with_missing.iloc[150:], 40))
+    full = accumulate_correlation_state([df_with_missing])
+    
+    assert updated.n_rows == 200
+    pd.testing.assert_frame_equal(correlation_matrix_from_state(updated), correlation_matrix_from_state(full))
+
+def test_update_correlation_state_drops_columns_non_numeric_in_new_rows(df_with_missing):
+    state = accumulate_correlation_state([df_with_missing])
+    appended = df_with_missing.iloc[:10].astype({'A': object})
+    appended.loc[appended.index[0], 'A'] = 'n/a'
+    
+    updated = update_correlation_state(state, [appended])
+    
+    assert updated.columns == ['B', 'C', 'target']
+
+def test_update_correlation_state_without_new_rows(df_with_missing):
+    state = accumulate_correlation_state([df_with_missing])
+    
+    assert update_correlation_state(state, [df_with_missing.iloc[:0]]) is state
+
+def test_correlation_state_round_trip(df_with_missing, tmp_path):
+    state = accumulate_correlation_state([df_with_missing])
+    path = str(tmp_path / 'state.npz')
+    
+    save_correlation_state(state, path, {'offset': 42})
+    loaded, metadata = load_correlation_state(path)
+    
+    assert metadata == {'offset': 42}
+    assert loaded.columns == state.columns
+    assert loaded.n_rows == state.n_rows
+    np.testing.assert_array_equal(loaded.comoment, state.comoment)
@@ -0,0 +1,78 @@
+import json
+import os
+import pytest
+from src import batch
+from src.batch import BatchJob, jobs_from_glob, jobs_from_manifest, run_batch, response_to_json, run_job
+from src.main import analyze_features
+
+def _write_files(data_dir):
+    (data_dir / 'a.csv').write_text('x,y,target\n1,5,2\n2,3,4\n3,4,6\n4,1,8\n')
+    (data_dir / 'b.csv').write_text('x,y,target\n1,2,3\n2,1,1\n3,4,5\n4,3,2\n')
+    (data_dir / 'notes.txt').write_text('not a csv')
+
+def test_jobs_from_glob(data_dir):
+    _write_files(data_dir)
+    
+    assert jobs_from_glob('*.csv', 'target') == [BatchJob('a.csv', 'target'), BatchJob('b.csv', 'target')]
+
+def test_jobs_from_manifest(tmp_path):
+    manifest = tmp_path / 'jobs.csv'
+    manifest.write_text('filename,target_column\na.csv,target\nb.csv,y\n')
+    
+    assert jobs_from_manifest(str(manifest)) == [BatchJob('a.csv', 'target'), BatchJob('b.csv', 'y')]
+
+def test_jobs_from_manifest_missing_columns(tmp_path):
+    manifest = tmp_path / 'jobs.csv'
+    manifest.write_text('filename\na.csv\n')
+    
+    with pytest.raises(ValueError, match="missing columns: target_column"):
+        jobs_from_manifest(str(manifest))
+
+def test_run_batch_isolates_failures(data_dir):
+    _write_files(data_dir)
+    jobs = [BatchJob('a.csv', 'target'), BatchJob('missing.csv', 'target'), BatchJob('b.csv', 'nope')]
+    
+    results = {job.filename: response for job, response in run_batch(jobs, max_workers=2)}
+    
+    assert results['a.csv'].success is True
+    assert results['a.csv'].result == analyze_features('a.csv', 'target').result
+    assert results['missing.csv'].error_message == "File 'missing.csv' not found in data directory"
+    assert results['b.csv'].error_message == "Column 'nope' not found in 'b.csv'"
+
+def _crash_on_crash_csv(job, options):
+    # Kills the worker outright, like a segfault or the OOM killer would
+    if job.filename == 'crash.csv':
+        os._exit(1)
+    return run_job(job, options)
+
+def test_run_batch_blames_only_the_crashing_job(data_dir, monkeypatch):
+    _write_files(data_dir)
+    # Worker processes are forked, so they see the patched job function
+    monkeypatch.setattr(batch, 'run_job', _crash_on_crash_csv)
+    jobs = [BatchJob('crash.csv', 'target')] + [BatchJob(name, 'target') for name in ['a.csv', 'b.csv'] * 3]
+    
+    results = list(run_batch(jobs, max_workers=2))
+    
+    assert len(results) == len(jobs)
+    failed = [job.filename for job, response in results if not response.success]
+    assert failed == ['crash.csv']
+    assert [response.error_message for job, response in results if not response.success] == [
+        "Worker process died while analyzing 'crash.csv'"
+    ]
+
+def test_run_job_turns_exceptions_into_responses(data_dir):
+    (data_dir / 'text.csv').write_text('x,target\n1,a\n2,b\n')
+    
+    response = run_job(BatchJob('text.csv', 'target'), {})
+    
+    assert response.success is False
+    assert response.error_message.startswith("Error analyzing 'text.csv':")
+
+def test_response_to_json(data_dir):
+    _write_files(data_dir)
+    job = BatchJob('a.csv', 'target')
+    
+    record = json.loads(response_to_json(job, analyze_features('a.csv', 'target', top_k=1)))
+    
+    assert record == {'filename': 'a.csv', 'target_column': 'target', 'success': True,
+                      'result': ['x'], 'error_message': ''}
@@ -0,0 +1,37 @@
+from benchmarks.datasets import make_synthetic_dataset
+from benchmarks.bench_pipeline import run_pipeline_benchmark, build_report, compare_reports
+
+def test_make_synthetic_dataset_shape():
+    df = make_synthetic_dataset(200, n_numeric=6, n_categorical=2, cardinality=4, missing_rate=0.1)
+    
+    assert df.shape == (200, 9)
+    assert df['cat_0'].nunique() <= 4
+    assert df['num_0'].isna().any()
+    assert not df['target'].isna().any()
+
+def test_run_pipeline_benchmark_report():
+    df = make_synthetic_dataset(100, n_numeric=5, n_categorical=2)
+    
+    report = build_report({'rows': 100}, run_pipeline_benchmark(df, repeat=1))
+    
+    assert [stage['stage'] for stage in report['stages']] == [
+        'handle_missing_values',
+        'detect_feature_types',
+        'apply_one_hot_encoding',
+        'normalize_features',
+        'compute_correlation_scores',
+        'calculate_correlation_matrix',
+        'group_correlated_features'
+    ]
+    assert all(stage['seconds'] >= 0 and stage['peak_memory_bytes'] >= 0 for stage in report['stages'])
+
+def test_compare_reports_flags_regression():
+    baseline = {'stages': [{'stage': 'a', 'seconds': 1.0, 'peak_memory_bytes': 100}]}
+    slower = {'stages': [{'stage': 'a', 'seconds': 1.5, 'peak_memory_bytes': 100}]}
+    noisy = {'stages': [{'stage': 'a', 'seconds': 0.001, 'peak_memory_bytes': 100}]}
+    
+    _, regressed = compare_reports(baseline, slower, tolerance=0.2)
+    _, noisy_regressed = compare_reports({'stages': [dict(noisy['stages'][0], seconds=0.0001)]}, noisy, tolerance=0.2)
+    
+    assert regressed is True
+    assert noisy_regressed is False
@@ -0,0 +1,71 @@
+import os
+import pytest
+import pandas as pd
+import numpy as np
+from src import cache as cache_module
+from src.cache import ResultCache
+
+@pytest.fixture
+def result_cache(tmp_path):
+    return ResultCache(str(tmp_path / 'cache'))
+
+def test_file_digest_reuses_hash_for_unchanged_file(result_cache, tmp_path, monkeypatch):
+    file_path = tmp_path / 'data.csv'
+    file_path.write_text('a,b\n1,2\n')
+    first = result_cache.file_digest(str(file_path))
+    
+    def fail(*args):
+        raise AssertionError("file was hashed again")
+    
+    monkeypatch.setattr(cache_module, 'hash_file_contents', fail)
+    
+    assert result_cache.file_digest(str(file_path)) == first
+
+def test_file_digest_changes_with_contents(result_cache, tmp_path):
+    file_path = tmp_path / 'data.csv'
+    file_path.write_text('a,b\n1,2\n')
+    first = result_cache.file_digest(str(file_path))
+    
+    file_path.write_text('a,b\n1,3\n')
+    os.utime(file_path, ns=(0, 0))
+    
+    assert result_cache.file_digest(str(file_path)) != first
+
+def test_entry_key_depends_on_params(result_cache):
+    assert result_cache.entry_key('abc', 'matrix', {'x': 1}) != result_cache.entry_key('abc', 'matrix', {'x': 2})
+    assert result_cache.entry_key('abc', 'matrix', {'x': 1}) != result_cache.entry_key('abc', 'frame', {'x': 1})
+
+def test_frame_round_trip(result_cache):
+    df = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+    
+    result_cache.store_frame('key', df)
+    
+    pd.testing.assert_frame_equal(result_cache.load_frame('key'), df)
+    assert result_cache.load_frame('missing') is None
+
+def test_matrix_round_trip(result_cache):
+    matrix = pd.DataFrame([[1.0, 0.5], [0.5, np.nan]], index=['a', 'b'], columns=['a', 'b'])
+    
+    result_cache.store_matrix('key', matrix)
+    
+    pd.testing.assert_frame_equal(result_cache.load_matrix('key'), matrix)
+    assert result_cache.load_matrix('missing') is None
+
+def test_evict_least_recently_used(tmp_path):
+    result_cache = ResultCache(str(tmp_path / 'cache'), max_bytes=10 ** 9)
+    labels = [f'c{i}' for i in range(20)]
+    matrix = pd.DataFrame(np.ones((20, 20)), index=labels, columns=labels)
+    for key in ['old', 'used', 'new']:
+        result_cache.store_matrix(key, matrix)
+    paths = {key: os.path.join(result_cache.cache_dir, key + '.npz') for key in ['old', 'used', 'new']}
+    os.utime(paths['old'], ns=(1, 1))
+    os.utime(paths['used'], ns=(2, 2))
+    os.utime(paths['new'], ns=(3, 3))
+    result_cache.load_matrix('used')
+    
+    result_cache.max_bytes = os.path.getsize(paths['new']) * 2
+    result_cache.evict()
+    
+    assert not os.path.exists(paths['old'])
+    assert os.path.exists(paths['used'])
+    assert os.path.exists(paths['new'])
@@ -0,0 +1,31 @@
+import subprocess
+import sys
+import pytest
+from benchmarks.bench_startup import heavy_imports, import_times
+
+@pytest.mark.parametrize('args', [
+    ['-c', 'import src.cli'],
+    ['-m', 'src.cli', '--help'],
+    ['-m', 'src.cli', 'missing.csv', 'target'],
+    ['-m', 'src.batch', '--help']
+])
+def test_startup_does_not_import_heavy_libraries(args):
+    assert heavy_imports(args) == []
+
+def test_import_times_sees_heavy_libraries():
+    times = import_times(['-c', 'import src.main'])
+    
+    assert 'pandas' in times
+    assert times['src.main'] >= times['pandas']
+
+def test_cli_missing_file_error():
+    completed = subprocess.run([sys.executable, '-m', 'src.cli', 'missing.csv', 'target'], capture_output=True, text=True)
+    
+    assert completed.returncode == 1
+    assert "Error: File 'missing.csv' not found in data directory" in completed.stdout
+
+def test_cli_requires_a_target():
+    completed = subprocess.run([sys.executable, '-m', 'src.cli', 'housing.csv'], capture_output=True, text=True)
+    
+    assert completed.returncode == 2
+    assert 'a target column, --targets or --all-targets is required' in completed.stderr
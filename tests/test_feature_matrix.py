@@ -0,0 +1,112 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+import pandas as pd
+import numpy as np
+from src.feature_matrix import (
+    write_feature_matrix,
+    open_feature_matrix,
+    feature_matrix_scores,
+    feature_matrix_correlation
+)
+from src.preprocessing.encoding import apply_one_hot_encoding
+from src.preprocessing.normalization import normalize_features
+from src.analysis.correlation import compute_correlation_scores, calculate_correlation_matrix
+
+@pytest.fixture
+def sample_df():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'a': rng.normal(size=200),
+        'b': rng.integers(0, 5, 200),
+        'color': rng.choice(['red', 'green', 'blue', 'gray'], 200),
+        'size': pd.Categorical(rng.choice(['S', 'M'], 200), categories=['S', 'M', 'L'])
+    })
+    df['target'] = 2 * df['a'] + rng.normal(size=200)
+    df.loc[[3, 7], 'a'] = np.nan
+    df.loc[5, 'color'] = None
+    return df
+
+def _column_sum(path, column):
+    # Runs in a worker process, which maps the file instead of receiving the array
+    return float(np.nansum(open_feature_matrix(path).column(column)))
+
+def test_write_feature_matrix_is_column_major_and_mapped(sample_df, tmp_path):
+    path = str(tmp_path / 'features.npy')
+    matrix = write_feature_matrix(sample_df, path)
+    
+    assert matrix.columns == ['a', 'b', 'target']
+    assert isinstance(matrix.values, np.memmap)
+    assert matrix.values.flags.f_contiguous
+    np.testing.assert_array_equal(matrix.values, sample_df[['a', 'b', 'target']].to_numpy(dtype=np.float64))
+
+def test_write_feature_matrix_matches_encoding_and_normalization(sample_df, tmp_path):
+    matrix = write_feature_matrix(sample_df, str(tmp_path / 'features.npy'), max_categories=2, normalize=True)
+    encoded, _ = apply_one_hot_encoding(sample_df, max_categories=2)
+    expected = normalize_features(encoded)
+    
+    assert matrix.columns == expected.columns.tolist()
+    np.testing.assert_allclose(matrix.values, expected.to_numpy(dtype=np.float64))
+
+def test_write_feature_matrix_float32(sample_df, tmp_path):
+    matrix = write_feature_matrix(sample_df, str(tmp_path / 'features.npy'), dtype=np.float32)
+    
+    assert matrix.values.dtype == np.float32
+    
+    with pytest.raises(ValueError, match="dtype must be"):
+        write_feature_matrix(sample_df, str(tmp_path / 'other.npy'), dtype=np.int64)
+
+def test_open_feature_matrix_checks_metadata(sample_df, tmp_path):
+    path = str(tmp_path / 'features.npy')
+    write_feature_matrix(sample_df, path, metadata={'fingerprint': [1, 2]})
+    
+    matrix = open_feature_matrix(path, {'fingerprint': [1, 2]})
+    assert matrix.columns == ['a', 'b', 'target']
+    assert open_feature_matrix(path, {'fingerprint': [1, 3]}) is None
+    assert open_feature_matrix(str(tmp_path / 'missing.npy')) is None
+
+def test_open_feature_matrix_rejects_replaced_file(sample_df, tmp_path):
+    path = str(tmp_path / 'features.npy')
+    write_feature_matrix(sample_df, path)
+    np.save(path, np.zeros((5, 3)))
+    
+    assert open_feature_matrix(path) is None
+
+def test_write_feature_matrix_empty(tmp_path):
+    path = str(tmp_path / 'features.npy')
+    write_feature_matrix(pd.DataFrame({'a': pd.Series([], dtype=float)}), path)
+    matrix = open_feature_matrix(path)
+    
+    assert matrix.values.shape == (0, 1)
+    assert feature_matrix_scores(matrix, 'a').empty
+
+@pytest.mark.parametrize('method', ['pearson', 'spearman', 'kendall'])
+def test_feature_matrix_scores_match_in_memory(sample_df, tmp_path, method):
+    matrix = write_feature_matrix(sample_df, str(tmp_path / 'features.npy'))
+    
+    result = feature_matrix_scores(matrix, 'target', method=method)
+    expected = compute_correlation_scores(sample_df, 'target', method=method)
+    
+    assert result['feature'].tolist() == expected['feature'].tolist()
+    np.testing.assert_allclose(result['importance_score'], expected['importance_score'])
+    
+    with pytest.raises(ValueError, match="must be numeric"):
+        feature_matrix_scores(matrix, 'color')
+
+def test_feature_matrix_correlation_matches_in_memory(sample_df, tmp_path):
+    matrix = write_feature_matrix(sample_df, str(tmp_path / 'features.npy'))
+    
+    result = feature_matrix_correlation(matrix)
+    np.fill_diagonal(result.values, np.nan)
+    
+    pd.testing.assert_frame_equal(result, calculate_correlation_matrix(sample_df))
+
+def test_feature_matrix_shared_across_processes(sample_df, tmp_path):
+    path = str(tmp_path / 'features.npy')
+    write_feature_matrix(sample_df, path)
+    
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        sums = list(executor.map(_column_sum, [path, path], ['a', 'target']))
+    
+    assert sums == pytest.approx([np.nansum(sample_df['a']), sample_df['target'].sum()])
+    assert not any(name.endswith('.tmp') for name in os.listdir(tmp_path))
@@ -0,0 +1,101 @@
+import gzip
+import pytest
+import numpy as np
+import pandas as pd
+from src.formats import (
+    CSV,
+    PARQUET,
+    FEATHER,
+    detect_format,
+    is_plain_csv,
+    read_columns,
+    read_numeric_columns,
+    read_frame,
+    iter_frames
+)
+
+@pytest.fixture
+def sample_df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'a': rng.normal(size=100),
+        'b': rng.integers(0, 10, 100),
+        'city': rng.choice(['x', 'y'], 100),
+        'target': rng.normal(size=100)
+    })
+
+def test_detect_format_csv(sample_df, tmp_path):
+    sample_df.to_csv(tmp_path / 'plain.csv', index=False)
+    
+    assert detect_format(str(tmp_path / 'plain.csv')) == (CSV, None)
+    assert is_plain_csv(str(tmp_path / 'plain.csv'))
+
+def test_detect_format_compressed_csv_by_magic_bytes(sample_df, tmp_path):
+    # No telling extension: the gzip header identifies the compression
+    with gzip.open(tmp_path / 'export.dat', 'wt') as f:
+        sample_df.to_csv(f, index=False)
+    path = str(tmp_path / 'export.dat')
+    
+    assert detect_format(path) == (CSV, 'gzip')
+    assert not is_plain_csv(path)
+    assert read_columns(path) == ['a', 'b', 'city', 'target']
+    pd.testing.assert_frame_equal(read_frame(path), sample_df)
+
+@pytest.mark.parametrize('header', ['PAR1_score,target', 'ARROW1_id,target', 'BZh9,target', 'PK_id,target'])
+def test_csv_header_resembling_magic_bytes(tmp_path, header):
+    path = str(tmp_path / 'export.csv')
+    with open(path, 'w') as f:
+        f.write(header + '\n1,2\n3,4\n')
+    
+    assert detect_format(path) == (CSV, None)
+    assert read_columns(path) == header.split(',')
+    assert read_frame(path).shape == (2, 2)
+
+@pytest.mark.parametrize('compression', ['gzip', 'bz2', 'xz'])
+def test_iter_frames_compressed_csv(sample_df, tmp_path, compression):
+    path = str(tmp_path / 'export.csv')
+    sample_df.to_csv(path, index=False, compression=compression)
+    
+    chunks = list(iter_frames(path, 30))
+    
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), sample_df)
+    assert read_numeric_columns(path) is None
+
+@pytest.mark.parametrize('file_format, extension', [(PARQUET, '.parquet'), (FEATHER, '.feather')])
+def test_columnar_formats(sample_df, tmp_path, file_format, extension):
+    pytest.importorskip('pyarrow')
+    path = str(tmp_path / ('export' + extension))
+    if file_format == PARQUET:
+        sample_df.to_parquet(path, index=False, row_group_size=40)
+    else:
+        sample_df.to_feather(path)
+    
+    assert detect_format(path) == (file_format, None)
+    assert read_columns(path) == ['a', 'b', 'city', 'target']
+    assert read_numeric_columns(path) == ['a', 'b', 'target']
+    pd.testing.assert_frame_equal(read_frame(path, columns=['a', 'target']), sample_df[['a', 'target']])
+    
+    chunks = list(iter_frames(path, 25, columns=['b']))
+    assert max(len(chunk) for chunk in chunks) <= 25
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), sample_df[['b']])
+
+def test_columnar_format_detected_without_extension(sample_df, tmp_path):
+    pytest.importorskip('pyarrow')
+    sample_df.to_parquet(tmp_path / 'export.bin', index=False)
+    
+    assert detect_format(str(tmp_path / 'export.bin')) == (PARQUET, None)
+
+def test_columnar_format_without_pyarrow(sample_df, tmp_path, monkeypatch):
+    import builtins
+    (tmp_path / 'export.parquet').write_bytes(b'PAR1' + b'\x00' * 16 + b'PAR1')
+    original_import = builtins.__import__
+    
+    def import_without_pyarrow(name, *args, **kwargs):
+        if name.split('.')[0] == 'pyarrow':
+            raise ImportError(name)
+        return original_import(name, *args, **kwargs)
+    
+    monkeypatch.setattr(builtins, '__import__', import_without_pyarrow)
+    with pytest.raises(ImportError, match="Reading Parquet files requires the pyarrow package"):
+        read_columns(str(tmp_path / 'export.parquet'))
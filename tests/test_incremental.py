@@ -0,0 +1,71 @@
+import pandas as pd
+import numpy as np
+from src import incremental
+from src.incremental import update_state_from_file
+from src.analysis.streaming import correlation_matrix_from_state
+from src.analysis.correlation import calculate_streaming_correlation_matrix, group_correlated_features
+
+def _frame(n_rows, seed):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.normal(size=(n_rows, 3)), columns=['a', 'b', 'target'])
+    df['b'] = df['b'] + df['target']
+    return df
+
+def test_update_reads_only_appended_rows(data_dir, tmp_path, monkeypatch):
+    state_path = str(tmp_path / 'state.npz')
+    history, appended = _frame(300, 0), _frame(50, 1)
+    history.to_csv(data_dir / 'log.csv', index=False)
+    update_state_from_file('log.csv', state_path)
+    
+    with open(data_dir / 'log.csv', 'a') as f:
+        appended.to_csv(f, index=False, header=False)
+    
+    read_rows = []
+    original_update = incremental.update_correlation_state
+    
+    def counting_update(state, chunks):
+        chunks = list(chunks)
+        read_rows.extend(len(chunk) for chunk in chunks)
+        return original_update(state, chunks)
+    
+    monkeypatch.setattr(incremental, 'update_correlation_state', counting_update)
+    state, error = update_state_from_file('log.csv', state_path)
+    
+    assert error == ""
+    assert sum(read_rows) == 50
+    assert state.n_rows == 350
+    full = pd.read_csv(data_dir / 'log.csv')
+    pd.testing.assert_frame_equal(correlation_matrix_from_state(state), full.corr(), atol=1e-12)
+
+def test_updated_groups_match_full_recompute(data_dir, tmp_path):
+    state_path = str(tmp_path / 'state.npz')
+    _frame(200, 0).to_csv(data_dir / 'log.csv', index=False)
+    update_state_from_file('log.csv', state_path)
+    with open(data_dir / 'log.csv', 'a') as f:
+        _frame(100, 1).to_csv(f, index=False, header=False)
+    
+    state, _ = update_state_from_file('log.csv', state_path)
+    full = pd.read_csv(data_dir / 'log.csv').corr()
+    full.values[np.diag_indices_from(full)] = np.nan
+    
+    assert group_correlated_features(calculate_streaming_correlation_matrix(state), 0.5) == \
+        group_correlated_features(full, 0.5)
+
+def test_rewritten_file_rebuilds_state(data_dir, tmp_path):
+    state_path = str(tmp_path / 'state.npz')
+    _frame(200, 0).to_csv(data_dir / 'log.csv', index=False)
+    update_state_from_file('log.csv', state_path)
+    
+    rewritten = _frame(250, 2)
+    rewritten.to_csv(data_dir / 'log.csv', index=False)
+    state, error = update_state_from_file('log.csv', state_path)
+    
+    assert error == ""
+    assert state.n_rows == 250
+    pd.testing.assert_frame_equal(correlation_matrix_from_state(state), rewritten.corr(), atol=1e-12)
+
+def test_update_nonexistent_file(data_dir, tmp_path):
+    state, error = update_state_from_file('missing.csv', str(tmp_path / 'state.npz'))
+    
+    assert state is None
+    assert error == "File 'missing.csv' not found in data directory"
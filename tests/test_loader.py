@@ -0,0 +1,179 @@
+import pytest
+import numpy as np
+import pandas as pd
+from src.loader import load_dataset, iter_dataset_chunks, infer_compact_dtypes, downcast_integer_columns
+
+def test_load_dataset_basic(data_dir):
+    (data_dir / 'sample.csv').write_text('a,b,target\n1,2,3\n4,5,6\n')
+    
+    df, error = load_dataset('sample.csv', 'target')
+    
+    assert error == ""
+    assert list(df.columns) == ['a', 'b', 'target']
+    assert len(df) == 2
+
+def test_load_dataset_parses_data_once(data_dir, monkeypatch):
+    (data_dir / 'sample.csv').write_text('a,target\n1,2\n3,4\n')
+    full_reads = []
+    original_read_csv = pd.read_csv
+    
+    def counting_read_csv(*args, **kwargs):
+        if kwargs.get('nrows') != 0:
+            full_reads.append(args)
+        return original_read_csv(*args, **kwargs)
+    
+    monkeypatch.setattr(pd, 'read_csv', counting_read_csv)
+    df, error = load_dataset('sample.csv', 'target')
+    
+    assert error == ""
+    assert len(full_reads) == 1
+
+def test_load_dataset_missing_file(data_dir):
+    df, error = load_dataset('missing.csv', 'target')
+    
+    assert df is None
+    assert error == "File 'missing.csv' not found in data directory"
+
+def test_load_dataset_empty_file(data_dir):
+    (data_dir / 'empty.csv').write_text('')
+    
+    df, error = load_dataset('empty.csv', 'target')
+    
+    assert df is None
+    assert error == "File 'empty.csv' is empty"
+
+def test_load_dataset_missing_target_skips_full_parse(data_dir, monkeypatch):
+    (data_dir / 'sample.csv').write_text('a,b\n1,2\n')
+    full_reads = []
+    original_read_csv = pd.read_csv
+    
+    def counting_read_csv(*args, **kwargs):
+        if kwargs.get('nrows') != 0:
+            full_reads.append(args)
+        return original_read_csv(*args, **kwargs)
+    
+    monkeypatch.setattr(pd, 'read_csv', counting_read_csv)
+    df, error = load_dataset('sample.csv', 'target')
+    
+    assert df is None
+    assert error == "Column 'target' not found in 'sample.csv'"
+    assert full_reads == []
+
+def test_load_dataset_malformed_file(data_dir):
+    (data_dir / 'bad.csv').write_text('column1,target\n1,2\n"unclosed_quote,3')
+    
+    df, error = load_dataset('bad.csv', 'target')
+    
+    assert df is None
+    assert error == "File 'bad.csv' is not a valid CSV file"
+
+def test_infer_compact_dtypes():
+    sample = pd.DataFrame({
+        'price': [1.5, 2.5, 3.5, 4.5],
+        'count': [1, 2, 3, 4],
+        'city': ['A', 'B', 'A', 'A'],
+        'id': ['x1', 'x2', 'x3', 'x4']
+    })
+    
+    dtypes = infer_compact_dtypes(sample)
+    
+    assert dtypes == {'price': np.float32, 'city': 'category'}
+
+def test_downcast_integer_columns():
+    df = pd.DataFrame({'small': [1, 2, 3], 'large': [1, 2, 70000], 'ratio': [0.5, 1.0, 1.5]})
+    
+    result = downcast_integer_columns(df)
+    
+    assert result['small'].dtype == np.int8
+    assert result['large'].dtype == np.int32
+    assert result['ratio'].dtype == np.float64
+
+def test_load_dataset_optimize_memory(data_dir):
+    (data_dir / 'sample.csv').write_text('price,city,count,target\n1.5,A,1,10\n2.5,B,2,20\n3.5,A,3,30\n')
+    
+    df, error = load_dataset('sample.csv', 'target', optimize_memory=True)
+    
+    assert error == ""
+    assert list(df.columns) == ['price', 'count', 'target']
+    assert df['price'].dtype == np.float32
+    assert df['count'].dtype == np.int8
+
+def test_load_dataset_optimize_memory_keep_categorical(data_dir):
+    (data_dir / 'sample.csv').write_text('price,city,count,target\n1.5,A,1,10\n2.5,B,2,20\n3.5,A,3,30\n4.5,A,4,40\n')
+    
+    df, error = load_dataset('sample.csv', 'target', optimize_memory=True, keep_categorical=True)
+    
+    assert error == ""
+    assert list(df.columns) == ['price', 'city', 'count', 'target']
+    assert df['city'].dtype == 'category'
+
+def test_load_dataset_optimize_memory_values_beyond_sample(data_dir):
+    (data_dir / 'sample.csv').write_text('value,target\n1.5,1\n2.5,2\nn/a_text,3\n')
+    
+    df, error = load_dataset('sample.csv', 'target', optimize_memory=True, sample_rows=2)
+    
+    assert error == ""
+    assert df['value'].dtype == object
+
+def test_load_dataset_gzip_csv(data_dir):
+    pd.DataFrame({'a': [1.0, 2.0, 3.0], 'target': [2, 4, 7]}).to_csv(data_dir / 'export.csv.gz', index=False)
+    
+    df, error = load_dataset('export.csv.gz', 'target', optimize_memory=True)
+    
+    assert error == ""
+    assert df['a'].dtype == np.float32
+    assert df['target'].tolist() == [2, 4, 7]
+
+def test_load_dataset_parquet_reads_only_needed_columns(data_dir, monkeypatch):
+    pytest.importorskip('pyarrow')
+    from src import loader
+    pd.DataFrame({'a': [1.0, 2.0], 'note': ['x', 'y'], 'label': ['p', 'q']}).to_parquet(data_dir / 'export.parquet')
+    requested = []
+    original_read_frame = loader.read_frame
+    
+    def recording_read_frame(file_path, columns=None, **read_options):
+        requested.append(columns)
+        return original_read_frame(file_path, columns=columns, **read_options)
+    
+    monkeypatch.setattr(loader, 'read_frame', recording_read_frame)
+    df, error = load_dataset('export.parquet', 'label', optimize_memory=True)
+    
+    assert error == ""
+    assert requested == [['a', 'label']]
+    assert df['a'].dtype == np.float32
+    
+    _, error = load_dataset('export.parquet', 'missing')
+    assert error == "Column 'missing' not found in 'export.parquet'"
+
+@pytest.mark.parametrize('chunked', [False, True])
+def test_parquet_string_columns_are_not_read(data_dir, monkeypatch, chunked):
+    pytest.importorskip('pyarrow')
+    from src import formats
+    pd.DataFrame({
+        'a': [1.0, 2.0, 3.0],
+        'text': ['x' * 10000] * 3,
+        'target': [2.0, 4.0, 7.0]
+    }).to_parquet(data_dir / 'export.parquet')
+    requested = []
+    original_read_parquet = pd.read_parquet
+    original_iter_arrow_frames = formats._iter_arrow_frames
+    
+    def recording_read_parquet(path, columns=None, **kwargs):
+        requested.append(columns)
+        return original_read_parquet(path, columns=columns, **kwargs)
+    
+    def recording_iter_arrow_frames(file_path, file_format, chunksize, columns):
+        requested.append(columns)
+        return original_iter_arrow_frames(file_path, file_format, chunksize, columns)
+    
+    monkeypatch.setattr(pd, 'read_parquet', recording_read_parquet)
+    monkeypatch.setattr(formats, '_iter_arrow_frames', recording_iter_arrow_frames)
+    if chunked:
+        chunks, error = iter_dataset_chunks('export.parquet', 'target', 2)
+        df = pd.concat(chunks)
+    else:
+        df, error = load_dataset('export.parquet', 'target')
+    
+    assert error == ""
+    assert requested == [['a', 'target']]
+    assert df.columns.tolist() == ['a', 'target']
@@ -1,6 +1,8 @@
+import warnings
 import pytest
+import numpy as np
 import pandas as pd
-from src.main import analyze_features, Response
+from src.main import analyze_features, analyze_targets, correlation_matrix_for_file, Response
 
 def test_analyze_features_nonexistent_file():
     result = analyze_features("nonexistent.csv", target_column="target")
@@ -57,3 +59,247 @@ def test_analyze_features_generic_exception():
     # Clean up
     import os
     os.remove('data/bad.csv')
+
+def test_analyze_features_chunked_matches_in_memory():
+    expected = analyze_features("housing.csv", target_column="MEDV")
+    result = analyze_features("housing.csv", target_column="MEDV", chunksize=50)
+    
+    assert result.success is True
+    assert result.result == expected.result
+
+def test_analyze_features_chunked_nonexistent_file():
+    result = analyze_features("nonexistent.csv", target_column="target", chunksize=10)
+    assert result.success is False
+    assert result.result == []
+
+def test_analyze_features_top_k():
+    full = analyze_features("housing.csv", target_column="MEDV")
+    result = analyze_features("housing.csv", target_column="MEDV", top_k=3)
+    
+    assert result.success is True
+    assert result.result == full.result[:3]
+
+def test_analyze_features_optimize_memory():
+    expected = analyze_features("housing.csv", target_column="MEDV")
+    result = analyze_features("housing.csv", target_column="MEDV", optimize_memory=True)
+    
+    assert result.success is True
+    assert result.result[:5] == expected.result[:5]
+
+def test_analyze_features_profile():
+    result = analyze_features("housing.csv", target_column="MEDV", profile=True)
+    
+    assert result.success is True
+    assert [stage['stage'] for stage in result.profile] == [
+        'load', 'handle_missing_values', 'compute_correlation_scores'
+    ]
+
+def test_analyze_features_profile_disabled():
+    result = analyze_features("housing.csv", target_column="MEDV")
+    
+    assert result.profile is None
+
+def test_analyze_features_cache_skips_parsing(tmp_path, monkeypatch):
+    from src import main
+    cache_dir = str(tmp_path / 'cache')
+    expected = analyze_features("housing.csv", target_column="MEDV")
+    first = analyze_features("housing.csv", target_column="MEDV", cache=True, cache_dir=cache_dir)
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("file was parsed again")
+    
+    monkeypatch.setattr(main, 'load_dataset', fail)
+    monkeypatch.setattr(main, 'blocked_correlation', fail)
+    second = analyze_features("housing.csv", target_column="CRIM", cache=True, cache_dir=cache_dir)
+    
+    assert first.result == expected.result
+    assert second.success is True
+    assert second.result == analyze_features("housing.csv", target_column="CRIM", chunksize=100).result
+
+def test_analyze_features_cache_missing_target(tmp_path):
+    result = analyze_features("housing.csv", target_column="nope", cache=True, cache_dir=str(tmp_path))
+    
+    assert result.success is False
+    assert result.error_message == "Column 'nope' not found in 'housing.csv'"
+
+def test_analyze_targets_matches_single_target():
+    result = analyze_targets("housing.csv", target_columns=["MEDV", "CRIM"])
+    
+    assert result.success is True
+    assert result.result == ["MEDV", "CRIM"]
+    assert list(result.scores.columns) == ['target', 'feature', 'importance_score', 'rank']
+    for target in ["MEDV", "CRIM"]:
+        ranked = result.scores[result.scores['target'] == target]
+        assert ranked['feature'].tolist() == analyze_features("housing.csv", target_column=target).result
+        assert ranked['rank'].tolist() == list(range(1, len(ranked) + 1))
+
+def test_analyze_targets_all_numeric_columns():
+    numeric_columns = pd.read_csv('data/housing.csv').select_dtypes(include=['number']).columns.tolist()
+    result = analyze_targets("housing.csv", chunksize=100)
+    
+    assert result.success is True
+    assert sorted(result.result) == sorted(numeric_columns)
+    assert set(result.scores['target']) == set(numeric_columns)
+
+def test_analyze_targets_missing_target():
+    result = analyze_targets("housing.csv", target_columns=["MEDV", "nope"])
+    
+    assert result.success is False
+    assert result.error_message == "Column 'nope' not found in 'housing.csv'"
+
+def test_analyze_features_state_path_matches_chunked(tmp_path):
+    state_path = str(tmp_path / 'housing_state.npz')
+    expected = analyze_features("housing.csv", target_column="MEDV", chunksize=100)
+    first = analyze_features("housing.csv", target_column="MEDV", state_path=state_path)
+    second = analyze_features("housing.csv", target_column="CRIM", state_path=state_path, profile=True)
+    
+    assert first.result == expected.result
+    assert second.result == analyze_features("housing.csv", target_column="CRIM", chunksize=100).result
+    assert [stage['stage'] for stage in second.profile][0] == 'update_state'
+    assert second.profile[0]['rows_out'] == 506
+
+def test_analyze_features_spearman():
+    result = analyze_features("housing.csv", target_column="MEDV", method='spearman')
+    targets = analyze_targets("housing.csv", target_columns=["MEDV"], method='spearman')
+    
+    assert result.success is True
+    assert result.result[0] == 'LSTAT'
+    assert targets.scores['feature'].tolist() == result.result
+
+def test_analyze_features_rank_method_rejects_chunksize():
+    with pytest.raises(ValueError, match="needs the whole file in memory"):
+        analyze_features("housing.csv", target_column="MEDV", method='kendall', chunksize=100)
+
+def test_analyze_features_mutual_info():
+    result = analyze_features("housing.csv", target_column="MEDV", method='mutual_info')
+    
+    assert result.success is True
+    assert set(result.result[:2]) == {'LSTAT', 'RM'}
+
+def test_analyze_features_mutual_info_optimize_memory_keeps_categorical(data_dir):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'cat': rng.choice(['a', 'b', 'c'], 500), 'num': rng.normal(size=500)})
+    df['target'] = (df['cat'] == 'a') * 2.0 + df['num']
+    df.to_csv(data_dir / 'mixed.csv', index=False)
+    
+    result = analyze_features('mixed.csv', target_column='target', method='mutual_info', optimize_memory=True)
+    
+    assert result.success is True
+    assert set(result.result) == {'cat', 'num'}
+
+def test_analyze_features_mutual_info_rejects_cache(tmp_path):
+    with pytest.raises(ValueError, match="cannot be used with chunksize, state_path or cache"):
+        analyze_features("housing.csv", target_column="MEDV", method='mutual_info', cache=True, cache_dir=str(tmp_path))
+
+@pytest.mark.parametrize('sampling', ['offset', 'reservoir'])
+def test_analyze_features_sampled(sampling):
+    full = analyze_features("housing.csv", target_column="MEDV")
+    result = analyze_features("housing.csv", target_column="MEDV", sample_size=400, sampling=sampling, seed=0)
+    
+    assert result.success is True
+    assert result.result[0] == full.result[0]
+    assert set(result.result) == set(full.result)
+    assert (result.scores['ci_low'] <= result.scores['importance_score']).all()
+
+def test_analyze_features_sampled_defaults_to_uniform_sample(monkeypatch):
+    from src import main
+    
+    # The offset sampler favours rows after long lines, so it must be asked for explicitly
+    def fail(*args, **kwargs):
+        raise AssertionError("offset sampling used by default")
+    monkeypatch.setattr(main, 'LineSampler', fail)
+    
+    result = analyze_features("housing.csv", target_column="MEDV", sample_size=400, seed=0)
+    
+    assert result.success is True
+
+def test_analyze_features_sampled_grows_until_stable():
+    result = analyze_features("housing.csv", target_column="MEDV", top_k=2, sample_size=50, max_sample_size=506,
+                              sampling='reservoir', seed=0, profile=True)
+    
+    assert result.result == ['LSTAT', 'RM']
+    assert [stage['stage'] for stage in result.profile].count('compute_correlation_scores') >= 2
+
+def test_analyze_features_offset_sampling_skips_empty_draws():
+    # With seed 5 one growth round draws only lines that were already sampled
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', FutureWarning)
+        result = analyze_features("housing.csv", target_column="MEDV", sample_size=3, max_sample_size=100,
+                                  sampling='offset', seed=5)
+    
+    assert result.success is True
+
+def test_analyze_features_sampled_nonexistent_file():
+    result = analyze_features("nonexistent.csv", target_column="MEDV", sample_size=100)
+    
+    assert result.success is False
+    assert result.error_message == "File 'nonexistent.csv' not found in data directory"
+
+def test_analyze_features_matrix_path_reopens_matrix(tmp_path, monkeypatch):
+    from src import main
+    matrix_path = str(tmp_path / 'housing.npy')
+    expected = analyze_features("housing.csv", target_column="MEDV")
+    expected_spearman = analyze_features("housing.csv", target_column="CRIM", method='spearman')
+    first = analyze_features("housing.csv", target_column="MEDV", matrix_path=matrix_path)
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("file was parsed again")
+    
+    monkeypatch.setattr(main, 'load_dataset', fail)
+    second = analyze_features("housing.csv", target_column="CRIM", matrix_path=matrix_path, method='spearman',
+                              profile=True)
+    
+    assert first.result == expected.result
+    assert second.success is True
+    assert second.result == expected_spearman.result
+    assert 'write_feature_matrix' not in [stage['stage'] for stage in second.profile]
+
+def test_analyze_features_matrix_path_rejects_chunksize(tmp_path):
+    with pytest.raises(ValueError, match="matrix_path cannot be used"):
+        analyze_features("housing.csv", target_column="MEDV", chunksize=100, matrix_path=str(tmp_path / 'm.npy'))
+
+@pytest.mark.parametrize('filename', ['housing.parquet', 'housing.csv.gz'])
+def test_analyze_features_columnar_and_compressed_inputs(tmp_path, monkeypatch, filename):
+    if filename.endswith('.parquet'):
+        pytest.importorskip('pyarrow')
+    expected = analyze_features("housing.csv", target_column="MEDV").result
+    housing = pd.read_csv('data/housing.csv')
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    if filename.endswith('.parquet'):
+        housing.to_parquet(tmp_path / 'data' / filename, row_group_size=100)
+    else:
+        housing.to_csv(tmp_path / 'data' / filename, index=False)
+    
+    assert analyze_features(filename, target_column="MEDV").result == expected
+    assert analyze_features(filename, target_column="MEDV", chunksize=100).result == expected
+    sampled = analyze_features(filename, target_column="MEDV", sample_size=506, seed=0)
+    assert set(sampled.result) == set(expected)
+
+def test_analyze_features_redundancy_threshold(tmp_path):
+    full = analyze_features("housing.csv", target_column="MEDV")
+    result = analyze_features("housing.csv", target_column="MEDV", redundancy_threshold=0.7, top_k=5)
+    mapped = analyze_features("housing.csv", target_column="MEDV", redundancy_threshold=0.7, top_k=5,
+                              matrix_path=str(tmp_path / 'housing.npy'))
+    
+    assert result.success is True
+    assert result.result[:4] == full.result[:4]
+    assert 'TAX' not in result.result
+    assert list(result.scores.columns) == ['feature', 'importance_score', 'rank']
+    assert result.scores['rank'].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert mapped.result == result.result
+    
+    with pytest.raises(ValueError, match="redundancy_threshold cannot be used"):
+        analyze_features("housing.csv", target_column="MEDV", redundancy_threshold=0.7, chunksize=100)
+    with pytest.raises(ValueError, match="redundancy_threshold cannot be used"):
+        analyze_features("housing.csv", target_column="MEDV", redundancy_threshold=0.7, method='kendall')
+
+def test_correlation_matrix_for_file_streamed_matches_in_memory():
+    matrix, error = correlation_matrix_for_file("housing.csv")
+    streamed, _ = correlation_matrix_for_file("housing.csv", chunksize=100)
+    
+    assert error == ""
+    assert 'MEDV' in matrix.columns
+    pd.testing.assert_frame_equal(streamed, matrix, check_exact=False)
+    with pytest.raises(ValueError, match="needs the whole file in memory"):
+        correlation_matrix_for_file("housing.csv", method='spearman', chunksize=100)
@@ -52,4 +52,64 @@ def test_apply_one_hot_encoding_mixed_data():
     assert 'gender_M' in df_encoded.columns
     assert 'gender_F' in df_encoded.columns
     assert 'education_BS' in df_encoded.columns
-    assert 'education_MS' in df_encoded.columns 
\ No newline at end of file
+    assert 'education_MS' in df_encoded.columns 
+def test_apply_one_hot_encoding_column_order():
+    df = pd.DataFrame({
+        'color': ['red', 'blue', 'red'],
+        'age': [25, 30, 35],
+        'size': ['S', 'L', 'M']
+    })
+    
+    df_encoded, _ = apply_one_hot_encoding(df, max_categories=10)
+    
+    assert list(df_encoded.columns) == ['age', 'color_blue', 'color_red', 'size_L', 'size_M', 'size_S']
+
+def test_apply_one_hot_encoding_limit_collapses_missing_into_other():
+    df = pd.DataFrame({
+        'category': ['A', 'A', 'B', 'B', 'C', None]
+    })
+    
+    df_encoded, _ = apply_one_hot_encoding(df, max_categories=2)
+    
+    assert list(df_encoded.columns) == ['category_A', 'category_B', 'category_other']
+    assert df_encoded['category_other'].tolist() == [False, False, False, False, True, True]
+
+def test_apply_one_hot_encoding_sparse():
+    df = pd.DataFrame({
+        'age': [25, 30, 35],
+        'gender': ['M', 'F', 'M']
+    })
+    
+    df_encoded, _ = apply_one_hot_encoding(df, max_categories=10, sparse=True)
+    
+    assert isinstance(df_encoded['gender_M'].dtype, pd.SparseDtype)
+    assert df_encoded['gender_M'].sparse.to_dense().tolist() == [True, False, True]
+    assert df_encoded['age'].tolist() == [25, 30, 35]
+
+def test_apply_one_hot_encoding_no_categorical():
+    df = pd.DataFrame({'age': [25, 30, 35]})
+    
+    df_encoded, categorical_cols = apply_one_hot_encoding(df, max_categories=10)
+    
+    assert categorical_cols == []
+    assert df_encoded.equals(df)
+
+def test_apply_one_hot_encoding_category_dtype():
+    df = pd.DataFrame({
+        'category': pd.Categorical(['A', 'A', 'B', 'C', 'D'])
+    })
+    
+    df_encoded, categorical_cols = apply_one_hot_encoding(df, max_categories=2)
+    
+    assert categorical_cols == ['category']
+    assert df_encoded['category_other'].tolist() == [False, False, False, True, True]
+
+def test_apply_one_hot_encoding_drops_unused_category_levels():
+    df = pd.DataFrame({
+        'category': pd.Categorical(['A', 'B', 'A'], categories=['A', 'B', 'C', 'D'])
+    })
+    
+    for sparse in (False, True):
+        df_encoded, _ = apply_one_hot_encoding(df, max_categories=10, sparse=sparse)
+        
+        assert df_encoded.columns.tolist() == ['category_A', 'category_B']
@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
-from src.preprocessing.feature_types import detect_feature_types
+from src.preprocessing.feature_types import detect_feature_types, detect_feature_types_from_dtypes
 
 def test_detect_feature_types_numerical():
     # Create DataFrame with numerical columns
@@ -61,4 +61,25 @@ def test_detect_feature_types_datetime():
     assert len(names) == 2
     assert len(types) == 2
     assert types[0] == 'numerical'  # datetime defaults to numerical
-    assert types[1] == 'numerical'  # age 
\ No newline at end of file
+    assert types[1] == 'numerical'  # age 
+def test_detect_feature_types_category_dtype():
+    df = pd.DataFrame({
+        'gender': pd.Categorical(['M', 'F', 'M']),
+        'age': [25, 30, 35]
+    })
+    
+    names, types = detect_feature_types(df)
+    
+    assert types == ['categorical', 'numerical']
+
+def test_detect_feature_types_from_dtypes_matches_frame():
+    df = pd.DataFrame({
+        'age': [25, 30, 35],
+        'gender': pd.Categorical(['M', 'F', 'M']),
+        'city': ['a', 'b', 'c'],
+        'date': pd.date_range('2024-01-01', periods=3)
+    })
+    
+    assert detect_feature_types_from_dtypes(df.dtypes) == detect_feature_types(df)
+    # The dtypes of an empty chunk are enough, no rows are needed
+    assert detect_feature_types_from_dtypes(df.head(0).dtypes)[1] == ['numerical', 'categorical', 'categorical', 'numerical']
@@ -1,7 +1,11 @@
 import pytest
 import pandas as pd
 import numpy as np
-from src.preprocessing.missing_values import handle_missing_values
+from src.preprocessing.missing_values import (
+    handle_missing_values,
+    count_missing_values,
+    columns_above_missing_threshold
+)
 
 def test_handle_missing_values_no_missing():
     # Create DataFrame with no missing values
@@ -43,4 +47,39 @@ def test_handle_missing_values_all_columns():
     df_cleaned, removed = handle_missing_values(df, threshold=0.5)
     
     assert len(removed) == 3
-    assert len(df_cleaned.columns) == 0 
\ No newline at end of file
+    assert len(df_cleaned.columns) == 0 
+
+def test_count_missing_values_matches_isnull():
+    df = pd.DataFrame({
+        'float': [1.0, np.nan, np.nan, 4.0],
+        'int': [1, 2, 3, 4],
+        'nullable': pd.array([1, None, 3, 4], dtype='Int64'),
+        'text': ['a', None, 'c', np.nan],
+        'category': pd.Categorical(['x', None, 'y', 'x']),
+        'date': pd.to_datetime(['2024-01-01', None, '2024-01-03', '2024-01-04'])
+    })
+    
+    pd.testing.assert_series_equal(count_missing_values(df), df.isnull().sum())
+
+def test_count_missing_values_arrow_backed():
+    pa = pytest.importorskip('pyarrow')
+    df = pd.DataFrame({
+        'a': pd.array([1.5, None, 3.0], dtype='float64[pyarrow]'),
+        'b': pd.array(['x', None, None], dtype=pd.ArrowDtype(pa.string()))
+    })
+    
+    assert count_missing_values(df).tolist() == [1, 2]
+    _, removed = handle_missing_values(df, threshold=0.5)
+    assert removed == ['b']
+
+def test_columns_above_missing_threshold():
+    missing_counts = pd.Series({'A': 2, 'B': 4, 'C': 1})
+    
+    assert columns_above_missing_threshold(missing_counts, 5, 0.3) == ['A', 'B']
+    assert columns_above_missing_threshold(missing_counts, 0, 0.3) == []
+
+def test_handle_missing_values_empty_frame():
+    df_cleaned, removed = handle_missing_values(pd.DataFrame({'A': pd.Series([], dtype=float)}), threshold=0.5)
+    
+    assert removed == []
+    assert df_cleaned.columns.tolist() == ['A']
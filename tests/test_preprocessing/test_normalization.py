@@ -1,7 +1,13 @@
+import json
 import pytest
 import pandas as pd
 import numpy as np
-from src.preprocessing.normalization import normalize_features
+from src.preprocessing.normalization import (
+    normalize_features,
+    fit_min_max_scaler,
+    update_min_max_scaler,
+    MinMaxScaler
+)
 
 def test_normalize_features_basic():
     # Create DataFrame with numerical columns
@@ -61,4 +67,39 @@ def test_normalize_features_disabled():
     df_normalized = normalize_features(df, normalize=False)
     
     # Check values remain unchanged
-    assert (df_normalized == df).all().all() 
\ No newline at end of file
+    assert (df_normalized == df).all().all() 
+def test_normalize_features_in_place():
+    df = pd.DataFrame({
+        'age': [20, 30, 40],
+        'name': ['John', 'Jane', 'Bob']
+    })
+    
+    df_normalized = normalize_features(df, copy=False)
+    
+    assert df_normalized is df
+    assert df['age'].tolist() == [0.0, 0.5, 1.0]
+
+def test_normalize_features_with_missing():
+    df = pd.DataFrame({
+        'age': [20, np.nan, 40],
+        'empty': [np.nan, np.nan, np.nan]
+    })
+    
+    df_normalized = normalize_features(df)
+    
+    assert df_normalized['age'].tolist()[::2] == [0.0, 1.0]
+    assert np.isnan(df_normalized['age'].iloc[1])
+    assert df_normalized['empty'].isna().all()
+
+def test_min_max_scaler_reused_on_later_batches():
+    first = pd.DataFrame({'age': [20, 30], 'salary': [50000, 60000]})
+    second = pd.DataFrame({'age': [40, 25], 'salary': [100000, 75000]})
+    
+    scaler = update_min_max_scaler(fit_min_max_scaler(first), second)
+    restored = MinMaxScaler.from_dict(json.loads(json.dumps(scaler.to_dict())))
+    
+    result = normalize_features(second, scaler=restored)
+    expected = normalize_features(pd.concat([first, second], ignore_index=True)).iloc[2:].reset_index(drop=True)
+    
+    assert restored == scaler
+    pd.testing.assert_frame_equal(result, expected)
@@ -0,0 +1,53 @@
+import pytest
+import pandas as pd
+from src.profiling import Profiler, data_shape, format_profile
+
+def test_profiler_records_stage():
+    profiler = Profiler()
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]})
+    
+    with profiler.stage('drop', df) as stage:
+        result = df.drop(columns=['b'])
+        stage.output(result)
+    
+    profile = profiler.to_list()
+    assert len(profile) == 1
+    assert profile[0]['stage'] == 'drop'
+    assert (profile[0]['rows_in'], profile[0]['columns_in']) == (3, 2)
+    assert (profile[0]['rows_out'], profile[0]['columns_out']) == (3, 1)
+    assert profile[0]['wall_seconds'] >= 0
+    assert profile[0]['traced_peak_bytes'] >= 0
+
+def test_profiler_disabled_records_nothing():
+    profiler = Profiler(enabled=False)
+    
+    with profiler.stage('noop', pd.DataFrame()) as stage:
+        stage.output(pd.DataFrame())
+    
+    assert profiler.stages == []
+    assert profiler.to_list() is None
+
+def test_profiler_records_failed_stage():
+    profiler = Profiler(trace_memory=False)
+    
+    with pytest.raises(RuntimeError):
+        with profiler.stage('boom'):
+            raise RuntimeError("boom")
+    
+    assert profiler.to_list()[0]['stage'] == 'boom'
+    assert profiler.to_list()[0]['traced_peak_bytes'] is None
+
+def test_data_shape():
+    assert data_shape(pd.DataFrame({'a': [1, 2]})) == (2, 1)
+    assert data_shape([1, 2]) == (None, None)
+
+def test_format_profile():
+    profiler = Profiler()
+    with profiler.stage('load') as stage:
+        stage.output_shape(10, 3)
+    
+    table = format_profile(profiler.to_list())
+    
+    assert table.splitlines()[0].startswith('stage')
+    assert 'load' in table
+    assert '10x3' in table
@@ -0,0 +1,62 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.sampling import LineSampler, reservoir_sample
+
+@pytest.fixture
+def csv_file(tmp_path):
+    file_path = tmp_path / 'rows.csv'
+    pd.DataFrame({'id': np.arange(1000), 'value': np.arange(1000) * 2.0}).to_csv(file_path, index=False)
+    return str(file_path)
+
+def test_line_sampler_reads_whole_rows(csv_file):
+    sample = LineSampler(csv_file, ['id', 'value'], seed=0).sample(100)
+    
+    assert 0 < len(sample) <= 100
+    assert (sample['value'] == sample['id'] * 2.0).all()
+    assert sample['id'].is_unique
+
+def test_line_sampler_grows_without_replacement(csv_file):
+    sampler = LineSampler(csv_file, ['id', 'value'], seed=0)
+    first = sampler.sample(200)
+    second = sampler.sample(200)
+    
+    assert not set(first['id']) & set(second['id'])
+
+def test_line_sampler_can_draw_first_row(tmp_path):
+    file_path = tmp_path / 'one.csv'
+    file_path.write_text('a,b\n1,2\n')
+    
+    sample = LineSampler(str(file_path), ['a', 'b'], seed=0).sample(5)
+    
+    assert sample.to_dict('list') == {'a': [1], 'b': [2]}
+
+def test_line_sampler_empty_file_body(tmp_path):
+    file_path = tmp_path / 'header.csv'
+    file_path.write_text('a,b\n')
+    
+    sample = LineSampler(str(file_path), ['a', 'b'], seed=0).sample(5)
+    
+    assert sample.empty
+    assert list(sample.columns) == ['a', 'b']
+
+def test_reservoir_sample_is_uniform_subset(csv_file):
+    chunks = pd.read_csv(csv_file, chunksize=64)
+    
+    sample = reservoir_sample(chunks, 300, seed=0)
+    
+    assert len(sample) == 300
+    assert sample['id'].is_unique
+    assert (sample['value'] == sample['id'] * 2.0).all()
+    # Roughly uniform: a third of the rows come from each third of the file
+    counts = np.bincount(sample['id'] // 334, minlength=3)
+    assert (counts > 60).all()
+
+def test_reservoir_sample_smaller_file(csv_file):
+    sample = reservoir_sample(pd.read_csv(csv_file, chunksize=100), 5000, seed=0)
+    
+    assert sorted(sample['id']) == list(range(1000))
+
+def test_reservoir_sample_invalid_size(csv_file):
+    with pytest.raises(ValueError, match="n_rows must be a positive integer"):
+        reservoir_sample(pd.read_csv(csv_file, chunksize=100), 0)
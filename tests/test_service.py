@@ -0,0 +1,112 @@
+import asyncio
+import json
+import pytest
+import numpy as np
+import pandas as pd
+from src.main import analyze_features
+from src.service import AnalysisService, MatrixCache
+
+@pytest.fixture
+def service():
+    service = AnalysisService(max_workers=2)
+    yield service
+    service.close()
+
+def _write_file(data_dir):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(200, 4)), columns=['x', 'y', 'z', 'target'])
+    df['target'] += df['x'] + 0.5 * df['y']
+    df.to_csv(data_dir / 'a.csv', index=False)
+
+def test_matrix_cache_evicts_least_recently_used():
+    matrix = pd.DataFrame([[1.0, 0.5], [0.5, 1.0]])
+    cache = MatrixCache(max_bytes=2 * matrix.values.nbytes)
+    cache.put('a', matrix)
+    cache.put('b', matrix)
+    cache.get('a')
+    cache.put('c', matrix)
+    
+    assert list(cache.entries) == ['a', 'c']
+    assert cache.total_bytes == 2 * matrix.values.nbytes
+
+def test_concurrent_targets_share_one_computation(data_dir, service):
+    _write_file(data_dir)
+    
+    async def run():
+        requests = [{'filename': 'a.csv', 'target_column': target} for target in ['target', 'x', 'y']]
+        first = await asyncio.gather(*(service.analyze(request) for request in requests))
+        again = await service.analyze({'filename': 'a.csv', 'target_column': 'z', 'top_k': 2})
+        return first, again
+    
+    first, again = asyncio.run(run())
+    
+    assert service.matrix_computations == 1
+    for record in first:
+        assert record['success'] is True
+        assert record['result'] == analyze_features('a.csv', record['target_column']).result
+    assert again['result'] == analyze_features('a.csv', 'z', top_k=2).result
+
+def test_changed_file_is_recomputed(data_dir, service):
+    _write_file(data_dir)
+    asyncio.run(service.analyze({'filename': 'a.csv', 'target_column': 'target'}))
+    (data_dir / 'a.csv').write_text('x,y,target\n1,5,2\n2,3,4\n3,4,6\n4,1,8\n')
+    
+    record = asyncio.run(service.analyze({'filename': 'a.csv', 'target_column': 'target'}))
+    
+    assert service.matrix_computations == 2
+    assert record['result'] == analyze_features('a.csv', 'target').result
+
+def test_errors_become_records(data_dir, service):
+    _write_file(data_dir)
+    
+    async def run():
+        return await asyncio.gather(
+            service.analyze({'filename': 'missing.csv', 'target_column': 'target'}),
+            service.analyze({'filename': 'a.csv', 'target_column': 'nope'}),
+            service.analyze({'filename': 'a.csv'}),
+            service.analyze({'filename': 'a.csv', 'target_column': 'target', 'colour': 'red'}),
+            service.analyze({'filename': 'a.csv', 'target_column': 'target', 'method': 'magic'}),
+            service.analyze({'filename': 'a.csv', 'target_column': 'target', 'method': 'spearman', 'chunksize': 50})
+        )
+    
+    missing, nope, incomplete, unknown, method, streamed_rank = asyncio.run(run())
+    
+    assert missing['error_message'] == "File 'missing.csv' not found in data directory"
+    assert nope['error_message'] == "Column 'nope' not found in 'a.csv'"
+    assert incomplete['error_message'].startswith("Request must be a JSON object")
+    assert unknown['error_message'] == "Unknown request fields: colour"
+    assert method['error_message'].startswith("Error analyzing 'a.csv': Unknown correlation method")
+    assert streamed_rank['success'] is False
+    assert "Method 'spearman' needs the whole file in memory" in streamed_rank['error_message']
+    assert service.matrix_computations == 0
+
+def test_mutual_info_runs_in_pool(data_dir, service):
+    _write_file(data_dir)
+    
+    record = asyncio.run(service.analyze({'filename': 'a.csv', 'target_column': 'target', 'method': 'mutual_info'}))
+    
+    assert record['success'] is True
+    assert record['result'] == analyze_features('a.csv', 'target', method='mutual_info').result
+
+def test_unix_socket_round_trip(data_dir, tmp_path, service):
+    _write_file(data_dir)
+    socket_path = str(tmp_path / 'service.sock')
+    
+    async def run():
+        server = await asyncio.start_unix_server(service.handle_connection, path=socket_path)
+        async with server:
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            for i, target in enumerate(['target', 'x']):
+                writer.write(json.dumps({'id': i, 'filename': 'a.csv', 'target_column': target}).encode() + b'\n')
+            writer.write(b'not json\n')
+            await writer.drain()
+            records = [json.loads(await reader.readline()) for _ in range(3)]
+            writer.close()
+            return records
+    
+    records = asyncio.run(run())
+    
+    answered = {record['id']: record for record in records if 'id' in record}
+    assert answered[0]['result'] == analyze_features('a.csv', 'target').result
+    assert answered[1]['result'] == analyze_features('a.csv', 'x').result
+    assert sum(record['success'] is False for record in records) == 1